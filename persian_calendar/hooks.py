@@ -84,6 +84,12 @@ extend_bootinfo = [
 jinja = {
 	"methods": [
 		"persian_calendar.utils.jalali",
+		"persian_calendar.jalali_support.print_context.jalali_context",
+	],
+	"filters": [
+		"persian_calendar.utils.jalali_filters.shamsi",
+		"persian_calendar.utils.jalali_filters.shamsi_datetime",
+		"persian_calendar.utils.jalali_filters.persian_digits",
 	],
 }
 
@@ -149,15 +155,37 @@ doc_events = {
 	"*": {
 		"before_validate": "persian_calendar.jalali_support.datetime_normalizer.normalize_doc_datetimes",
 		"validate": "persian_calendar.jalali_support.datetime_normalizer.normalize_doc_datetimes",
-	}
+	},
+	"Fiscal Year": {
+		"on_update": "persian_calendar.jalali_support.formatters.clear_jalali_period_list_cache",
+		"on_trash": "persian_calendar.jalali_support.formatters.clear_jalali_period_list_cache",
+	},
+	"Holiday List": {
+		"on_update": "persian_calendar.jalali_support.utils.business_days.clear_business_day_cache",
+		"on_trash": "persian_calendar.jalali_support.utils.business_days.clear_business_day_cache",
+	},
 }
 
+# Jalali Data Import bulk insert
+# ------------------------------
+# Flat, hook-free doctypes that may use the "Bulk Insert" Data Import mode
+# (multi-row INSERT, no Document.insert lifecycle). Add entries from your own app.
+
+# jalali_bulk_import_doctypes = ["Employee Checkin"]
+
 # Scheduled Tasks
 # ---------------
 
 scheduler_events = {
-   "daily": ["persian_calendar.jalali_support.scheduler.month_end_runner"]
+   "all": ["persian_calendar.jalali_support.scheduler.run_jalali_schedule"],
+   "daily": ["persian_calendar.jalali_support.streaming_export.delete_expired_export_files"],
 }
+
+# Jalali period-end schedules ("month_end", "quarter_end", "year_end", optional "@HH:MM" in the
+# site timezone). Handlers are called with period_end=<Gregorian date>; missed periods are caught up.
+# jalali_scheduler_events = {
+# 	"month_end@23:00": ["persian_calendar.tasks.close_jalali_month"],
+# }
  
 # scheduler_events = {
 # 	"all": [
@@ -263,16 +291,31 @@ before_request = [
     "persian_calendar.jalali_support.fiscal_year_override.setup_fiscal_year_override",
     "persian_calendar.jalali_support.template_hooks.apply_template_patches",
     "persian_calendar.jalali_support.data_import_export.apply_data_import_export_patches",
+    "persian_calendar.jalali_support.filters.apply_filter_patches",
+    "persian_calendar.jalali_support.template_cache.warm_template_cache",
+]
+after_request = ["persian_calendar.jalali_support.template_cache.flush_template_plans"]
+
+# Job Events
+# ----------
+before_job = [
+	"persian_calendar.jalali_support.data_import_export.apply_data_import_export_patches",
+	"persian_calendar.jalali_support.filters.apply_filter_patches",
+	"persian_calendar.jalali_support.template_cache.warm_template_cache",
 ]
+after_job = ["persian_calendar.jalali_support.template_cache.flush_template_plans"]
 
 # Install/Uninstall Events
 # ------------------------
 after_install = [
 	"persian_calendar.jalali_support.doctype.custom_field.calendar_preference.create_calendar_preference_field",
 	"persian_calendar.jalali_support.doctype.custom_field.data_import_export_fields.create_data_import_export_fields",
+	"persian_calendar.jalali_support.calendar_table.sync_jalali_calendar_table",
 ]
 after_migrate = [
 	"persian_calendar.jalali_support.doctype.custom_field.data_import_export_fields.create_data_import_export_fields",
+	"persian_calendar.jalali_support.calendar_table.sync_jalali_calendar_table",
+	"persian_calendar.jalali_support.template_cache.clear_template_cache",
 ]
 after_uninstall = [
 	"persian_calendar.jalali_support.doctype.custom_field.calendar_preference.remove_calendar_preference_field",
@@ -38,29 +38,50 @@ def get_effective_calendar(user: str = None) -> dict:
     3. user_calendar_preference = "Jalali" → همیشه شمسی
     4. user_calendar_preference = "Gregorian" → همیشه میلادی
     """
-    from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-    return JalaliSettings.get_effective_calendar(user)
+    from persian_calendar.jalali_support.context import get_jalali_context
+    return dict(get_jalali_context(user).effective)
+
+@frappe.whitelist(allow_guest=False)
+def get_effective_calendars(users) -> dict:
+    """
+    تقویم مؤثر برای چند کاربر با یک کوئری (ایمیل‌های گروهی، اعلان‌های سیستم، گزارش‌های زمان‌بندی‌شده).
+    users: لیست یا JSON لیست شناسه‌های کاربر
+    """
+    from persian_calendar.jalali_support.context import get_effective_calendars as _get_effective_calendars
+    if isinstance(users, str):
+        users = frappe.parse_json(users)
+    if not frappe.has_permission("User", "read") and set(users or ()) - {frappe.session.user}:
+        frappe.throw(frappe._("Not permitted"), frappe.PermissionError)
+    return _get_effective_calendars(users or [])
 
 @frappe.whitelist(allow_guest=False)
 def is_jalali_enabled() -> bool:
-    from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-    settings = JalaliSettings.get_settings()
-    return settings.enabled
+    from persian_calendar.jalali_support.context import get_settings_snapshot
+    return get_settings_snapshot().enabled
 
 @frappe.whitelist(allow_guest=False)
 def get_week_bounds() -> dict:
-    from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-    settings = JalaliSettings.get_settings()
+    from persian_calendar.jalali_support.context import get_settings_snapshot
+    settings = get_settings_snapshot()
     return {"week_start": settings.week_start, "week_end": settings.week_end}
 
+@frappe.whitelist(allow_guest=False)
+def get_jalali_date_range(period: str) -> dict:
+    """
+    بازه میلادی یک دوره شمسی (مثلاً «1403»، «مهر 1403»، «1403-Q3»، «this jalali month») برای فیلتر گزارش.
+    """
+    from persian_calendar.jalali_support.filters import get_jalali_range
+    from_date, to_date = get_jalali_range(period)
+    return {"from_date": from_date, "to_date": to_date}
+
 @frappe.whitelist(allow_guest=False)
 def get_all_settings() -> dict:
     """
     دریافت تمام تنظیمات تقویم جلالی
     """
-    from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-    settings = JalaliSettings.get_settings()
-    effective = JalaliSettings.get_effective_calendar()
+    from persian_calendar.jalali_support.context import get_jalali_context
+    jalali_context = get_jalali_context()
+    settings = jalali_context.settings
     
     return {
         "raw_settings": {
@@ -69,5 +90,5 @@ def get_all_settings() -> dict:
             "week_start": settings.week_start,
             "week_end": settings.week_end
         },
-        "effective_settings": effective
+        "effective_settings": dict(jalali_context.effective)
     }
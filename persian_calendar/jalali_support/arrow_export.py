@@ -0,0 +1,143 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Columnar Parquet / Arrow IPC export with derived Jalali columns (requires pyarrow).
+
+Gregorian Date / Datetime fields are written as native ``date32`` / ``timestamp[us]``
+columns. Each one is followed by ``<field>_jy`` (int16), ``<field>_jm`` (int8),
+``<field>_jd`` (int8) and ``<field>_jalali_period`` (int32, ``jy * 100 + jm``), computed
+per record batch by ``utils.jalali_arrow``; no cell is formatted as text.
+"""
+
+from __future__ import annotations
+
+import frappe
+from frappe import _
+from frappe.model import no_value_fields, table_fields
+
+from persian_calendar.jalali_support.streaming_export import (
+	PAGE_SIZE,
+	discard_sink,
+	iter_keyset_pages,
+	new_export_path,
+	save_export_file,
+)
+from persian_calendar.utils.jalali_arrow import JALALI_PART_COLUMNS, jalali_part_arrays, require_pyarrow
+
+try:
+	import pyarrow as pa
+except ImportError:  # pragma: no cover
+	pa = None  # type: ignore
+
+ARROW_FILE_TYPES = ("Parquet", "Arrow")
+_EXTENSIONS = {"Parquet": "parquet", "Arrow": "arrow"}
+_INT_TYPES = ("Int", "Check")
+_FLOAT_TYPES = ("Float", "Currency", "Percent")
+
+
+def _arrow_type(fieldtype: str):
+	if fieldtype == "Date":
+		return pa.date32()
+	if fieldtype == "Datetime":
+		return pa.timestamp("us")
+	if fieldtype in _INT_TYPES:
+		return pa.int64()
+	if fieldtype in _FLOAT_TYPES:
+		return pa.float64()
+	return pa.string()
+
+
+def get_export_columns(doctype: str, fieldnames: list[str] | None = None) -> list[tuple[str, str]]:
+	"""``(fieldname, fieldtype)`` for the exported parent columns, ``name`` first."""
+	meta = frappe.get_meta(doctype)
+	fields = [
+		df for df in meta.fields if df.fieldtype not in no_value_fields and df.fieldtype not in table_fields
+	]
+	if fieldnames:
+		wanted = set(fieldnames)
+		fields = [df for df in fields if df.fieldname in wanted]
+	return [("name", "Data")] + [(df.fieldname, df.fieldtype) for df in fields if df.fieldname != "name"]
+
+
+def build_arrow_schema(columns: list[tuple[str, str]]):
+	"""Arrow schema for *columns* plus the derived Jalali columns after each date column."""
+	fields = []
+	for fieldname, fieldtype in columns:
+		fields.append(pa.field(fieldname, _arrow_type(fieldtype)))
+		if fieldtype in ("Date", "Datetime"):
+			fields.extend(
+				pa.field(f"{fieldname}_{suffix}", getattr(pa, type_name)())
+				for suffix, type_name in JALALI_PART_COLUMNS
+			)
+	return pa.schema(fields)
+
+
+def _column_values(page: list, fieldname: str, fieldtype: str) -> list:
+	values = [row.get(fieldname) for row in page]
+	if fieldtype in _INT_TYPES or fieldtype in _FLOAT_TYPES or fieldtype in ("Date", "Datetime"):
+		return [None if value == "" else value for value in values]
+	return [None if value is None else str(value) for value in values]
+
+
+def page_to_record_batch(page: list, columns: list[tuple[str, str]], schema):
+	"""One record batch for a page of ``frappe.get_list`` rows."""
+	arrays = []
+	for fieldname, fieldtype in columns:
+		array = pa.array(_column_values(page, fieldname, fieldtype), type=_arrow_type(fieldtype))
+		arrays.append(array)
+		if fieldtype in ("Date", "Datetime"):
+			parts = jalali_part_arrays(array)
+			arrays.extend(parts[suffix] for suffix, _ in JALALI_PART_COLUMNS)
+	return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _ArrowSink:
+	def __init__(self, file_type: str, doctype: str, schema):
+		extension = _EXTENSIONS[file_type]
+		self.file_name, self.path = new_export_path(doctype, extension)
+		self.download_name = f"{doctype}.{extension}"
+		if file_type == "Parquet":
+			import pyarrow.parquet as pq
+
+			self._writer = pq.ParquetWriter(self.path, schema)
+		else:
+			self._writer = pa.ipc.new_file(self.path, schema)
+
+	def write_batch(self, batch) -> None:
+		self._writer.write_batch(batch)
+
+	def close(self) -> None:
+		self._writer.close()
+
+
+def export_arrow(
+	doctype: str,
+	fieldnames: list[str] | None = None,
+	filters=None,
+	file_type: str = "Parquet",
+	on_page=None,
+):
+	"""Write permitted *doctype* records as Parquet / Arrow IPC; returns the File doc (or None)."""
+	require_pyarrow()
+	if file_type not in ARROW_FILE_TYPES:
+		frappe.throw(_("Unsupported columnar export type: {0}").format(file_type))
+	frappe.permissions.can_export(doctype, raise_exception=True)
+
+	columns = get_export_columns(doctype, fieldnames)
+	schema = build_arrow_schema(columns)
+	sink = _ArrowSink(file_type, doctype, schema)
+	written = 0
+	try:
+		for page in iter_keyset_pages(doctype, [fieldname for fieldname, _ in columns], filters, PAGE_SIZE):
+			sink.write_batch(page_to_record_batch(page, columns, schema))
+			written += len(page)
+			if on_page:
+				on_page(written)
+		sink.close()
+	except Exception:
+		discard_sink(sink)
+		raise
+
+	if not written:
+		discard_sink(sink)
+		return None
+	return save_export_file(sink)
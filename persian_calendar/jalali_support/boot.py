@@ -8,25 +8,17 @@ import frappe
 
 def extend_bootinfo(bootinfo):
 	try:
-		from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
-			JalaliSettings,
-		)
+		from persian_calendar.jalali_support.context import get_jalali_context
 
-		settings = JalaliSettings.get_settings()
-		effective = JalaliSettings.get_effective_calendar()
-		user_pref = "System Default"
-		if frappe.session.user and frappe.session.user != "Guest":
-			user_pref = (
-				frappe.db.get_value("User", frappe.session.user, "calendar_preference")
-				or "System Default"
-			)
+		jalali_context = get_jalali_context()
+		settings = jalali_context.settings
 		bootinfo["persian_calendar"] = {
 			"enabled": bool(settings.enabled),
-			"calendar_preference": user_pref,
+			"calendar_preference": jalali_context.calendar_preference,
 			"default_calendar": settings.default_calendar,
-			"display_calendar": effective.get("display_calendar", "Gregorian"),
-			"week_start": effective.get("week_start", 6),
-			"week_end": effective.get("week_end", 5),
+			"display_calendar": jalali_context.display_calendar,
+			"week_start": jalali_context.week_start,
+			"week_end": jalali_context.week_end,
 		}
 	except Exception:
 		bootinfo["persian_calendar"] = {
@@ -0,0 +1,281 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Opt-in bulk insert path for Jalali Data Import of flat, hook-free doctypes.
+
+A doctype is eligible only when an app lists it in the ``jalali_bulk_import_doctypes``
+hook *and* it has no child tables, is not submittable and has no doctype-specific
+``doc_events``. Rows are parsed by the regular importer (Jalali columns included),
+normalized with the datetime normalizer plan, validated (mandatory / select / length)
+and written with ``frappe.db.bulk_insert`` one committed chunk at a time. The
+``Document.insert`` lifecycle — controller hooks, ``doc_events``, version / activity
+logs — is skipped. Every payload gets a ``Data Import Log`` row (written in bulk with
+its chunk) so the import status and log view work as for the regular importer; rejected
+rows are also written to a CSV error file attached to the Data Import. A retry skips the
+rows an earlier run already inserted.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import frappe
+from frappe import _
+from frappe.model.naming import set_new_name
+from frappe.utils import cint, create_batch, now, strip_html
+
+from persian_calendar.jalali_support.datetime_normalizer import (
+	get_flat_normalizer_plan,
+	normalize_flat_row,
+)
+from persian_calendar.jalali_support.streaming_export import new_export_path, save_export_file
+
+BULK_CHUNK_SIZE = 1000
+_SAVEPOINT = "jalali_bulk_import"
+_LOG_FIELDS = (
+	"name",
+	"owner",
+	"creation",
+	"modified",
+	"modified_by",
+	"docstatus",
+	"data_import",
+	"log_index",
+	"success",
+	"docname",
+	"row_indexes",
+	"messages",
+	"exception",
+)
+
+
+def get_bulk_import_doctypes() -> set[str]:
+	return set(frappe.get_hooks("jalali_bulk_import_doctypes") or [])
+
+
+def get_bulk_import_blocker(doctype: str) -> str | None:
+	"""Why *doctype* cannot use the bulk path, or ``None`` when it can."""
+	if doctype not in get_bulk_import_doctypes():
+		return _("{0} is not registered in the jalali_bulk_import_doctypes hook").format(doctype)
+	meta = frappe.get_meta(doctype)
+	if meta.get_table_fields():
+		return _("{0} has child tables").format(doctype)
+	if meta.is_submittable:
+		return _("{0} is submittable").format(doctype)
+	if doctype in (frappe.get_hooks("doc_events") or {}):
+		return _("{0} has doc_events hooks").format(doctype)
+	return None
+
+
+def wants_bulk_import(data_import) -> bool:
+	return bool(
+		data_import
+		and cint(data_import.get("jalali_bulk_insert"))
+		and data_import.import_type == "Insert New Records"
+	)
+
+
+def validate_bulk_import(data_import) -> None:
+	"""Data Import start: refuse bulk mode for doctypes that are not flagged safe."""
+	if not wants_bulk_import(data_import):
+		return
+	blocker = get_bulk_import_blocker(data_import.reference_doctype)
+	if blocker:
+		frappe.throw(
+			_("Bulk insert is not allowed: {0}. Uncheck Bulk Insert to use the regular import.").format(
+				blocker
+			),
+			title=_("Bulk Insert Not Allowed"),
+		)
+	# bulk_insert skips Document.insert and with it the create permission check
+	frappe.has_permission(data_import.reference_doctype, "create", throw=True)
+
+
+def _insert_fields(doctype: str) -> list[str]:
+	standard = ["name", "owner", "creation", "modified", "modified_by", "docstatus", "idx"]
+	return standard + [
+		column for column in frappe.get_meta(doctype).get_valid_columns() if column not in standard
+	]
+
+
+def _prepare_row(doctype: str, values: dict, plan, timestamp: str, user: str) -> tuple:
+	doc = frappe.new_doc(doctype)
+	doc.update({key: value for key, value in values.items() if key != "doctype"})
+	normalize_flat_row(doc, plan)
+	doc.owner = doc.modified_by = user
+	doc.creation = doc.modified = timestamp
+	doc.docstatus = 0
+
+	missing = doc._get_missing_mandatory_fields()
+	if missing:
+		frappe.throw("; ".join(message for _fieldname, message in missing), frappe.MandatoryError)
+	doc._validate_selects()
+	doc._validate_length()
+	set_new_name(doc)
+	return doc
+
+
+def _insert_chunk(doctype: str, fields: list[str], docs: list, row_indexes: list, rejects: list) -> list[int]:
+	"""Insert *docs* in one statement; on failure isolate the bad rows with savepoints.
+
+	Returns the positions in *docs* that were inserted; failed rows are added to *rejects*.
+	"""
+	if not docs:
+		return []
+	rows = [tuple(doc.get(fieldname) for fieldname in fields) for doc in docs]
+	# Savepoints (not a full rollback) keep naming-series increments made while preparing rows.
+	frappe.db.savepoint(_SAVEPOINT)
+	try:
+		frappe.db.bulk_insert(doctype, fields, rows)
+		return list(range(len(rows)))
+	except Exception:
+		frappe.db.rollback(save_point=_SAVEPOINT)
+
+	inserted = []
+	for position, (row, indexes) in enumerate(zip(rows, row_indexes, strict=True)):
+		frappe.db.savepoint(_SAVEPOINT)
+		try:
+			frappe.db.bulk_insert(doctype, fields, [row])
+			inserted.append(position)
+		except Exception as e:
+			frappe.db.rollback(save_point=_SAVEPOINT)
+			rejects.append((indexes, str(e)))
+	return inserted
+
+
+def _insert_import_logs(data_import: str, first_index: int, entries: list, timestamp: str, user: str) -> None:
+	"""``Data Import Log`` rows for *entries* ``(row_indexes, docname, error)``, one statement."""
+	rows = []
+	for log_index, (row_indexes, docname, error) in enumerate(entries, start=first_index):
+		messages = [{"title": _("Error"), "message": error}] if error else []
+		rows.append(
+			(
+				frappe.generate_hash(length=10),
+				user,
+				timestamp,
+				timestamp,
+				user,
+				0,
+				data_import,
+				log_index,
+				0 if error else 1,
+				docname,
+				json.dumps(row_indexes),
+				json.dumps(messages),
+				error,
+			)
+		)
+	if rows:
+		frappe.db.bulk_insert("Data Import Log", _LOG_FIELDS, rows)
+
+
+def _get_previous_import(data_import: str) -> tuple[set[int], int]:
+	"""Rows already inserted by an earlier run of *data_import*, and the next free ``log_index``.
+
+	Failed log rows of that run are deleted so a retry logs them again, as the regular
+	importer does.
+	"""
+	logs = frappe.get_all(
+		"Data Import Log",
+		filters={"data_import": data_import},
+		fields=["log_index", "success", "row_indexes"],
+	)
+	imported_rows = set()
+	for log in logs:
+		if log.success:
+			imported_rows.update(json.loads(log.row_indexes or "[]"))
+	if any(not log.success for log in logs):
+		frappe.db.delete("Data Import Log", {"data_import": data_import, "success": 0})
+	return imported_rows, max((cint(log.log_index) for log in logs), default=-1) + 1
+
+
+def run_bulk_import(importer) -> None:
+	"""Replacement for ``Importer.import_data`` in bulk mode."""
+	data_import = importer.data_import
+	doctype = importer.doctype
+	importer.before_import()
+
+	payloads = importer.import_file.get_payloads_for_import()
+	warnings = [w for w in importer.import_file.get_warnings() if w.get("type") != "info"]
+	if warnings:
+		data_import.db_set("template_warnings", json.dumps(warnings))
+		return
+
+	frappe.has_permission(doctype, "create", throw=True)
+	imported_rows, first_log_index = _get_previous_import(data_import.name)
+	if imported_rows:
+		# retry: skip the payloads an earlier run already inserted
+		payloads = [
+			payload
+			for payload in payloads
+			if not imported_rows.intersection(row.row_number for row in payload.rows)
+		]
+
+	plan = get_flat_normalizer_plan(doctype)
+	fields = _insert_fields(doctype)
+	user = frappe.session.user
+	timestamp = now()
+	total = len(payloads)
+	inserted = 0
+	rejects: list[tuple[list[int], str]] = []
+	raw_rows = {}
+
+	for chunk in create_batch(payloads, BULK_CHUNK_SIZE):
+		docs, row_indexes, chunk_rejects = [], [], []
+		for payload in chunk:
+			indexes = [row.row_number for row in payload.rows]
+			for row in payload.rows:
+				raw_rows[row.row_number] = row.data
+			try:
+				docs.append(_prepare_row(doctype, payload.doc, plan, timestamp, user))
+				row_indexes.append(indexes)
+			except Exception as e:
+				chunk_rejects.append((indexes, strip_html(str(e))))
+			finally:
+				frappe.clear_messages()
+		positions = _insert_chunk(doctype, fields, docs, row_indexes, chunk_rejects)
+		entries = [(row_indexes[i], docs[i].name, None) for i in positions]
+		entries.extend((indexes, None, error) for indexes, error in chunk_rejects)
+		_insert_import_logs(
+			data_import.name, first_log_index + inserted + len(rejects), entries, timestamp, user
+		)
+		inserted += len(positions)
+		rejects.extend(chunk_rejects)
+		frappe.db.commit()
+		frappe.publish_realtime(
+			"data_import_progress",
+			{
+				"current": min(inserted + len(rejects), total),
+				"total": total,
+				"data_import": data_import.name,
+				"success": inserted,
+			},
+			doctype="Data Import",
+			docname=data_import.name,
+		)
+
+	if rejects:
+		_attach_error_file(importer, rejects, raw_rows)
+	status = "Success" if not rejects else ("Partial Success" if inserted or imported_rows else "Error")
+	data_import.db_set("status", status)
+	frappe.db.commit()
+	frappe.publish_realtime("data_import_refresh", {"data_import": data_import.name}, user=user)
+
+
+def _attach_error_file(importer, rejects: list, raw_rows: dict) -> None:
+	"""Private CSV of rejected rows (spreadsheet row number, error, original cells)."""
+	data_import = importer.data_import
+	header = [col.header_title for col in importer.import_file.columns]
+	file_name, path = new_export_path(f"{data_import.name}-errors", "csv")
+	with open(path, "w", newline="", encoding="utf-8") as f:
+		writer = csv.writer(f)
+		writer.writerow([_("Row Number"), _("Error"), *header])
+		for indexes, message in rejects:
+			for row_number in indexes:
+				writer.writerow([row_number, message, *(raw_rows.get(row_number) or [])])
+
+	save_export_file(
+		frappe._dict(file_name=file_name, download_name=f"{data_import.name}-errors.csv"),
+		attached_to_doctype="Data Import",
+		attached_to_name=data_import.name,
+	)
@@ -0,0 +1,158 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Populate the ``Jalali Calendar`` dimension table (one row per Gregorian day).
+
+Reports can ``JOIN `tabJalali Calendar` jc ON jc.gregorian_date = gle.posting_date`` and
+``GROUP BY jc.jalali_year_month`` so Jalali period aggregation stays inside MariaDB.
+
+``is_holiday`` marks weekly offs; for years marked from a Holiday List (see
+``holiday_list.mark_calendar_holidays``) the list's dates are used instead, and are
+re-read from the list on every rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+
+import frappe
+from frappe.utils import cint, getdate, now
+
+from persian_calendar.utils.jalali_calendar import iter_calendar_days
+
+DOCTYPE = "Jalali Calendar"
+_SIGNATURE_KEY = "persian_calendar_jalali_calendar_signature"
+_HOLIDAY_LISTS_KEY = "persian_calendar_jalali_calendar_holiday_lists"
+_CHUNK_SIZE = 5000
+
+_ROW_FIELDS = (
+	"gregorian_date",
+	"jalali_date",
+	"jalali_year",
+	"jalali_month",
+	"jalali_day",
+	"jalali_year_month",
+	"day_of_year",
+	"weekday",
+	"iso_year",
+	"iso_week",
+	"jalali_week",
+	"quarter",
+	"fiscal_year",
+	"fiscal_period",
+	"is_holiday",
+)
+
+
+def get_calendar_table_options() -> frappe._dict:
+	"""Span / week / fiscal options from Jalali Settings (with defaults before first save)."""
+	values = frappe.db.get_singles_dict("Jalali Settings") or {}
+	from_year = cint(values.get("calendar_table_from_year")) or 1350
+	to_year = cint(values.get("calendar_table_to_year")) or 1450
+	week_start = values.get("week_start")
+	week_end = values.get("week_end")
+	return frappe._dict(
+		from_year=min(from_year, to_year),
+		to_year=max(from_year, to_year),
+		week_start=cint(week_start) if week_start not in (None, "") else 6,
+		week_end=cint(week_end) if week_end not in (None, "") else 5,
+		fiscal_year_start_month=min(max(cint(values.get("fiscal_year_start_month")) or 1, 1), 12),
+	)
+
+
+def _signature(options: frappe._dict) -> str:
+	return frappe.as_json(dict(options), indent=None)
+
+
+def get_marked_holiday_lists() -> dict[int, str]:
+	"""``{jalali_year: holiday_list}`` whose holidays are marked in the table."""
+	return {
+		int(jy): name for jy, name in json.loads(frappe.db.get_global(_HOLIDAY_LISTS_KEY) or "{}").items()
+	}
+
+
+def set_marked_holiday_list(jalali_year: int, holiday_list: str | None) -> None:
+	marked = get_marked_holiday_lists()
+	if holiday_list:
+		marked[cint(jalali_year)] = holiday_list
+	else:
+		marked.pop(cint(jalali_year), None)
+	frappe.db.set_global(_HOLIDAY_LISTS_KEY, json.dumps(marked, sort_keys=True))
+
+
+def _marked_holiday_dates(from_year: int, to_year: int) -> dict[int, set]:
+	"""Holiday dates per marked Jalali year in the span; lists deleted since are forgotten."""
+	marked = {jy: name for jy, name in get_marked_holiday_lists().items() if from_year <= jy <= to_year}
+	if not marked or not frappe.db.table_exists("Holiday"):
+		return {}
+	dates = {}
+	for jy, name in marked.items():
+		if not frappe.db.exists("Holiday List", name):
+			set_marked_holiday_list(jy, None)
+			continue
+		dates[jy] = {
+			getdate(day)
+			for day in frappe.get_all(
+				"Holiday", filters={"parent": name, "parenttype": "Holiday List"}, pluck="holiday_date"
+			)
+		}
+	return dates
+
+
+def sync_jalali_calendar_table(force: bool = False) -> None:
+	"""Rebuild the table when the configured span or week/fiscal options changed (install / migrate)."""
+	if not frappe.db.table_exists(DOCTYPE):
+		return
+
+	options = get_calendar_table_options()
+	signature = _signature(options)
+	if not force and frappe.db.get_global(_SIGNATURE_KEY) == signature and frappe.db.count(DOCTYPE):
+		return
+
+	holidays = _marked_holiday_dates(options.from_year, options.to_year)
+	frappe.db.delete(DOCTYPE)
+	timestamp = now()
+	fields = ["name", "creation", "modified", "owner", "modified_by", *_ROW_FIELDS]
+	chunk = []
+	for row in iter_calendar_days(
+		options.from_year,
+		options.to_year,
+		week_start=options.week_start,
+		week_end=options.week_end,
+		fiscal_year_start_month=options.fiscal_year_start_month,
+	):
+		if row["jalali_year"] in holidays:
+			row["is_holiday"] = int(row["gregorian_date"] in holidays[row["jalali_year"]])
+		gdate = row["gregorian_date"].isoformat()
+		chunk.append(
+			(
+				gdate,
+				timestamp,
+				timestamp,
+				"Administrator",
+				"Administrator",
+				gdate,
+				*(row[f] for f in _ROW_FIELDS[1:]),
+			)
+		)
+		if len(chunk) >= _CHUNK_SIZE:
+			frappe.db.bulk_insert(DOCTYPE, fields, chunk)
+			chunk = []
+	if chunk:
+		frappe.db.bulk_insert(DOCTYPE, fields, chunk)
+
+	frappe.db.set_global(_SIGNATURE_KEY, signature)
+	frappe.db.commit()
+	frappe.logger("persian_calendar").info(
+		f"Jalali Calendar table populated for {options.from_year}-{options.to_year}"
+	)
+
+
+def enqueue_calendar_table_sync() -> None:
+	"""Jalali Settings on_update: rebuild in the background if the options changed."""
+	frappe.enqueue(
+		"persian_calendar.jalali_support.calendar_table.sync_jalali_calendar_table",
+		queue="long",
+		job_id="persian_calendar:jalali_calendar_table",
+		deduplicate=True,
+		enqueue_after_commit=True,
+	)
@@ -0,0 +1,148 @@
+# Copyright (c) 2025, Persian Calendar Contributors
+"""Request-scoped Jalali settings / calendar preference snapshot.
+
+Every server-side Jalali code path (normalizer, formatters, fiscal year override, API,
+bootinfo) reads from one context stored on ``frappe.local`` so Jalali Settings and the
+user's ``calendar_preference`` are resolved at most once per request or background job.
+"""
+
+from __future__ import annotations
+
+import frappe
+
+_LOCAL_KEY = "jalali_context"
+
+_FALLBACK_SETTINGS = {
+	"enabled": False,
+	"default_calendar": "Jalali",
+	"week_start": 6,
+	"week_end": 5,
+}
+
+
+def _session_user() -> str | None:
+	session = getattr(frappe.local, "session", None)
+	return getattr(session, "user", None) if session else None
+
+
+def _state() -> frappe._dict:
+	state = getattr(frappe.local, _LOCAL_KEY, None)
+	if state is None:
+		state = frappe._dict(settings=None, preferences={}, users={})
+		setattr(frappe.local, _LOCAL_KEY, state)
+	return state
+
+
+def get_settings_snapshot() -> frappe._dict:
+	"""Jalali Settings for this request (disabled defaults if the doctype is unavailable)."""
+	state = _state()
+	if state.settings is None:
+		try:
+			from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
+				JalaliSettings,
+			)
+
+			state.settings = JalaliSettings.get_settings()
+		except Exception:
+			state.settings = frappe._dict(_FALLBACK_SETTINGS)
+	return state.settings
+
+
+def get_user_preference(user: str | None) -> str:
+	"""``User.calendar_preference`` for *user*, memoized for the rest of the request."""
+	if not user or user == "Guest":
+		return "System Default"
+	preferences = _state().preferences
+	if user not in preferences:
+		try:
+			preferences[user] = frappe.db.get_value("User", user, "calendar_preference") or "System Default"
+		except Exception:
+			preferences[user] = "System Default"
+	return preferences[user]
+
+
+def get_user_preferences(users) -> dict[str, str]:
+	"""``calendar_preference`` for many users: cached entries plus one ``IN`` query for the rest."""
+	preferences = _state().preferences
+	wanted = {u for u in users or () if u and u != "Guest"}
+	missing = [u for u in wanted if u not in preferences]
+	if missing:
+		try:
+			rows = frappe.get_all(
+				"User",
+				filters={"name": ("in", missing)},
+				fields=["name", "calendar_preference"],
+			)
+		except Exception:
+			rows = []
+		for row in rows:
+			preferences[row.name] = row.calendar_preference or "System Default"
+		for u in missing:
+			preferences.setdefault(u, "System Default")
+	return {u: preferences.get(u, "System Default") for u in users or ()}
+
+
+def get_effective_calendars(users) -> dict[str, dict]:
+	"""Map each user to ``{display_calendar, week_start, week_end}`` with at most one query."""
+	from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
+		JalaliSettings,
+	)
+
+	settings = get_settings_snapshot()
+	return {
+		user: JalaliSettings.resolve_effective_calendar(settings, preference)
+		for user, preference in get_user_preferences(users).items()
+	}
+
+
+def get_jalali_context(user: str | None = None) -> frappe._dict:
+	"""Settings snapshot, user preference, effective calendar and week bounds for *user*.
+
+	*user* defaults to the session user. The result is shared by all callers in the same
+	request/job; treat it as read-only.
+	"""
+	target_user = user or _session_user()
+	users = _state().users
+	ctx = users.get(target_user)
+	if ctx is not None:
+		return ctx
+
+	from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
+		JalaliSettings,
+	)
+
+	settings = get_settings_snapshot()
+	preference = get_user_preference(target_user)
+	effective = JalaliSettings.resolve_effective_calendar(settings, preference)
+	ctx = frappe._dict(
+		user=target_user,
+		settings=settings,
+		enabled=bool(settings.enabled),
+		calendar_preference=preference,
+		effective=effective,
+		display_calendar=effective["display_calendar"],
+		week_start=effective["week_start"],
+		week_end=effective["week_end"],
+	)
+	users[target_user] = ctx
+	return ctx
+
+
+def is_jalali_enabled() -> bool:
+	return bool(get_settings_snapshot().enabled)
+
+
+def get_effective_display_calendar(user: str | None = None) -> str:
+	return get_jalali_context(user).display_calendar
+
+
+def clear_jalali_context(user: str | None = None) -> None:
+	"""Drop the cached context (whole request, or one user's preference only)."""
+	state = getattr(frappe.local, _LOCAL_KEY, None)
+	if state is None:
+		return
+	if user:
+		state.preferences.pop(user, None)
+		state.users.pop(user, None)
+		return
+	setattr(frappe.local, _LOCAL_KEY, None)
@@ -3,10 +3,40 @@
 
 from __future__ import annotations
 
+import json
+from functools import partial
+
 import frappe
+from frappe import _
 from frappe.utils import cint
 
-from persian_calendar.utils.data_io import convert_export_value, convert_import_value
+from persian_calendar.jalali_support.arrow_export import ARROW_FILE_TYPES, export_arrow
+from persian_calendar.jalali_support.bulk_import import (
+	get_bulk_import_blocker,
+	run_bulk_import,
+	validate_bulk_import,
+	wants_bulk_import,
+)
+from persian_calendar.jalali_support.import_preflight import validate_before_start
+from persian_calendar.jalali_support.parallel import get_column_mapper
+from persian_calendar.jalali_support.streaming_export import (
+	can_stream_data_export,
+	count_export_rows,
+	enqueue_jalali_export,
+	respond_with_file,
+	should_export_in_background,
+	should_stream_export,
+	stream_data_export,
+	stream_data_import_export,
+)
+from persian_calendar.utils.data_io import (
+	convert_export_columns,
+	convert_export_value,
+	convert_import_value,
+)
+from persian_calendar.utils.import_formats import FORMAT_LABELS, ColumnDateParser
+
+_DATE_TYPES = ("Date", "Datetime")
 
 _patches_applied = False
 
@@ -20,6 +50,7 @@ def apply_data_import_export_patches() -> None:
 	_patch_data_export_exporter()
 	_patch_data_import_exporter()
 	_patch_data_import_importer()
+	_patch_data_import_start()
 	_patch_download_template()
 
 
@@ -42,33 +73,21 @@ def _patch_data_export_exporter() -> None:
 			return _orig_add_data_row(self, rows, dt, parentfield, doc, rowidx)
 
 		# Jalali export: same as core exporter but Date/Datetime → Jalali (no formatdate).
-		from frappe.core.utils import html2text
-		from frappe.utils import format_duration
-
-		d = doc.copy() if hasattr(doc, "copy") else dict(doc)
-		meta = frappe.get_meta(dt)
-		if self.all_doctypes:
-			d.name = f'"{d.name}"'
-
 		if len(rows) < rowidx + 1:
 			rows.append([""] * (len(self.columns) + 1))
 		row = rows[rowidx]
 
-		_column_start_end = self.column_start_end.get((dt, parentfield))
-		if _column_start_end:
-			for i, c in enumerate(self.columns[_column_start_end.start : _column_start_end.end]):
-				df = meta.get_field(c)
-				fieldtype = df.fieldtype if df else "Data"
-				raw = d.get(c, "")
-				value = raw
-				if value not in (None, ""):
-					if fieldtype in ("Date", "Datetime"):
-						value = convert_export_value(raw, fieldtype, True)
-					elif fieldtype == "Duration" and df:
-						value = format_duration(value, df.hide_days)
-					elif fieldtype == "Text Editor" and value:
-						value = html2text(value)
-				row[_column_start_end.start + i + 1] = value
+		plan = _get_data_export_column_plan(self, dt, parentfield)
+		if not plan:
+			return
+
+		get = doc.get
+		defer_dates = getattr(self, "_jalali_defer_dates", False)
+		for index, fieldname, convert, is_date in plan:
+			value = get(fieldname, "")
+			if convert is not None and value not in (None, "") and not (defer_dates and is_date):
+				value = convert(value)
+			row[index] = value
 
 	@frappe.whitelist()
 	def export_data(
@@ -109,7 +128,7 @@ def _patch_data_export_exporter() -> None:
 			raw_jalali = export_dates_as_jalali
 		jalali_flag = cint(raw_jalali)
 
-		exporter = mod.DataExporter(
+		exporter_kwargs = dict(
 			doctype=doctype,
 			parent_doctype=parent_doctype,
 			all_doctypes=all_doctypes,
@@ -121,6 +140,20 @@ def _patch_data_export_exporter() -> None:
 			export_without_column_meta=export_without_column_meta_bool,
 			export_dates_as_jalali=jalali_flag,
 		)
+		exporter = mod.DataExporter(**exporter_kwargs)
+		if file_type in ARROW_FILE_TYPES:
+			_export_columnar(exporter, file_type)
+			return
+		if jalali_flag and can_stream_data_export(exporter):
+			total = count_export_rows(exporter.doctype, exporter.filters)
+			if should_export_in_background(total):
+				enqueue_jalali_export("data_export", exporter_kwargs, total)
+				return
+			if should_stream_export(exporter.doctype, exporter.filters):
+				file_doc = stream_data_export(exporter)
+				if file_doc:
+					respond_with_file(file_doc)
+				return
 		exporter.build_response()
 
 	mod.DataExporter.__init__ = __init__
@@ -129,6 +162,83 @@ def _patch_data_export_exporter() -> None:
 	mod.export_data._jalali_patched = True
 
 
+def _export_columnar(exporter, file_type: str) -> None:
+	"""Parquet / Arrow export of the parent doctype (dates stay native, Jalali parts as ints)."""
+	select_columns = exporter.select_columns or {}
+	export_kwargs = dict(
+		doctype=exporter.doctype,
+		fieldnames=select_columns.get(exporter.doctype),
+		filters=exporter.filters,
+		file_type=file_type,
+	)
+	total = count_export_rows(exporter.doctype, exporter.filters)
+	if should_export_in_background(total):
+		enqueue_jalali_export("arrow_export", export_kwargs, total)
+		return
+	file_doc = export_arrow(**export_kwargs)
+	if file_doc:
+		respond_with_file(file_doc)
+	else:
+		frappe.respond_as_web_page(
+			_("No Data"), _("There is no data to be exported"), indicator_color="orange"
+		)
+
+
+def _build_data_export_column_plan(exporter, dt: str, parentfield: str | None):
+	"""``(row_index, fieldname, converter, is_date)`` per exported column of ``(dt, parentfield)``.
+
+	Resolved once per exporter so row emission needs no meta / get_field lookups.
+	"""
+	from frappe.core.utils import html2text
+	from frappe.utils import format_duration
+
+	column_start_end = exporter.column_start_end.get((dt, parentfield))
+	if not column_start_end:
+		return None
+
+	meta = frappe.get_meta(dt)
+	plan = []
+	for i, fieldname in enumerate(exporter.columns[column_start_end.start : column_start_end.end]):
+		df = meta.get_field(fieldname)
+		fieldtype = df.fieldtype if df else "Data"
+		convert = None
+		if fieldtype in ("Date", "Datetime"):
+			convert = partial(convert_export_value, fieldtype=fieldtype, enabled=True)
+		elif fieldtype == "Duration" and df:
+			convert = partial(format_duration, hide_days=df.hide_days)
+		elif fieldtype == "Text Editor":
+			convert = html2text
+		if fieldname == "name" and exporter.all_doctypes:
+			convert = _quote_name
+		plan.append((column_start_end.start + i + 1, fieldname, convert, fieldtype in _DATE_TYPES))
+	return tuple(plan)
+
+
+def _get_data_export_column_plan(exporter, dt: str, parentfield: str | None):
+	plans = exporter.__dict__.setdefault("_jalali_column_plans", {})
+	key = (dt, parentfield)
+	if key not in plans:
+		plans[key] = _build_data_export_column_plan(exporter, dt, parentfield)
+	return plans[key]
+
+
+def get_data_export_date_columns(exporter) -> list[tuple[int, str]]:
+	"""``(row_index, fieldtype)`` of every Date/Datetime column across main and child tables."""
+	columns = []
+	for dt, parentfield in exporter.column_start_end:
+		meta = frappe.get_meta(dt)
+		for index, fieldname, _convert, is_date in (
+			_get_data_export_column_plan(exporter, dt, parentfield) or ()
+		):
+			if is_date:
+				columns.append((index, meta.get_field(fieldname).fieldtype))
+	return columns
+
+
+def _quote_name(value) -> str:
+	return f'"{value}"'
+
+
 def _patch_data_import_exporter() -> None:
 	from frappe.core.doctype.data_import import exporter as mod
 
@@ -137,29 +247,73 @@ def _patch_data_import_exporter() -> None:
 
 	_orig_init = mod.Exporter.__init__
 	_orig_add_data_row = mod.Exporter.add_data_row
+	_orig_build_response = mod.Exporter.build_response
+	_orig_add_data = mod.Exporter.add_data
 
 	def __init__(self, *args, export_dates_as_jalali=False, **kwargs):
-		_orig_init(self, *args, **kwargs)
+		# Set before core __init__: it already builds the data rows via add_data_row.
 		self.export_dates_as_jalali = cint(export_dates_as_jalali)
+		self._jalali_stream = bool(
+			self.export_dates_as_jalali
+			and len(args) == 1
+			and kwargs.get("export_data")
+			and not kwargs.get("export_page_length")
+			and should_stream_export(args[0], kwargs.get("export_filters"))
+		)
+		if self._jalali_stream:
+			# Header only; rows are paged in build_response.
+			kwargs["export_data"] = False
+		_orig_init(self, *args, **kwargs)
+
+	def build_response(self):
+		if not getattr(self, "_jalali_stream", False):
+			return _orig_build_response(self)
+		respond_with_file(stream_data_import_export(self))
+
+	def add_data(self):
+		if not getattr(self, "export_dates_as_jalali", 0):
+			return _orig_add_data(self)
+		# Assemble raw rows, then convert each Date/Datetime column in one batch.
+		start = len(self.csv_array)
+		self._jalali_defer_dates = True
+		try:
+			_orig_add_data(self)
+		finally:
+			self._jalali_defer_dates = False
+		convert_export_columns(
+			self.csv_array[start:], get_data_import_date_columns(self), mapper=get_column_mapper()
+		)
 
 	def add_data_row(self, doctype, parentfield, doc, rows, row_idx):
 		rows = _orig_add_data_row(self, doctype, parentfield, doc, rows, row_idx)
-		if not getattr(self, "export_dates_as_jalali", 0):
+		if not getattr(self, "export_dates_as_jalali", 0) or getattr(self, "_jalali_defer_dates", False):
 			return rows
 		row = rows[row_idx]
 		for i, df in enumerate(self.fields):
 			if df.parent == doctype:
 				if df.is_child_table_field and df.child_table_df.fieldname != parentfield:
 					continue
-				if df.fieldtype in ("Date", "Datetime"):
+				if df.fieldtype in _DATE_TYPES:
 					row[i] = convert_export_value(row[i], df.fieldtype, True)
 		return rows
 
 	mod.Exporter.__init__ = __init__
+	mod.Exporter.build_response = build_response
+	mod.Exporter.add_data = add_data
 	mod.Exporter.add_data_row = add_data_row
 	mod.Exporter._jalali_patched = True
 
 
+def get_data_import_date_columns(exporter) -> list[tuple[int, str]]:
+	"""``(index, fieldtype)`` of the Date/Datetime columns in ``Exporter.fields`` (cached)."""
+	columns = exporter.__dict__.get("_jalali_date_columns")
+	if columns is None:
+		columns = exporter._jalali_date_columns = [
+			(i, df.fieldtype) for i, df in enumerate(exporter.fields) if df.fieldtype in _DATE_TYPES
+		]
+	return columns
+
+
 def _patch_download_template() -> None:
 	from frappe.core.doctype.data_import import data_import as mod
 
@@ -181,13 +335,30 @@ def _patch_download_template() -> None:
 		export_filters = frappe.parse_json(export_filters)
 		export_data_flag = export_records != "blank_template"
 
+		export_page_length = 5 if export_records == "5_records" else None
+		if cint(export_dates_as_jalali) and export_data_flag and not export_page_length:
+			total = count_export_rows(doctype, export_filters)
+			if should_export_in_background(total):
+				enqueue_jalali_export(
+					"data_import",
+					dict(
+						doctype=doctype,
+						export_fields=export_fields,
+						export_filters=export_filters,
+						file_type=file_type,
+						export_dates_as_jalali=1,
+					),
+					total,
+				)
+				return
+
 		e = mod.Exporter(
 			doctype,
 			export_fields=export_fields,
 			export_data=export_data_flag,
 			export_filters=export_filters,
 			file_type=file_type,
-			export_page_length=5 if export_records == "5_records" else None,
+			export_page_length=export_page_length,
 			export_dates_as_jalali=export_dates_as_jalali,
 		)
 		e.build_response()
@@ -196,6 +367,23 @@ def _patch_download_template() -> None:
 	mod.download_template._jalali_patched = True
 
 
+def _patch_data_import_start() -> None:
+	from frappe.core.doctype.data_import.data_import import DataImport
+
+	if getattr(DataImport.start_import, "_jalali_patched", False):
+		return
+
+	_orig_start_import = DataImport.start_import
+
+	def start_import(self):
+		validate_bulk_import(self)
+		validate_before_start(self)
+		return _orig_start_import(self)
+
+	start_import._jalali_patched = True
+	DataImport.start_import = start_import
+
+
 def _patch_data_import_importer() -> None:
 	from frappe.core.doctype.data_import import importer as mod
 
@@ -210,18 +398,32 @@ def _patch_data_import_importer() -> None:
 		frappe.flags.import_dates_from_jalali = cint(
 			self.data_import.get("import_dates_from_jalali") if self.data_import else 0
 		)
+		if frappe.flags.import_dates_from_jalali:
+			mapper = get_column_mapper()
+			for col in getattr(self.import_file, "columns", None) or []:
+				if col.df and col.df.fieldtype in _DATE_TYPES:
+					parser = get_column_date_parser(col)
+					if mapper is not None:
+						parser.prime(col.column_values or [], mapper)
 		return _orig_before(self)
 
 	def import_data(self):
 		try:
+			if wants_bulk_import(self.data_import) and not get_bulk_import_blocker(self.doctype):
+				return run_bulk_import(self)
 			return _orig_import_data(self)
 		finally:
 			frappe.flags.import_dates_from_jalali = 0
+			save_date_format_warnings(self)
 
 	def parse_value(self, value, col):
-		if frappe.flags.get("import_dates_from_jalali") and col.df.fieldtype in ("Date", "Datetime"):
-			converted = convert_import_value(value, col.df.fieldtype, True)
-			if converted is not value and converted is not None:
+		if frappe.flags.get("import_dates_from_jalali") and col.df.fieldtype in _DATE_TYPES:
+			parser = get_column_date_parser(col)
+			converted = parser.parse(value)
+			if parser.is_mixed:
+				# cells past the detection sample can reveal another format
+				_warn_mixed_formats(col, parser)
+			if converted is not None:
 				return converted
 		return _orig_parse(self, value, col)
 
@@ -229,3 +431,57 @@ def _patch_data_import_importer() -> None:
 	mod.Importer.import_data = import_data
 	mod.Row.parse_value = parse_value
 	mod.Row._jalali_patched = True
+
+
+def get_column_date_parser(col) -> ColumnDateParser:
+	"""Memoizing parser for an import ``Column``, built once from a sample of its values.
+
+	Mixed-format columns (in the sample or found while parsing) are reported in
+	``col.warnings`` (shown in the import log); cells the column's format does not match
+	are detected separately.
+	"""
+	parser = col.__dict__.get("_jalali_date_parser")
+	if parser is not None:
+		return parser
+
+	fieldtype = col.df.fieldtype
+	parser = col._jalali_date_parser = ColumnDateParser.from_values(
+		col.column_values or [],
+		fieldtype,
+		fallback=lambda value: convert_import_value(value, fieldtype, True),
+	)
+	if parser.is_mixed:
+		_warn_mixed_formats(col, parser)
+	return parser
+
+
+def _warn_mixed_formats(col, parser: ColumnDateParser) -> None:
+	"""Add (or refresh) the mixed-format info warning of *col*."""
+	formats = sorted(FORMAT_LABELS.get(f, f) for f in parser.formats_seen)
+	warning = col.__dict__.get("_jalali_mixed_warning")
+	if warning is None:
+		warning = col._jalali_mixed_warning = {"col": col.column_number, "type": "info"}
+		col.warnings.append(warning)
+	warning["message"] = _("Column {0} mixes date formats ({1}); each cell is detected separately.").format(
+		frappe.bold(col.header_title), ", ".join(formats)
+	)
+
+
+def save_date_format_warnings(importer) -> None:
+	"""Store the mixed date-format warnings of an import in ``Data Import.template_warnings``.
+
+	Both importers drop ``info`` column warnings, and cells past the detection sample only
+	reveal a second format while rows are parsed, so the form would never show them.
+	"""
+	data_import = importer.data_import
+	columns = getattr(importer.import_file, "columns", None) or []
+	found = [col._jalali_mixed_warning for col in columns if col.__dict__.get("_jalali_mixed_warning")]
+	if not data_import or not found:
+		return
+	columns_found = {warning["col"] for warning in found}
+	warnings = [
+		warning
+		for warning in json.loads(data_import.get("template_warnings") or "[]")
+		if not (warning.get("type") == "info" and warning.get("col") in columns_found)
+	]
+	data_import.db_set("template_warnings", json.dumps(warnings + found), update_modified=False)
@@ -9,21 +9,15 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import flt
 
-from persian_calendar.utils.jalali import coerce_gregorian_datetime
+from persian_calendar.jalali_support.context import is_jalali_enabled
+from persian_calendar.utils.jalali import coerce_gregorian_datetime, normalize_input_text
 
 _BAD_DATETIME_RE = re.compile(r"invalid\s*date|nan", re.I)
 _NUMERIC_GARBAGE_RE = re.compile(r"[^0-9.\-+eE,]")
 
 
 def _is_jalali_enabled() -> bool:
-	try:
-		from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
-			JalaliSettings,
-		)
-
-		return bool(JalaliSettings.get_settings().enabled)
-	except Exception:
-		return False
+	return is_jalali_enabled()
 
 
 def _set_doc_value(doc: Document | frappe._dict, fieldname: str, value) -> None:
@@ -53,7 +47,7 @@ def _sanitize_time_field(doc: Document | frappe._dict, fieldname: str) -> None:
 	if isinstance(value, time):
 		_set_doc_value(doc, fieldname, f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}")
 		return
-	text = str(value).strip()
+	text = normalize_input_text(value)
 	if _is_bad_datetime_value(text):
 		if doc.get("name"):
 			restored = frappe.db.get_value(doc.doctype, doc.name, fieldname)
@@ -117,13 +111,18 @@ def _sanitize_numeric_field(
 	text = str(value).strip()
 	if not text:
 		return
+	parsed = parse_numeric_text(text, fieldtype)
+	_set_doc_value(doc, fieldname, 0 if parsed is None else parsed)
+
+
+def parse_numeric_text(text: str, fieldtype: str) -> float | int | None:
+	"""Parse a CSV numeric cell; ``None`` when nothing numeric is left (saved as 0)."""
+	text = normalize_input_text(text)
 	if _BAD_DATETIME_RE.search(text):
-		_set_doc_value(doc, fieldname, 0)
-		return
+		return None
 	cleaned = _NUMERIC_GARBAGE_RE.sub("", text)
 	if not cleaned:
-		_set_doc_value(doc, fieldname, 0)
-		return
+		return None
 	# Thousand separators from CSV (e.g. 5,625.000000C -> 5625.0)
 	if "," in cleaned and "." in cleaned:
 		cleaned = cleaned.replace(",", "")
@@ -136,7 +135,21 @@ def _sanitize_numeric_field(
 	parsed = flt(cleaned)
 	if fieldtype == "Int":
 		parsed = int(parsed)
-	_set_doc_value(doc, fieldname, parsed)
+	return parsed
+
+
+def parse_time_text(text: str) -> str | None:
+	"""``HH:MM:SS`` for a Time cell, or ``None`` when it cannot be parsed."""
+	text = normalize_input_text(text)
+	if _is_bad_datetime_value(text):
+		return None
+	from frappe.utils import get_time
+
+	try:
+		parsed = get_time(text)
+	except Exception:
+		return None
+	return f"{parsed.hour:02d}:{parsed.minute:02d}:{parsed.second:02d}"
 
 
 def normalize_doc_datetimes(doc: Document | frappe._dict, method: str | None = None) -> None:
@@ -175,3 +188,23 @@ def normalize_doc_datetimes(doc: Document | frappe._dict, method: str | None = N
 			"",
 		):
 			_sanitize_numeric_field(doc, df.fieldname, df.fieldtype)
+
+
+def get_flat_normalizer_plan(doctype: str) -> tuple[tuple[str, str], ...]:
+	"""``(fieldname, fieldtype)`` of the parent-level fields ``normalize_doc_datetimes`` touches."""
+	return tuple(
+		(df.fieldname, df.fieldtype)
+		for df in frappe.get_meta(doctype).fields
+		if df.fieldtype in ("Datetime", "Date", "Time", "Float", "Int", "Currency")
+	)
+
+
+def normalize_flat_row(row: Document | frappe._dict, plan: tuple[tuple[str, str], ...]) -> None:
+	"""Apply a ``get_flat_normalizer_plan`` to one row (bulk import; no child tables)."""
+	for fieldname, fieldtype in plan:
+		if fieldtype in ("Datetime", "Date"):
+			_coerce_field(row, fieldname, fieldtype)
+		elif fieldtype == "Time":
+			_sanitize_time_field(row, fieldname)
+		else:
+			_sanitize_numeric_field(row, fieldname, fieldtype)
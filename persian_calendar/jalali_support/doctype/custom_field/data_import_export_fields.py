@@ -45,6 +45,12 @@ def create_data_import_export_fields() -> None:
 		"Import dates from Jalali",
 		"import_type",
 	)
+	_ensure_custom_field(
+		"Data Import",
+		"jalali_bulk_insert",
+		"Bulk Insert (skips document hooks)",
+		"import_dates_from_jalali",
+	)
 	frappe.db.commit()
 	frappe.clear_cache(doctype="Data Export")
 	frappe.clear_cache(doctype="Data Import")
@@ -61,6 +67,7 @@ def remove_data_import_export_fields() -> None:
 	for dt, fieldname in (
 		("Data Export", "export_dates_as_jalali"),
 		("Data Import", "import_dates_from_jalali"),
+		("Data Import", "jalali_bulk_insert"),
 	):
 		name = frappe.db.get_value("Custom Field", {"dt": dt, "fieldname": fieldname})
 		if name:
@@ -20,6 +20,17 @@ class JalaliSettings(Document):
         if self.default_calendar and self.default_calendar not in ("Jalali", "Gregorian"):
             frappe.throw("مقدار Default Calendar باید «Jalali» یا «Gregorian» باشد.")
 
+    def on_update(self):
+        """
+        Drop the request-scoped Jalali context so later code in this request sees new values,
+        and rebuild the Jalali Calendar table if its span / week options changed.
+        """
+        from persian_calendar.jalali_support.calendar_table import enqueue_calendar_table_sync
+        from persian_calendar.jalali_support.context import clear_jalali_context
+
+        clear_jalali_context()
+        enqueue_calendar_table_sync()
+
     def after_save(self):
         """
         Silently reload page after saving settings (no message displayed).
@@ -86,6 +97,13 @@ class JalaliSettings(Document):
                 frappe.log_error(f"Error getting user calendar preference for {target_user}: {e}", "JalaliSettings")
                 user_calendar_preference = "System Default"
         
+        return JalaliSettings.resolve_effective_calendar(settings, user_calendar_preference)
+
+    @staticmethod
+    def resolve_effective_calendar(settings, user_calendar_preference):
+        """
+        تقویم مؤثر از روی تنظیمات و ترجیح کاربر (بدون دسترسی به دیتابیس).
+        """
         # مرحله 3: تعیین تقویم نمایش بر اساس user_calendar_preference
         if user_calendar_preference == "Jalali":
             display_calendar = "Jalali"
@@ -0,0 +1,119 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Translate Jalali period filters to Gregorian ``between`` ranges for list views / reports.
+
+Supported filter shapes (any frappe.get_list / reportview call)::
+
+        [["posting_date", "jalali", "Mehr 1403"]]
+        [["Sales Invoice", "posting_date", "jalali", "1403-Q3"]]
+        {"posting_date": ["jalali", "this jalali month"]}
+        [["posting_date", "timespan", "last jalali quarter"]]
+
+The translated filter is a plain ``between`` on the original column, so MariaDB keeps
+using the date index instead of evaluating a computed expression per row.
+"""
+
+from __future__ import annotations
+
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import getdate
+
+from persian_calendar.utils.jalali_calendar import jalali_period_range
+
+JALALI_OPERATOR = "jalali"
+
+_patches_applied = False
+
+
+def get_jalali_range(spec: str) -> tuple[str, str]:
+	"""Gregorian ISO ``(from_date, to_date)`` for *spec*, honouring Jalali Settings week_start."""
+	from persian_calendar.jalali_support.context import get_settings_snapshot
+
+	try:
+		start, end = jalali_period_range(spec, today=getdate(), week_start=get_settings_snapshot().week_start)
+	except ValueError:
+		frappe.throw(_("Invalid Jalali period: {0}").format(spec), title=_("Invalid Filter"))
+	return start.isoformat(), end.isoformat()
+
+
+def _is_jalali_condition(operator, value) -> bool:
+	if not isinstance(operator, str):
+		return False
+	op = operator.strip().lower()
+	if op == JALALI_OPERATOR:
+		return True
+	return op == "timespan" and isinstance(value, str) and "jalali" in value.lower()
+
+
+def _translate_condition(condition):
+	if isinstance(condition, list | tuple) and len(condition) in (3, 4, 5):
+		offset = 1 if len(condition) >= 4 else 0
+		operator, value = condition[1 + offset], condition[2 + offset]
+		if _is_jalali_condition(operator, value):
+			out = list(condition)
+			out[1 + offset] = "between"
+			out[2 + offset] = list(get_jalali_range(value))
+			return out
+	return condition
+
+
+def translate_jalali_filters(filters):
+	"""Return *filters* with every Jalali condition rewritten as a Gregorian ``between``."""
+	if not filters:
+		return filters
+	if isinstance(filters, str):
+		try:
+			parsed = json.loads(filters)
+		except ValueError:
+			return filters
+		if not isinstance(parsed, list | dict):
+			return filters
+		translated = translate_jalali_filters(parsed)
+		return filters if translated == parsed else translated
+	if isinstance(filters, dict):
+		out = {}
+		for fieldname, value in filters.items():
+			if isinstance(value, list | tuple) and len(value) == 2 and _is_jalali_condition(*value):
+				value = ["between", list(get_jalali_range(value[1]))]
+			out[fieldname] = value
+		return out
+	if isinstance(filters, list | tuple):
+		if filters and isinstance(filters[0], str):
+			# single condition, e.g. ["posting_date", "jalali", "1403"]
+			return _translate_condition(filters)
+		return [_translate_condition(condition) for condition in filters]
+	return filters
+
+
+def apply_filter_patches() -> None:
+	global _patches_applied
+	if _patches_applied:
+		return
+	_patches_applied = True
+
+	_patch_database_query()
+
+
+def _patch_database_query() -> None:
+	from frappe.model.db_query import DatabaseQuery
+
+	if getattr(DatabaseQuery.execute, "_jalali_patched", False):
+		return
+
+	_original = DatabaseQuery.execute
+
+	def execute(self, *args, **kwargs):
+		args = list(args)
+		# positional order: fields, filters, or_filters
+		for index, key in ((1, "filters"), (2, "or_filters")):
+			if len(args) > index:
+				args[index] = translate_jalali_filters(args[index])
+			elif kwargs.get(key):
+				kwargs[key] = translate_jalali_filters(kwargs[key])
+		return _original(self, *args, **kwargs)
+
+	execute._jalali_patched = True
+	DatabaseQuery.execute = execute
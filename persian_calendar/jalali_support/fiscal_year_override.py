@@ -23,16 +23,15 @@ def setup_fiscal_year_override():
         
         # First check if Jalali calendar is enabled
         try:
-            from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-            settings = JalaliSettings.get_settings()
+            from persian_calendar.jalali_support.context import get_jalali_context
+            jalali_context = get_jalali_context()
             
-            if not settings.enabled:
+            if not jalali_context.enabled:
                 # Use original validation if Jalali is disabled
                 return original_validate_dates(self)
             
             # Get effective calendar settings
-            effective = JalaliSettings.get_effective_calendar()
-            display_calendar = effective.get("display_calendar", "Jalali")
+            display_calendar = jalali_context.display_calendar
             
             if display_calendar == "Gregorian":
                 # Use original validation if display is Gregorian
@@ -6,9 +6,7 @@
 # handled in the desk JS layer (jalali_support/formatters.js, persian_calendar.js).
 
 import datetime
-import calendar
 import importlib
-import re
 
 import frappe
 from frappe.utils.data import getdate
@@ -23,19 +21,16 @@ JALALI_MONTH_NAMES_SHORT = {
 
 
 def is_jalali_enabled():
-	try:
-		from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-		settings = JalaliSettings.get_settings()
-		return settings.enabled
-	except Exception:
-		return False
+	from persian_calendar.jalali_support.context import is_jalali_enabled as _context_enabled
+
+	return _context_enabled()
 
 
 def get_effective_display_calendar():
 	try:
-		from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import JalaliSettings
-		effective = JalaliSettings.get_effective_calendar(user=None)
-		return effective.get("display_calendar", "Jalali")
+		from persian_calendar.jalali_support.context import get_effective_display_calendar as _display
+
+		return _display()
 	except Exception:
 		return "Jalali"
 
@@ -62,70 +57,127 @@ def gregorian_to_jalali(gy, gm, gd):
 		return {"jy": jalali_year, "jm": jalali_month, "jd": jalali_day}
 
 
+_PERIOD_LIST_CACHE_KEY = "persian_calendar:jalali_period_list"
+
+
+def _jalali_month_label(ym):
+	jy, jm = ym
+	return f"{JALALI_MONTH_NAMES_SHORT.get(jm, str(jm))} {jy}"
+
+
+def _jalali_period_label(periodicity, from_ym, to_ym):
+	"""Jalali counterpart of ERPNext ``financial_statements.get_label``."""
+	if periodicity == "Yearly":
+		if from_ym[0] == to_ym[0]:
+			return str(from_ym[0])
+		return f"{from_ym[0]}-{to_ym[0]}"
+	return f"{_jalali_month_label(from_ym)}-{_jalali_month_label(to_ym)}"
+
+
+def build_jalali_period_list(fs, args):
+	"""Jalali-native replacement for ERPNext ``get_period_list`` (real Farvardin-Esfand periods).
+
+	*fs* is ``erpnext.accounts.report.financial_statements``; *args* are its bound arguments.
+	"""
+	from persian_calendar.utils.jalali_calendar import (
+		build_jalali_periods,
+		jalali_period_key,
+		to_jalali_ym,
+	)
+
+	periodicity = args["periodicity"]
+	company = args.get("company")
+	accumulated_values = args.get("accumulated_values")
+	reset_period_on_fy_change = args.get("reset_period_on_fy_change", True)
+	ignore_fiscal_year = args.get("ignore_fiscal_year", False)
+
+	if args["filter_based_on"] == "Fiscal Year":
+		fiscal_year = fs.get_fiscal_year_data(args["from_fiscal_year"], args["to_fiscal_year"])
+		fs.validate_fiscal_year(fiscal_year, args["from_fiscal_year"], args["to_fiscal_year"])
+		year_start_date = getdate(fiscal_year.year_start_date)
+		year_end_date = getdate(fiscal_year.year_end_date)
+	else:
+		fs.validate_dates(args["period_start_date"], args["period_end_date"])
+		year_start_date = getdate(args["period_start_date"])
+		year_end_date = getdate(args["period_end_date"])
+
+	period_list = []
+	for p in build_jalali_periods(year_start_date, year_end_date, periodicity):
+		period = frappe._dict(from_date=p["from_date"], to_date=p["to_date"])
+		if not ignore_fiscal_year:
+			period.to_date_fiscal_year = fs.get_fiscal_year(period.to_date, company=company)[0]
+			period.from_date_fiscal_year_start_date = fs.get_fiscal_year(period.from_date, company=company)[1]
+		from_ym, to_ym = p["from_ym"], p["to_ym"]
+		if periodicity == "Monthly" and not accumulated_values:
+			label = _jalali_month_label(to_ym)
+		elif not accumulated_values:
+			label = _jalali_period_label(periodicity, from_ym, to_ym)
+		elif reset_period_on_fy_change and period.get("from_date_fiscal_year_start_date"):
+			label = _jalali_period_label(
+				periodicity, to_jalali_ym(getdate(period.from_date_fiscal_year_start_date)), to_ym
+			)
+		else:
+			first_ym = period_list[0].from_ym if period_list else from_ym
+			label = _jalali_period_label(periodicity, first_ym, to_ym)
+		period.update(
+			{
+				"key": jalali_period_key(to_ym),
+				"label": label,
+				"year_start_date": year_start_date,
+				"year_end_date": year_end_date,
+				"from_ym": from_ym,
+			}
+		)
+		period_list.append(period)
+
+	for period in period_list:
+		period.pop("from_ym", None)
+	return period_list
+
+
+def clear_jalali_period_list_cache(doc=None, method=None):
+	"""Fiscal Year on_update / on_trash: drop cached Jalali period lists."""
+	try:
+		frappe.cache().delete_value(_PERIOD_LIST_CACHE_KEY)
+	except Exception:
+		pass
+
+
 def patch_get_period_list():
-	"""Optional ERPNext: Jalali labels on financial statement period list (UI/report charts)."""
+	"""Optional ERPNext: Jalali month/quarter/year periods for financial statements."""
 	try:
-		from erpnext.accounts.report.financial_statements import get_period_list as original_get_period_list
+		import inspect
+
+		import erpnext.accounts.report.financial_statements as fs
+
+		original_get_period_list = fs.get_period_list
+		signature = inspect.signature(original_get_period_list)
 
 		def get_period_list_jalali(*args, **kwargs):
-			period_list = original_get_period_list(*args, **kwargs)
 			if not is_jalali_enabled():
-				return period_list
+				return original_get_period_list(*args, **kwargs)
 			if get_effective_display_calendar() == "Gregorian":
-				return period_list
-
-			for period in period_list:
-				if not period.get("label"):
-					continue
-				label = period.get("label")
-				try:
-					if period.get("from_date"):
-						from_date = getdate(period.get("from_date"))
-						jalali_date = gregorian_to_jalali(from_date.year, from_date.month, from_date.day)
-						jalali_label = f"{JALALI_MONTH_NAMES_SHORT.get(jalali_date['jm'], str(jalali_date['jm']))} {jalali_date['jy']}"
-						period["label"] = jalali_label
-						continue
-
-					month_names = {
-						"Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
-						"Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
-						"January": 1, "February": 2, "March": 3, "April": 4, "May": 5, "June": 6,
-						"July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12,
-					}
-
-					month = None
-					year = None
-					for month_name, month_num in month_names.items():
-						if month_name in label:
-							month = month_num
-							year_match = re.search(r"\b(\d{4})\b", label)
-							if year_match:
-								year = int(year_match.group(1))
-							break
-
-					if not month and not year:
-						date_match = re.match(r"(\d{4})-(\d{1,2})", label)
-						if date_match:
-							year = int(date_match.group(1))
-							month = int(date_match.group(2))
-
-					if month and year:
-						try:
-							gregorian_date = datetime.date(year, month, 15)
-						except ValueError:
-							last_day = calendar.monthrange(year, month)[1]
-							gregorian_date = datetime.date(year, month, last_day)
-
-						jalali_date = gregorian_to_jalali(gregorian_date.year, gregorian_date.month, gregorian_date.day)
-						jalali_label = f"{JALALI_MONTH_NAMES_SHORT.get(jalali_date['jm'], str(jalali_date['jm']))} {jalali_date['jy']}"
-						period["label"] = jalali_label
-				except Exception:
-					pass
-
-			return period_list
-
-		import erpnext.accounts.report.financial_statements
-		erpnext.accounts.report.financial_statements.get_period_list = get_period_list_jalali
+				return original_get_period_list(*args, **kwargs)
+
+			try:
+				bound = signature.bind(*args, **kwargs)
+				bound.apply_defaults()
+				arguments = dict(bound.arguments)
+				cache_key = frappe.as_json(
+					{k: str(v) if v is not None else None for k, v in sorted(arguments.items())}
+				)
+				cache = frappe.cache()
+				period_list = cache.hget(_PERIOD_LIST_CACHE_KEY, cache_key)
+				if period_list is None:
+					period_list = build_jalali_period_list(fs, arguments)
+					cache.hset(_PERIOD_LIST_CACHE_KEY, cache_key, period_list)
+				return [frappe._dict(period) for period in period_list]
+			except frappe.ValidationError:
+				raise
+			except Exception:
+				return original_get_period_list(*args, **kwargs)
+
+		fs.get_period_list = get_period_list_jalali
 	except ImportError:
 		pass
 	except Exception:
@@ -0,0 +1,119 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Fill an ERPNext ``Holiday List`` with the official holidays of a Jalali year.
+
+Rows come from ``utils.jalali_holidays``: fixed solar holidays, the bundled lunar table
+(with the site's ``jalali_lunar_holiday_overrides`` from site config, e.g.
+``{"1405": {"Ashura": "2026-06-26"}}``) and weekly offs (Jalali Settings ``week_end``
+unless *weekly_offs* is given). The list is
+built in memory and saved once; optionally ``Jalali Calendar.is_holiday`` is updated for
+the same dates (kept across calendar table rebuilds).
+"""
+
+from __future__ import annotations
+
+import frappe
+from frappe import _
+from frappe.utils import cint
+
+from persian_calendar.jalali_support.calendar_table import get_calendar_table_options, set_marked_holiday_list
+from persian_calendar.utils.jalali_calendar import jalali_year_bounds
+from persian_calendar.utils.jalali_holidays import has_lunar_holidays, jalali_year_holidays
+
+HOLIDAY_LIST = "Holiday List"
+
+
+def get_lunar_overrides(jy: int) -> tuple:
+	"""``(description, dates)`` pairs from site config ``jalali_lunar_holiday_overrides`` for *jy*."""
+	overrides = (frappe.conf.get("jalali_lunar_holiday_overrides") or {}).get(str(jy)) or {}
+	return tuple(
+		(description, gdates if isinstance(gdates, str) else tuple(gdates))
+		for description, gdates in sorted(overrides.items())
+	)
+
+
+def _parse_weekly_offs(weekly_offs) -> tuple[int, ...]:
+	if weekly_offs in (None, "", []):
+		return (get_calendar_table_options().week_end,)
+	if isinstance(weekly_offs, str):
+		weekly_offs = (
+			frappe.parse_json(weekly_offs) if weekly_offs.startswith("[") else weekly_offs.split(",")
+		)
+	days = tuple(sorted({cint(day) for day in weekly_offs}))
+	if any(day < 0 or day > 6 for day in days):
+		frappe.throw(_("Weekly off days must be between 0 (Sunday) and 6 (Saturday)"))
+	return days
+
+
+@frappe.whitelist()
+def generate_jalali_holiday_list(
+	jalali_year,
+	holiday_list_name: str | None = None,
+	weekly_offs=None,
+	update_calendar_table=False,
+):
+	"""Create or replace *holiday_list_name* (default ``"Jalali <year>"``) for *jalali_year*."""
+	if not frappe.db.exists("DocType", HOLIDAY_LIST):
+		frappe.throw(_("Holiday List is not available (install ERPNext or HRMS)"))
+
+	jy = cint(jalali_year)
+	if not 1300 <= jy <= 1500:
+		frappe.throw(_("Invalid Jalali year: {0}").format(jalali_year))
+	days = _parse_weekly_offs(weekly_offs)
+	holiday_list_name = holiday_list_name or f"Jalali {jy}"
+	from_date, to_date = jalali_year_bounds(jy)
+
+	if frappe.db.exists(HOLIDAY_LIST, holiday_list_name):
+		doc = frappe.get_doc(HOLIDAY_LIST, holiday_list_name)
+		doc.check_permission("write")
+		doc.set("holidays", [])
+	else:
+		frappe.has_permission(HOLIDAY_LIST, "create", throw=True)
+		doc = frappe.new_doc(HOLIDAY_LIST)
+		doc.holiday_list_name = holiday_list_name
+
+	doc.from_date = from_date
+	doc.to_date = to_date
+	doc.set(
+		"holidays",
+		[
+			{"holiday_date": gdate, "description": _(description), "weekly_off": int(weekly_off)}
+			for gdate, description, weekly_off in jalali_year_holidays(jy, days, get_lunar_overrides(jy))
+		],
+	)
+	doc.save()
+
+	if not has_lunar_holidays(jy) and not get_lunar_overrides(jy):
+		frappe.msgprint(
+			_(
+				"Lunar holidays are not available for {0}; only solar holidays and weekly offs were added."
+			).format(jy),
+			indicator="orange",
+			alert=True,
+		)
+	if cint(update_calendar_table):
+		mark_calendar_holidays(jy, [row.holiday_date for row in doc.holidays], doc.name)
+	return doc.name
+
+
+def mark_calendar_holidays(jalali_year: int, holiday_dates, holiday_list: str | None = None) -> None:
+	"""Set ``Jalali Calendar.is_holiday`` for *jalali_year*: 1 on *holiday_dates*, 0 elsewhere.
+
+	With *holiday_list*, calendar table rebuilds re-read that year's holidays from the list
+	instead of resetting them to weekly offs.
+	"""
+	if not frappe.db.table_exists("Jalali Calendar"):
+		return
+	if holiday_list:
+		set_marked_holiday_list(jalali_year, holiday_list)
+	frappe.db.set_value(
+		"Jalali Calendar", {"jalali_year": cint(jalali_year)}, "is_holiday", 0, update_modified=False
+	)
+	if holiday_dates:
+		frappe.db.set_value(
+			"Jalali Calendar",
+			{"gregorian_date": ("in", list(holiday_dates))},
+			"is_holiday",
+			1,
+			update_modified=False,
+		)
@@ -0,0 +1,248 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Pre-flight validation of Jalali Data Import files.
+
+Streams the uploaded CSV / XLSX once and parses every Date, Datetime, Time and numeric
+cell with the same rules the import uses (column format detection for dates, the
+datetime normalizer for times and numbers). Dates and times that cannot be parsed are
+errors and block the import; non-numeric text in number columns is only a warning, as the
+import stores it as 0. Nothing is inserted; the only database reads are DocType meta and
+the File record of the upload.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from datetime import date, datetime, time
+
+import frappe
+from frappe import _
+from frappe.utils import cint
+
+from persian_calendar.jalali_support.datetime_normalizer import parse_numeric_text, parse_time_text
+from persian_calendar.utils.data_io import convert_import_value
+from persian_calendar.utils.import_formats import FORMAT_LABELS, SAMPLE_SIZE, ColumnDateParser
+
+DATE_TYPES = ("Date", "Datetime")
+# Only the number types the datetime normalizer rewrites; Percent cells are left to Frappe.
+NUMERIC_TYPES = ("Float", "Int", "Currency")
+CHECKED_TYPES = (*DATE_TYPES, "Time", *NUMERIC_TYPES)
+MAX_REPORTED_ERRORS = 500
+
+
+class _ColumnCheck:
+	"""Validator for one file column; results are memoized per distinct cell text."""
+
+	def __init__(self, index: int, header: str, fieldtype: str):
+		self.index = index
+		self.header = header
+		self.fieldtype = fieldtype
+		self.date_parser: ColumnDateParser | None = None
+		self._memo: dict[str, tuple[str, bool] | None] = {}
+
+	def prepare(self, sample: list) -> None:
+		if self.fieldtype in DATE_TYPES:
+			fieldtype = self.fieldtype
+			self.date_parser = ColumnDateParser.from_values(
+				sample, fieldtype, fallback=lambda value: convert_import_value(value, fieldtype, True)
+			)
+
+	def check(self, text: str) -> tuple[str, bool] | None:
+		"""``(message, is_error)`` for *text*, or ``None`` when the cell imports cleanly."""
+		try:
+			return self._memo[text]
+		except KeyError:
+			finding = self._memo[text] = self._check(text)
+			return finding
+
+	def _check(self, text: str) -> tuple[str, bool] | None:
+		if self.date_parser is not None:
+			if self.date_parser.parse(text) is None:
+				return _("Not a valid {0} value").format(_(self.fieldtype)), True
+		elif self.fieldtype == "Time":
+			if parse_time_text(text) is None:
+				return _("Not a valid time"), True
+		elif parse_numeric_text(text, self.fieldtype) is None:
+			# the regular import stores these as 0; report without blocking
+			return _("Not a number (would be imported as 0)"), False
+		return None
+
+
+def _build_header_map(doctype: str) -> dict[str, str]:
+	"""Template header (label or fieldname, child columns as ``Label (Table)``) -> fieldtype."""
+	meta = frappe.get_meta(doctype)
+	header_map: dict[str, str] = {}
+	for df in meta.fields:
+		if df.fieldtype in CHECKED_TYPES:
+			header_map[df.fieldname] = df.fieldtype
+			if df.label:
+				header_map[df.label] = df.fieldtype
+	for table_df in meta.get_table_fields():
+		table_label = table_df.label or table_df.fieldname
+		for df in frappe.get_meta(table_df.options).fields:
+			if df.fieldtype in CHECKED_TYPES:
+				header_map[f"{table_df.fieldname}.{df.fieldname}"] = df.fieldtype
+				if df.label:
+					header_map[f"{df.label} ({table_label})"] = df.fieldtype
+	return header_map
+
+
+def iter_import_file_rows(path: str):
+	"""Yield raw rows (lists of cell values) from a CSV or XLSX file without loading it whole."""
+	extension = os.path.splitext(path)[1].lower()
+	if extension == ".xlsx":
+		from openpyxl import load_workbook
+
+		workbook = load_workbook(path, read_only=True, data_only=True)
+		try:
+			for row in workbook.active.iter_rows(values_only=True):
+				yield list(row)
+		finally:
+			workbook.close()
+	elif extension == ".csv":
+		with open(path, encoding="utf-8-sig", newline="") as f:
+			yield from csv.reader(f)
+	else:
+		frappe.throw(_("Only CSV and XLSX files can be validated"), title=_("Unsupported File"))
+
+
+def _cell_text(value) -> str:
+	if value is None:
+		return ""
+	if isinstance(value, datetime):
+		return value.strftime("%Y-%m-%d %H:%M:%S")
+	if isinstance(value, date | time):
+		return value.isoformat()
+	return str(value).strip()
+
+
+def validate_import_rows(rows, doctype: str) -> dict:
+	"""Validate the rows of an import file for *doctype* (first row is the header)."""
+	rows = iter(rows)
+	header = [_cell_text(cell) for cell in next(rows, [])]
+	header_map = _build_header_map(doctype)
+	checks = [
+		_ColumnCheck(index, title, header_map[title])
+		for index, title in enumerate(header)
+		if title in header_map
+	]
+
+	# Buffer a sample so date columns can detect their format before the full pass.
+	buffered = []
+	for row in rows:
+		buffered.append(row)
+		if len(buffered) >= SAMPLE_SIZE:
+			break
+	for check in checks:
+		check.prepare([_cell_text(row[check.index]) for row in buffered if check.index < len(row)])
+
+	errors, cell_warnings = [], []
+	error_count = warning_count = 0
+	total_rows = 0
+
+	def validate(row_number: int, row: list) -> None:
+		nonlocal error_count, warning_count
+		for check in checks:
+			if check.index >= len(row):
+				continue
+			text = _cell_text(row[check.index])
+			if not text:
+				continue
+			finding = check.check(text)
+			if finding:
+				message, is_error = finding
+				if is_error:
+					error_count += 1
+					reported = errors
+				else:
+					warning_count += 1
+					reported = cell_warnings
+				if len(reported) < MAX_REPORTED_ERRORS:
+					reported.append(
+						{
+							"row": row_number,
+							"column": check.index + 1,
+							"header": check.header,
+							"value": text,
+							"message": message,
+						}
+					)
+
+	# Row numbers match the spreadsheet (header is row 1).
+	for row_number, row in enumerate(buffered, start=2):
+		validate(row_number, row)
+		total_rows += 1
+	for row_number, row in enumerate(rows, start=len(buffered) + 2):
+		validate(row_number, row)
+		total_rows += 1
+
+	warnings = [
+		_("Column {0} mixes date formats ({1})").format(
+			check.header, ", ".join(sorted(FORMAT_LABELS.get(f, f) for f in check.date_parser.formats_seen))
+		)
+		for check in checks
+		if check.date_parser is not None and check.date_parser.is_mixed
+	]
+	return {
+		"total_rows": total_rows,
+		"checked_columns": [check.header for check in checks],
+		"error_count": error_count,
+		"errors": errors,
+		"warning_count": warning_count,
+		"cell_warnings": cell_warnings,
+		"warnings": warnings,
+	}
+
+
+def _get_import_file_path(data_import) -> str | None:
+	if not data_import.import_file:
+		return None
+	file_doc = frappe.get_doc("File", {"file_url": data_import.import_file})
+	return file_doc.get_full_path()
+
+
+@frappe.whitelist()
+def preflight_jalali_import(data_import: str) -> dict:
+	"""Validate the file attached to *data_import* before any row is inserted."""
+	doc = frappe.get_doc("Data Import", data_import)
+	doc.check_permission("write")
+	path = _get_import_file_path(doc)
+	if not path:
+		frappe.throw(_("Attach an import file (CSV or XLSX) first"), title=_("No Import File"))
+	return validate_import_rows(iter_import_file_rows(path), doc.reference_doctype)
+
+
+def validate_before_start(data_import) -> None:
+	"""Data Import start: refuse to queue a Jalali import whose file has invalid cells.
+
+	Only errors block; cell warnings (numbers imported as 0) are shown as a message.
+	"""
+	if not cint(data_import.get("import_dates_from_jalali")):
+		return
+	path = _get_import_file_path(data_import)
+	if not path or os.path.splitext(path)[1].lower() not in (".csv", ".xlsx"):
+		return
+	report = validate_import_rows(iter_import_file_rows(path), data_import.reference_doctype)
+	if not report["error_count"]:
+		if report["warning_count"]:
+			frappe.msgprint(
+				_("{0} cells are not numbers and will be imported as 0.").format(report["warning_count"]),
+				title=_("Jalali Import Validation"),
+				indicator="orange",
+			)
+		return
+
+	rows = "".join(
+		"<tr><td>{row}</td><td>{column}</td><td>{header}</td><td>{value}</td><td>{message}</td></tr>".format(
+			**{key: frappe.utils.escape_html(str(value)) for key, value in error.items()}
+		)
+		for error in report["errors"][:20]
+	)
+	frappe.throw(
+		_("{0} invalid cells found; nothing was imported.").format(report["error_count"])
+		+ "<table class='table table-bordered'><tr><th>{}</th><th>{}</th><th>{}</th><th>{}</th><th>{}</th></tr>{}</table>".format(
+			_("Row"), _("Column"), _("Header"), _("Value"), _("Error"), rows
+		),
+		title=_("Jalali Import Validation Failed"),
+	)
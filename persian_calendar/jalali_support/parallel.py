@@ -0,0 +1,35 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Jalali Settings wiring for process-sharded column conversion (see ``utils.parallel``)."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import frappe
+from frappe.utils import cint
+
+from persian_calendar.utils.parallel import shard_map
+
+DEFAULT_PARALLEL_THRESHOLD = 50000
+
+
+def get_parallel_options() -> tuple[int, int]:
+	"""``(workers, threshold)`` from Jalali Settings; workers 0/1 keeps conversion in-process."""
+	try:
+		values = frappe.db.get_singles_dict("Jalali Settings") or {}
+	except Exception:
+		values = {}
+	threshold = values.get("parallel_threshold")
+	return (
+		max(cint(values.get("parallel_workers")), 0),
+		DEFAULT_PARALLEL_THRESHOLD if threshold in (None, "") else cint(threshold),
+	)
+
+
+def get_column_mapper():
+	"""A ``shard_map`` bound to the configured worker count, or ``None`` when disabled."""
+	workers, threshold = get_parallel_options()
+	if workers < 2 or threshold <= 0:
+		return None
+	return partial(shard_map, workers=workers, threshold=threshold)
@@ -0,0 +1,90 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""``jalali_context(doc)`` Jinja method: all Jalali dates of a document, converted in one batch.
+
+Print formats can read pre-converted values instead of calling ``toshamshi()`` per cell::
+
+	{% set j = jalali_context(doc) %}
+	{{ j.posting_date }}
+	{% for row in doc.items %}{{ j.items[loop.index0].delivery_date }}{% endfor %}
+
+Date / Datetime fields come out as in Data Export (``1405-02-23``, ``1404-12-27 13:36:04``);
+empty fields as ``""``. Distinct values are converted once per document and served from a
+process-wide cache after that, so a bulk print of many invoices sharing posting dates
+converts each date only once.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import frappe
+
+from persian_calendar.utils.data_io import convert_export_value
+
+_DATE_TYPES = ("Date", "Datetime")
+
+
+def _get_date_plan(doctype: str) -> tuple[tuple, tuple]:
+	"""``((fieldname, fieldtype), ...), ((table_fieldname, child_doctype), ...)`` cached on meta."""
+	meta = frappe.get_meta(doctype)
+	plan = getattr(meta, "_jalali_date_plan", None)
+	if plan is None:
+		plan = (
+			tuple((df.fieldname, df.fieldtype) for df in meta.fields if df.fieldtype in _DATE_TYPES),
+			tuple((df.fieldname, df.options) for df in meta.get_table_fields()),
+		)
+		meta._jalali_date_plan = plan
+	return plan
+
+
+@lru_cache(maxsize=4096)
+def _convert_cached(value, fieldtype: str) -> str:
+	out = convert_export_value(value, fieldtype, True)
+	return "" if out is None else str(out)
+
+
+def _collect(row, fields: tuple, pending: dict) -> None:
+	for fieldname, fieldtype in fields:
+		value = row.get(fieldname)
+		if value is None or value == "":
+			continue
+		pending.setdefault((value, fieldtype), None)
+
+
+def _lookup(row, fields: tuple, converted: dict) -> frappe._dict:
+	out = frappe._dict(name=row.get("name"), idx=row.get("idx"))
+	for fieldname, fieldtype in fields:
+		value = row.get(fieldname)
+		out[fieldname] = "" if value is None or value == "" else converted[(value, fieldtype)]
+	return out
+
+
+def jalali_context(doc) -> frappe._dict:
+	"""Jalali strings for every Date / Datetime field of *doc* and of its child table rows.
+
+	Parent fields are attributes (``j.posting_date``); each table field is a list of rows in
+	document order (``j.items[0].delivery_date``, rows also carry ``name`` and ``idx``).
+	"""
+	if not doc:
+		return frappe._dict()
+	if isinstance(doc, dict) and not hasattr(doc, "meta"):
+		doc = frappe._dict(doc)
+	fields, tables = _get_date_plan(doc.doctype)
+
+	pending: dict = {}
+	_collect(doc, fields, pending)
+	child_plans = []
+	for table_fieldname, child_doctype in tables:
+		child_fields = _get_date_plan(child_doctype)[0]
+		rows = doc.get(table_fieldname) or []
+		child_plans.append((table_fieldname, child_fields, rows))
+		for row in rows:
+			_collect(row, child_fields, pending)
+
+	converted = {key: _convert_cached(*key) for key in pending}
+
+	out = _lookup(doc, fields, converted)
+	for table_fieldname, child_fields, rows in child_plans:
+		out[table_fieldname] = [_lookup(row, child_fields, converted) for row in rows]
+	return out
@@ -1,36 +1,150 @@
-
 import datetime as dt
+import hashlib
+
 import frappe
-from persian_calendar.jalali_support.utils.date_utils import is_j_month_end
+from frappe.utils import get_datetime, now_datetime
+
+from persian_calendar.utils.jalali_schedule import next_run, parse_jalali_spec, runs_between
+
+# Registered schedules are checked on every scheduler tick; the earliest upcoming run time
+# is cached so ticks before it return without touching the database.
+_NEXT_RUN_CACHE_KEY = "persian_calendar:jalali_scheduler_next_run"
+_LAST_RUN_KEY_PREFIX = "jalali_scheduler_last_run:"
+# With no recorded run (new handler / first install) only runs this recent are caught up
+FIRST_RUN_LOOKBACK = dt.timedelta(days=1)
+
+AUTO_REPEAT_HANDLER = "persian_calendar.jalali_support.scheduler.run_shamsi_auto_repeats"
+SCHEDULED_HANDLER_JOB = "persian_calendar.jalali_support.scheduler.run_scheduled_handler"
+
+
+def get_schedule_entries():
+	"""``(spec, method, pass_period_end)`` for every registered Jalali schedule.
+
+	* ``jalali_scheduler_events`` hook: ``{"month_end@23:00": ["app.module.method"]}``;
+	  handlers are called with ``period_end`` (Gregorian date of the period end).
+	* ``persian_month_end_handlers`` hook and Shamsi Auto Repeats: ``month_end``, no arguments;
+	  after missed periods they run once, not once per period.
+	"""
+	entries = [("month_end", AUTO_REPEAT_HANDLER, False)]
+	entries.extend(
+		("month_end", dotted, False) for dotted in frappe.get_hooks("persian_month_end_handlers") or []
+	)
+	for spec, methods in (frappe.get_hooks("jalali_scheduler_events") or {}).items():
+		try:
+			parse_jalali_spec(spec)
+		except ValueError as e:
+			frappe.log_error(str(e), "Jalali Scheduler")
+			continue
+		entries.extend((spec, dotted, True) for dotted in methods)
+	return entries
+
+
+def _last_run_key(spec, method):
+	return _LAST_RUN_KEY_PREFIX + hashlib.sha1(f"{spec}|{method}".encode()).hexdigest()[:16]
+
+
+def _signature(entries):
+	return hashlib.sha1(frappe.as_json(entries, indent=None).encode()).hexdigest()
+
+
+def _enqueue_run(spec, method, pass_period_end, run_at):
+	kwargs = {"period_end": run_at.date()} if pass_period_end else {}
+	frappe.enqueue(
+		SCHEDULED_HANDLER_JOB,
+		queue="long",
+		job_name=f"jalali_schedule:{spec}:{method}",
+		job_id=f"jalali_schedule:{spec}:{method}:{run_at.isoformat()}",
+		deduplicate=True,
+		enqueue_after_commit=True,
+		handler=method,
+		spec=spec,
+		run_at=run_at.isoformat(),
+		**kwargs,
+	)
 
 
+def run_scheduled_handler(handler, spec, run_at, period_end=None):
+	"""Job: call one Jalali schedule handler, then record *run_at* as its last successful run.
+
+	A handler that raises leaves the record alone, so its run is enqueued again on the next
+	due tick.
+	"""
+	kwargs = {"period_end": period_end} if period_end else {}
+	frappe.get_attr(handler)(**kwargs)
+	key = _last_run_key(spec, handler)
+	last_run = frappe.db.get_global(key)
+	if not last_run or get_datetime(last_run) < get_datetime(run_at):
+		frappe.db.set_global(key, run_at)
+
+
+def run_jalali_schedule():
+	"""Scheduler tick: enqueue every due (or missed) Jalali period-end run once."""
+	now = now_datetime()
+	entries = get_schedule_entries()
+	signature = _signature(entries)
+	cached = frappe.cache().get_value(_NEXT_RUN_CACHE_KEY)
+	if cached and cached[0] == signature and now < get_datetime(cached[1]):
+		return
+
+	upcoming = None
+	enqueue_failed = False
+	for spec, method, pass_period_end in entries:
+		key = _last_run_key(spec, method)
+		last_run = frappe.db.get_global(key)
+		if last_run:
+			runs = runs_between(spec, get_datetime(last_run), now)
+		else:
+			runs = runs_between(spec, now - FIRST_RUN_LOOKBACK, now)
+
+		# Handlers without ``period_end`` cannot tell missed periods apart (Auto Repeat
+		# creates the current documents each call), so they catch up with one run only.
+		for run_at in runs if pass_period_end else runs[-1:]:
+			try:
+				_enqueue_run(spec, method, pass_period_end, run_at)
+			except Exception:
+				enqueue_failed = True
+				frappe.log_error(f"Failed to enqueue Jalali schedule {spec}: {method}", "Jalali Scheduler")
+		if not runs and not last_run:
+			# Nothing due yet: later ticks catch up from here instead of the lookback
+			frappe.db.set_global(key, now.isoformat())
+
+		run_at = next_run(spec, now)
+		upcoming = run_at if upcoming is None else min(upcoming, run_at)
+
+	# The last run is recorded by the job once the handler succeeds (run_scheduled_handler);
+	# after a failed enqueue the next tick tries again instead of waiting for the next run.
+	if not enqueue_failed:
+		frappe.cache().set_value(_NEXT_RUN_CACHE_KEY, (signature, upcoming.isoformat()))
+
+
+def get_next_runs():
+	"""``{spec: next run datetime}`` for the registered specs (site timezone)."""
+	now = now_datetime()
+	return {spec: next_run(spec, now) for spec in {entry[0] for entry in get_schedule_entries()}}
+
 
 def month_end_runner():
-    today = dt.date.today()
-    if not is_j_month_end(today):
-        return
-
-    # هندلرهای رجیستری شده دیگر اپ‌ها
-    handlers = frappe.get_hooks("persian_month_end_handlers") or []
-    for dotted in handlers:
-        try:
-            method = frappe.get_attr(dotted)
-            frappe.enqueue(method, queue="long", job_name=f"jalali_month_end:{dotted}")
-        except Exception:
-            frappe.log_error(f"Failed to enqueue month_end handler: {dotted}")
-
-    # Auto Repeatهایی که پرچم شمسی دارند
-    auto_repeats = frappe.get_all(
-        "Auto Repeat",
-        filters={"enabled": 1, "frequency": "Monthly", "pc_use_shamsi": 1, "pc_shamsi_last_day": 1},
-        pluck="name"
-    )
-    for name in auto_repeats:
-        try:
-            doc = frappe.get_doc("Auto Repeat", name)
-            if hasattr(doc, "create_documents"):
-                frappe.enqueue(doc.create_documents, queue="long", job_name=f"auto_repeat_shamsi:{name}")
-            else:
-                doc.run_method("create_documents")
-        except Exception as e:
-            frappe.log_error(f"Auto Repeat (Shamsi) failed for {name}: {e}")
+	"""Former daily entry point; runs the Jalali scheduler tick."""
+	run_jalali_schedule()
+
+
+def run_shamsi_auto_repeats():
+	"""Enqueue one job per Shamsi month-end Auto Repeat, so a failing one does not affect the rest."""
+	# Auto Repeatهایی که پرچم شمسی دارند
+	auto_repeats = frappe.get_all(
+		"Auto Repeat",
+		filters={"enabled": 1, "frequency": "Monthly", "pc_use_shamsi": 1, "pc_shamsi_last_day": 1},
+		pluck="name",
+	)
+	for name in auto_repeats:
+		frappe.enqueue(
+			"persian_calendar.jalali_support.scheduler.create_shamsi_auto_repeat_documents",
+			queue="long",
+			job_name=f"auto_repeat_shamsi:{name}",
+			enqueue_after_commit=True,
+			name=name,
+		)
+
+
+def create_shamsi_auto_repeat_documents(name):
+	frappe.get_doc("Auto Repeat", name).create_documents()
@@ -0,0 +1,552 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Bounded-memory Jalali export for both Data Export exporters.
+
+Large exports page through the parent doctype with keyset pagination on the doctype's
+sort field (``name`` as tiebreaker), so rows come out in the order of the regular export.
+Date/Datetime columns are converted once per page and rows appended to a CSV file (or an
+openpyxl write-only workbook) under ``private/files``. The response redirects to the
+resulting private File, so neither rows nor file content are held in memory. Export files
+are attached to Data Export and deleted by a daily job after ``EXPORT_FILE_TTL``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from collections import defaultdict
+from datetime import timedelta
+
+import frappe
+from frappe import _
+from frappe.utils import cint, now_datetime
+
+from persian_calendar.jalali_support.parallel import get_column_mapper
+from persian_calendar.utils.data_io import convert_export_columns
+
+DEFAULT_STREAM_THRESHOLD = 10000
+DEFAULT_BACKGROUND_THRESHOLD = 100000
+PAGE_SIZE = 2000
+EXPORT_FILE_TTL = timedelta(days=1)
+# ``File.attached_to_field`` marking generated export files (removed after EXPORT_FILE_TTL)
+EXPORT_FILE_MARKER = "jalali_export"
+# Standard columns that are never NULL and so can carry a keyset cursor
+_KEYSET_STANDARD_FIELDS = ("name", "creation", "modified")
+_KEYSET_SORT_ALIAS = "_jalali_keyset_sort"
+
+
+def get_stream_export_threshold() -> int:
+	"""Row count above which Jalali exports stream to a file (0 disables streaming)."""
+	try:
+		value = frappe.db.get_single_value("Jalali Settings", "stream_export_threshold")
+	except Exception:
+		value = None
+	return DEFAULT_STREAM_THRESHOLD if value in (None, "") else cint(value)
+
+
+def get_background_export_threshold() -> int:
+	"""Row count above which Jalali exports run as a background job (0 disables)."""
+	try:
+		value = frappe.db.get_single_value("Jalali Settings", "background_export_threshold")
+	except Exception:
+		value = None
+	return DEFAULT_BACKGROUND_THRESHOLD if value in (None, "") else cint(value)
+
+
+def count_export_rows(doctype: str, filters=None) -> int | None:
+	try:
+		return frappe.db.count(doctype, filters=_normalize_filters(doctype, filters))
+	except Exception:
+		return None
+
+
+def should_stream_export(doctype: str, filters=None) -> bool:
+	threshold = get_stream_export_threshold()
+	if threshold <= 0:
+		return False
+	total = count_export_rows(doctype, filters)
+	return total is not None and total > threshold
+
+
+def should_export_in_background(total: int | None) -> bool:
+	threshold = get_background_export_threshold()
+	return bool(threshold > 0 and total is not None and total > threshold)
+
+
+def _normalize_filters(doctype: str, filters) -> list:
+	if not filters:
+		return []
+	if isinstance(filters, str):
+		filters = frappe.parse_json(filters)
+	if isinstance(filters, dict):
+		out = []
+		for fieldname, value in filters.items():
+			if isinstance(value, list | tuple) and len(value) == 2:
+				out.append([doctype, fieldname, value[0], value[1]])
+			else:
+				out.append([doctype, fieldname, "=", value])
+		return out
+	return list(filters)
+
+
+def get_keyset_order(doctype: str) -> tuple[str, str]:
+	"""``(sort_field, "asc" | "desc")`` of the doctype list order usable as a keyset cursor.
+
+	Sort fields that may hold NULL (optional custom fields) cannot be compared with ``<``/``>``;
+	those doctypes page by ``creation`` in the configured direction instead.
+	"""
+	meta = frappe.get_meta(doctype)
+	order = "asc" if (meta.sort_order or "").lower() == "asc" else "desc"
+	field = meta.sort_field or "creation"
+	if field not in _KEYSET_STANDARD_FIELDS:
+		df = meta.get_field(field)
+		if not (df and df.reqd and field in meta.get_valid_columns()):
+			field = "creation"
+	return field, order
+
+
+def iter_keyset_pages(doctype: str, fields: list, filters=None, page_size: int = PAGE_SIZE):
+	"""Yield pages of permitted records in the doctype sort order (keyset pagination, no OFFSET).
+
+	Rows after the cursor ``(sort value, name)`` are selected with
+	``sort <= last AND (sort < last OR name < last_name)`` (``>`` for ascending order).
+	"""
+	base_filters = _normalize_filters(doctype, filters)
+	sort_field, order = get_keyset_order(doctype)
+	after = "<" if order == "desc" else ">"
+	sort_column = f"`tab{doctype}`.`{sort_field}`"
+	order_by = f"`tab{doctype}`.`name` {order}"
+	if sort_field != "name":
+		fields = [*fields, f"{sort_column} as {_KEYSET_SORT_ALIAS}"]
+		order_by = f"{sort_column} {order}, {order_by}"
+
+	last = None
+	while True:
+		page_filters = list(base_filters)
+		or_filters = None
+		if last is not None:
+			if sort_field == "name":
+				page_filters.append([doctype, "name", after, last.name])
+			else:
+				last_sort = last[_KEYSET_SORT_ALIAS]
+				page_filters.append([doctype, sort_field, after + "=", last_sort])
+				or_filters = [[doctype, sort_field, after, last_sort], [doctype, "name", after, last.name]]
+		page = frappe.get_list(
+			doctype,
+			fields=fields,
+			filters=page_filters,
+			or_filters=or_filters,
+			order_by=order_by,
+			limit_page_length=page_size,
+		)
+		if not page:
+			return
+		yield page
+		if len(page) < page_size:
+			return
+		last = page[-1]
+
+
+class _CsvSink:
+	extension = "csv"
+
+	def __init__(self, path: str, title: str):
+		self.path = path
+		self._file = open(path, "w", newline="", encoding="utf-8")
+		self._writer = csv.writer(self._file, quoting=csv.QUOTE_NONNUMERIC)
+
+	def writerow(self, row) -> None:
+		self._writer.writerow(row)
+
+	def writerows(self, rows) -> None:
+		self._writer.writerows(rows)
+
+	def close(self) -> None:
+		self._file.close()
+
+
+class _XlsxSink:
+	extension = "xlsx"
+
+	def __init__(self, path: str, title: str):
+		from openpyxl import Workbook
+		from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+		self.path = path
+		self._illegal = ILLEGAL_CHARACTERS_RE
+		self._workbook = Workbook(write_only=True)
+		self._sheet = self._workbook.create_sheet(title[:31] or "Sheet1")
+
+	def _clean(self, value):
+		if isinstance(value, str):
+			return self._illegal.sub("", value)
+		return value
+
+	def writerow(self, row) -> None:
+		self._sheet.append([self._clean(value) for value in row])
+
+	def writerows(self, rows) -> None:
+		for row in rows:
+			self.writerow(row)
+
+	def close(self) -> None:
+		self._workbook.save(self.path)
+
+
+def new_export_path(doctype: str, extension: str) -> tuple[str, str]:
+	"""``(file_name, path)`` for a new export file in ``private/files``."""
+	file_name = f"{frappe.scrub(doctype)}-{frappe.generate_hash(length=10)}.{extension}"
+	return file_name, frappe.get_site_path("private", "files", file_name)
+
+
+def open_export_sink(file_type: str, doctype: str, title: str):
+	"""Open a CSV or write-only XLSX sink backed by a new file in ``private/files``."""
+	sink_class = _XlsxSink if file_type == "Excel" else _CsvSink
+	file_name, path = new_export_path(doctype, sink_class.extension)
+	sink = sink_class(path, title)
+	sink.file_name = file_name
+	sink.download_name = f"{doctype}.{sink_class.extension}"
+	return sink
+
+
+def discard_sink(sink) -> None:
+	try:
+		sink.close()
+	except Exception:
+		pass
+	if os.path.exists(sink.path):
+		os.remove(sink.path)
+
+
+def save_export_file(sink, attached_to_doctype: str | None = None, attached_to_name: str | None = None):
+	"""Register the finished export as a private File.
+
+	Without a document to attach to, the file is attached to Data Export and marked for
+	removal by ``delete_expired_export_files``.
+	"""
+	attached_to_field = None
+	if not attached_to_doctype:
+		attached_to_doctype = attached_to_name = "Data Export"
+		attached_to_field = EXPORT_FILE_MARKER
+	file_doc = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": sink.download_name,
+			"file_url": f"/private/files/{sink.file_name}",
+			"is_private": 1,
+			"attached_to_doctype": attached_to_doctype,
+			"attached_to_name": attached_to_name,
+			"attached_to_field": attached_to_field,
+		}
+	)
+	file_doc.insert(ignore_permissions=True)
+	return file_doc
+
+
+def delete_expired_export_files() -> None:
+	"""Daily: delete generated export files older than ``EXPORT_FILE_TTL``."""
+	expired = frappe.get_all(
+		"File",
+		filters={
+			"attached_to_doctype": "Data Export",
+			"attached_to_field": EXPORT_FILE_MARKER,
+			"creation": ("<", now_datetime() - EXPORT_FILE_TTL),
+		},
+		pluck="name",
+	)
+	for name in expired:
+		try:
+			frappe.delete_doc("File", name, ignore_permissions=True)
+		except Exception:
+			frappe.log_error(f"Failed to delete expired export file {name}", "Jalali Export")
+	if expired:
+		frappe.db.commit()
+
+
+def respond_with_file(file_doc) -> None:
+	frappe.response["type"] = "redirect"
+	frappe.response["location"] = file_doc.file_url
+
+
+def _group_children(rows) -> dict:
+	grouped = defaultdict(list)
+	for row in rows:
+		grouped[row.parent].append(row)
+	return grouped
+
+
+# ---------------------------------------------------------------------------
+# frappe.core.doctype.data_export.exporter.DataExporter
+# ---------------------------------------------------------------------------
+
+
+def can_stream_data_export(exporter) -> bool:
+	"""Streaming keeps core semantics only for plain exports (no regex doc selection / nested sets)."""
+	if not cint(getattr(exporter, "with_data", 0)) or getattr(exporter, "docs_to_export", None):
+		return False
+	table_columns = frappe.db.get_table_columns(exporter.parent_doctype)
+	return not ("lft" in table_columns and "rgt" in table_columns)
+
+
+def stream_data_export(exporter, on_page=None):
+	"""Streaming replacement for ``DataExporter.build_response``; returns the File doc (or None).
+
+	*on_page* is called with the number of parent records written after every page.
+	"""
+	title = "Data Import Template" if exporter.template else "Data Export"
+	sink = open_export_sink(exporter.file_type, exporter.doctype, title)
+	try:
+		exporter.writer = sink
+		_build_data_export_headers(exporter)
+		written = _write_data_export_rows(exporter, sink, on_page)
+		sink.close()
+	except Exception:
+		discard_sink(sink)
+		raise
+
+	if not written:
+		discard_sink(sink)
+		frappe.respond_as_web_page(
+			_("No Data"), _("There is no data to be exported"), indicator_color="orange"
+		)
+		return None
+	return save_export_file(sink)
+
+
+def _build_data_export_headers(exporter) -> None:
+	# Mirrors DataExporter.build_response up to add_field_headings().
+	exporter.name_field = "parent" if exporter.parent_doctype != exporter.doctype else "name"
+	if exporter.template:
+		exporter.add_main_header()
+	exporter.writer.writerow([""])
+	exporter.tablerow = [exporter.data_keys.doctype]
+	exporter.labelrow = [_("Column Labels:")]
+	exporter.fieldrow = [exporter.data_keys.columns]
+	exporter.mandatoryrow = [_("Mandatory:")]
+	exporter.typerow = [_("Type:")]
+	exporter.inforow = [_("Info:")]
+	exporter.columns = []
+	exporter.build_field_columns(exporter.doctype)
+	if exporter.all_doctypes:
+		for d in exporter.child_doctypes:
+			exporter.append_empty_field_column()
+			if (
+				exporter.select_columns and exporter.select_columns.get(d["doctype"], None)
+			) or not exporter.select_columns:
+				exporter.build_field_columns(d["doctype"], d["parentfield"])
+	exporter.add_field_headings()
+
+
+def _write_data_export_rows(exporter, sink, on_page=None) -> int:
+	from persian_calendar.jalali_support.data_import_export import get_data_export_date_columns
+
+	frappe.permissions.can_export(exporter.parent_doctype, raise_exception=True)
+	date_columns = get_data_export_date_columns(exporter)
+	mapper = get_column_mapper()
+	child_doctypes = exporter.child_doctypes if exporter.all_doctypes else []
+	exporter._jalali_defer_dates = True
+	written = 0
+	try:
+		for page in iter_keyset_pages(exporter.doctype, ["*"], exporter.filters):
+			names = [doc.name for doc in page]
+			children = [
+				(
+					c,
+					_group_children(
+						frappe.get_all(
+							c["doctype"],
+							filters={"parent": ("in", names), "parentfield": c["parentfield"]},
+							fields=["*"],
+							order_by="idx asc",
+						)
+					),
+				)
+				for c in child_doctypes
+			]
+			chunk = []
+			for doc in page:
+				rows = []
+				exporter.add_data_row(rows, exporter.doctype, None, doc, 0)
+				for c, grouped in children:
+					for ci, child in enumerate(grouped.get(doc.name, ())):
+						exporter.add_data_row(rows, c["doctype"], c["parentfield"], child, ci)
+				chunk.extend(rows)
+			convert_export_columns(chunk, date_columns, mapper=mapper)
+			sink.writerows(chunk)
+			written += len(page)
+			if on_page:
+				on_page(written)
+	finally:
+		exporter._jalali_defer_dates = False
+	return written
+
+
+# ---------------------------------------------------------------------------
+# frappe.core.doctype.data_import.exporter.Exporter
+# ---------------------------------------------------------------------------
+
+
+def stream_data_import_export(exporter, on_page=None):
+	"""Streaming replacement for ``Exporter.build_response``; returns the File doc."""
+	sink = open_export_sink(exporter.file_type, exporter.doctype, _(exporter.doctype))
+	try:
+		sink.writerows(exporter.csv_array)
+		_write_data_import_rows(exporter, sink, on_page)
+		sink.close()
+	except Exception:
+		discard_sink(sink)
+		raise
+	return save_export_file(sink)
+
+
+def _write_data_import_rows(exporter, sink, on_page=None) -> int:
+	from persian_calendar.jalali_support.data_import_export import get_data_import_date_columns
+
+	frappe.permissions.can_export(exporter.doctype, raise_exception=True)
+	doctype = exporter.doctype
+	date_columns = get_data_import_date_columns(exporter)
+	mapper = get_column_mapper()
+	table_fields = [f for f in exporter.exportable_fields if f != doctype]
+
+	parent_fields = [f"`tab{df.parent}`.`{df.fieldname}`" for df in exporter.fields if df.parent == doctype]
+	name_column = f"`tab{doctype}`.`name`"
+	if name_column not in parent_fields:
+		parent_fields.append(name_column)
+
+	child_specs = []
+	for key in table_fields:
+		table_df = exporter.meta.get_field(key)
+		child_fields = [
+			"name",
+			"idx",
+			"parent",
+			"parentfield",
+			*{
+				f"`tab{df.parent}`.`{df.fieldname}`"
+				for df in exporter.fields
+				if df.parent == table_df.options
+			},
+		]
+		child_specs.append((key, table_df, child_fields))
+
+	written = 0
+	exporter._jalali_defer_dates = True
+	try:
+		for page in iter_keyset_pages(doctype, parent_fields, exporter.export_filters):
+			names = [doc.name for doc in page]
+			children = {
+				key: _group_children(
+					frappe.get_all(
+						table_df.options,
+						filters={
+							"parent": ("in", names),
+							"parentfield": table_df.fieldname,
+							"parenttype": doctype,
+						},
+						fields=child_fields,
+						order_by="idx asc",
+					)
+				)
+				for key, table_df, child_fields in child_specs
+			}
+			chunk = []
+			for doc in page:
+				rows = exporter.add_data_row(doctype, None, doc, [], 0)
+				for key, table_df, _child_fields in child_specs:
+					for i, child_row in enumerate(children[key].get(doc.name, ())):
+						rows = exporter.add_data_row(
+							table_df.options, child_row.parentfield, child_row, rows, i
+						)
+				chunk.extend(rows)
+			convert_export_columns(chunk, date_columns, mapper=mapper)
+			sink.writerows(chunk)
+			written += len(page)
+			if on_page:
+				on_page(written)
+	finally:
+		exporter._jalali_defer_dates = False
+	return written
+
+
+# ---------------------------------------------------------------------------
+# Background exports
+# ---------------------------------------------------------------------------
+
+
+def enqueue_jalali_export(kind: str, export_kwargs: dict, total: int | None) -> None:
+	"""Queue a streaming export on the ``long`` queue and tell the user the request is done."""
+	job_id = frappe.generate_hash(length=12)
+	frappe.enqueue(
+		"persian_calendar.jalali_support.streaming_export.run_background_export",
+		queue="long",
+		timeout=4 * 3600,
+		job_id=f"jalali_export:{job_id}",
+		kind=kind,
+		export_kwargs=export_kwargs,
+		total=total,
+		export_id=job_id,
+	)
+	frappe.respond_as_web_page(
+		_("Export Queued"),
+		_(
+			"{0} records are being exported in the background. You will get a download link when it is ready."
+		).format(total),
+		indicator_color="blue",
+	)
+
+
+def run_background_export(
+	kind: str, export_kwargs: dict, total: int | None = None, export_id: str | None = None
+):
+	"""RQ job: build the export file, publishing ``rows / total`` progress over realtime."""
+	# The exporter classes only accept ``export_dates_as_jalali`` once patched; a fresh worker
+	# may not have run any request hook yet.
+	from persian_calendar.jalali_support.data_import_export import apply_data_import_export_patches
+
+	apply_data_import_export_patches()
+	user = frappe.session.user
+	doctype = export_kwargs.get("doctype")
+	if isinstance(doctype, list):
+		doctype = doctype[0]
+
+	def on_page(rows: int) -> None:
+		frappe.publish_realtime(
+			"jalali_export_progress",
+			{"export_id": export_id, "doctype": doctype, "rows": rows, "total": total},
+			user=user,
+		)
+
+	try:
+		if kind == "arrow_export":
+			from persian_calendar.jalali_support.arrow_export import export_arrow
+
+			file_doc = export_arrow(**export_kwargs, on_page=on_page)
+		elif kind == "data_export":
+			from frappe.core.doctype.data_export.exporter import DataExporter
+
+			file_doc = stream_data_export(DataExporter(**export_kwargs), on_page=on_page)
+		else:
+			from frappe.core.doctype.data_import.exporter import Exporter
+
+			exporter = Exporter(**{**export_kwargs, "export_data": False})
+			file_doc = stream_data_import_export(exporter, on_page=on_page)
+		frappe.db.commit()
+	except Exception:
+		frappe.db.rollback()
+		frappe.log_error(title=f"Jalali export failed: {doctype}")
+		frappe.publish_realtime(
+			"jalali_export_failed", {"export_id": export_id, "doctype": doctype}, user=user
+		)
+		raise
+
+	frappe.publish_realtime(
+		"jalali_export_complete",
+		{
+			"export_id": export_id,
+			"doctype": doctype,
+			"file_url": file_doc.file_url if file_doc else None,
+			"file_name": file_doc.file_name if file_doc else None,
+			"rows": total,
+		},
+		user=user,
+	)
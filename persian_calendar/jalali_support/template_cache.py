@@ -0,0 +1,103 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Share compiled brace-template plans between workers through the site's Redis cache.
+
+Plans live in one hash keyed by the SHA-1 of the template text, so an edited template is
+simply a new entry. Each worker loads the hash once per site on its first request or job.
+Templates it compiles itself are buffered and written back after the request or job, only
+while the hash holds fewer than ``MAX_PRELOADED_PLANS`` entries, so reading it stays
+bounded. The hash is dropped on migrate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import frappe
+
+from persian_calendar.utils.template_format import (
+	BraceTemplatePlan,
+	add_compile_listener,
+	preload_brace_plans,
+)
+
+TEMPLATE_PLANS_CACHE_KEY = "persian_calendar:brace_template_plans:v1"
+MAX_PRELOADED_PLANS = 512  # same bound as the in-process LRU
+
+_warmed_sites: set[str] = set()
+_pending_plans: dict[str, dict[str, tuple]] = {}
+
+
+def template_hash(template: str) -> str:
+	return hashlib.sha1(template.encode("utf-8")).hexdigest()
+
+
+def _serialize(template: str, plan: BraceTemplatePlan) -> tuple:
+	return (template, plan.segments, tuple(sorted(plan.fields)), plan.error)
+
+
+def _deserialize(value) -> tuple[str, BraceTemplatePlan]:
+	template, segments, fields, error = value
+	return template, BraceTemplatePlan(
+		tuple(tuple(segment) for segment in segments), frozenset(fields), error
+	)
+
+
+def store_template_plan(template: str, plan: BraceTemplatePlan) -> None:
+	"""Compile listener: queue a plan compiled in this worker for the current site."""
+	site = getattr(frappe.local, "site", None)
+	if not site:
+		return
+	_pending_plans.setdefault(site, {})[template_hash(template)] = _serialize(template, plan)
+
+
+def flush_template_plans() -> None:
+	"""after_request / after_job: publish the plans queued for this site, up to the cap."""
+	pending = _pending_plans.pop(getattr(frappe.local, "site", None), None)
+	if not pending:
+		return
+	try:
+		cache = frappe.cache()
+		room = MAX_PRELOADED_PLANS - cache.hlen(cache.make_key(TEMPLATE_PLANS_CACHE_KEY))
+		for key, value in list(pending.items())[: max(room, 0)]:
+			cache.hset(TEMPLATE_PLANS_CACHE_KEY, key, value)
+	except Exception:
+		# Redis unavailable: the plans stay local to this worker
+		pass
+
+
+def load_template_plans() -> dict[str, BraceTemplatePlan]:
+	"""``{template: plan}`` stored for the current site (malformed entries skipped)."""
+	plans = {}
+	# writes stop at MAX_PRELOADED_PLANS entries, so the hash is small
+	for value in (frappe.cache().hgetall(TEMPLATE_PLANS_CACHE_KEY) or {}).values():
+		try:
+			template, plan = _deserialize(value)
+		except (TypeError, ValueError):
+			continue
+		plans[template] = plan
+		if len(plans) >= MAX_PRELOADED_PLANS:
+			break
+	return plans
+
+
+def warm_template_cache() -> None:
+	"""before_request / before_job: seed this process with the site's plans (once per site)."""
+	site = getattr(frappe.local, "site", None)
+	if not site or site in _warmed_sites:
+		return
+	add_compile_listener(store_template_plan)
+	try:
+		preload_brace_plans(load_template_plans())
+	except Exception:
+		# Redis unavailable: templates compile locally and the next request tries again
+		return
+	_warmed_sites.add(site)
+
+
+def clear_template_cache() -> None:
+	"""after_migrate: drop stored plans (plan layout may change with the app code)."""
+	try:
+		frappe.cache().delete_value(TEMPLATE_PLANS_CACHE_KEY)
+	except Exception:
+		pass
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
+
 _patches_applied = False
 
 
@@ -19,7 +21,7 @@ def apply_template_patches() -> None:
 def _patch_document_title_field() -> None:
 	from frappe.model.document import Document
 
-	from persian_calendar.utils.template_format import doc_as_format_context, render_brace_template
+	from persian_calendar.utils.template_format import doc_format_context, render_brace_template
 
 	if getattr(Document.set_title_field, "_jalali_patched", False):
 		return
@@ -27,13 +29,6 @@ def _patch_document_title_field() -> None:
 	_original = Document.set_title_field
 
 	def set_title_field(self):
-		def get_values():
-			values = self.as_dict()
-			for key, value in values.items():
-				if value is None:
-					values[key] = ""
-			return values
-
 		if self.meta.get("title_field") != "title":
 			return _original(self)
 
@@ -42,9 +37,9 @@ def _patch_document_title_field() -> None:
 			return
 
 		if df.options:
-			self.set(df.fieldname, render_brace_template(df.options, get_values()))
+			self.set(df.fieldname, render_brace_template(df.options, doc_format_context(self)))
 		elif self.is_new() and not self.get(df.fieldname) and df.default:
-			self.set(df.fieldname, render_brace_template(df.default, get_values()))
+			self.set(df.fieldname, render_brace_template(df.default, doc_format_context(self)))
 
 	set_title_field._jalali_patched = True
 	Document.set_title_field = set_title_field
@@ -63,15 +58,16 @@ def _patch_notification_context() -> None:
 	_original = notification_module.get_context
 
 	def get_context(doc):
+		# Doc fields sit behind the core context in a ChainMap and are read only on lookup:
+		# condition checks (safe_eval accepts any mapping as locals) touch just the fields
+		# they name, and Jinja's render() resolves the rest when it copies the context.
 		ctx = _original(doc)
 		doc_obj = ctx.get("doc")
-		if doc_obj is not None:
-			from persian_calendar.utils.template_format import doc_as_format_context
+		if doc_obj is None:
+			return ctx
+		from persian_calendar.utils.template_format import doc_format_context
 
-			flat = doc_as_format_context(doc_obj)
-			for key, value in flat.items():
-				ctx.setdefault(key, value)
-		return ctx
+		return ChainMap(ctx, doc_format_context(doc_obj))
 
 	get_context._jalali_patched = True
 	notification_module.get_context = get_context
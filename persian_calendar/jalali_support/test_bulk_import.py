@@ -0,0 +1,160 @@
+# Copyright (c) 2025, Persian Calendar contributors
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import now
+
+from persian_calendar.jalali_support.bulk_import import (
+	_insert_chunk,
+	_insert_fields,
+	_insert_import_logs,
+	_prepare_row,
+	get_bulk_import_blocker,
+	validate_bulk_import,
+)
+from persian_calendar.jalali_support.data_import_export import apply_data_import_export_patches
+from persian_calendar.jalali_support.datetime_normalizer import get_flat_normalizer_plan
+
+
+class TestBulkImportEligibility(FrappeTestCase):
+	def test_unregistered_doctype_is_blocked(self):
+		self.assertIn("jalali_bulk_import_doctypes", get_bulk_import_blocker("ToDo"))
+
+	@patch(
+		"persian_calendar.jalali_support.bulk_import.get_bulk_import_doctypes",
+		return_value={"ToDo", "User"},
+	)
+	def test_registered_flat_doctype_is_allowed(self, _doctypes):
+		self.assertIsNone(get_bulk_import_blocker("ToDo"))
+		self.assertIn("child tables", get_bulk_import_blocker("User"))
+
+	def test_start_refuses_blocked_doctype(self):
+		data_import = frappe._dict(
+			jalali_bulk_insert=1, import_type="Insert New Records", reference_doctype="ToDo"
+		)
+		with self.assertRaises(frappe.ValidationError):
+			validate_bulk_import(data_import)
+
+	@patch("persian_calendar.jalali_support.bulk_import.get_bulk_import_doctypes", return_value={"ToDo"})
+	def test_start_requires_create_permission(self, _doctypes):
+		data_import = frappe._dict(
+			jalali_bulk_insert=1, import_type="Insert New Records", reference_doctype="ToDo"
+		)
+		frappe.set_user("Guest")
+		try:
+			with self.assertRaises(frappe.PermissionError):
+				validate_bulk_import(data_import)
+		finally:
+			frappe.set_user("Administrator")
+
+
+class TestBulkImportRows(FrappeTestCase):
+	def _prepare(self, values):
+		return _prepare_row("ToDo", values, get_flat_normalizer_plan("ToDo"), now(), "Administrator")
+
+	def test_prepare_row_fills_standard_fields(self):
+		doc = self._prepare({"doctype": "ToDo", "description": "bulk", "date": "2024-10-01"})
+		self.assertTrue(doc.name)
+		self.assertEqual((doc.owner, doc.docstatus), ("Administrator", 0))
+		self.assertEqual(str(doc.date), "2024-10-01")
+
+	def test_prepare_row_rejects_missing_mandatory(self):
+		with self.assertRaises(frappe.MandatoryError):
+			self._prepare({"doctype": "ToDo", "status": "Open"})
+
+	def test_prepare_row_rejects_invalid_select(self):
+		with self.assertRaises(frappe.ValidationError):
+			self._prepare({"doctype": "ToDo", "description": "bulk", "status": "Not A Status"})
+
+	def test_chunk_is_inserted_in_one_statement(self):
+		docs = [self._prepare({"description": f"bulk {i}"}) for i in range(3)]
+		rejects = []
+		with patch.object(frappe.db, "bulk_insert", wraps=frappe.db.bulk_insert) as bulk_insert:
+			positions = _insert_chunk("ToDo", _insert_fields("ToDo"), docs, [[2], [3], [4]], rejects)
+		self.assertEqual((positions, rejects), ([0, 1, 2], []))
+		self.assertEqual(bulk_insert.call_count, 1)
+		self.assertTrue(all(frappe.db.exists("ToDo", doc.name) for doc in docs))
+
+	def test_failed_chunk_falls_back_to_single_rows(self):
+		existing = self._prepare({"description": "first"})
+		_insert_chunk("ToDo", _insert_fields("ToDo"), [existing], [[2]], [])
+		duplicate = self._prepare({"description": "duplicate"})
+		duplicate.name = existing.name
+		docs = [self._prepare({"description": "before"}), duplicate, self._prepare({"description": "after"})]
+		rejects = []
+		positions = _insert_chunk("ToDo", _insert_fields("ToDo"), docs, [[3], [4, 5], [6]], rejects)
+		self.assertEqual(positions, [0, 2])
+		self.assertEqual(len(rejects), 1)
+		self.assertEqual(rejects[0][0], [4, 5])
+		self.assertTrue(frappe.db.exists("ToDo", docs[0].name))
+		self.assertTrue(frappe.db.exists("ToDo", docs[2].name))
+		self.assertEqual(frappe.db.get_value("ToDo", existing.name, "description"), "first")
+
+	def test_import_logs_record_success_and_errors(self):
+		data_import = frappe.generate_hash(length=10)
+		_insert_import_logs(
+			data_import, 5, [([2], "TODO-1", None), ([3, 4], None, "Value missing")], now(), "Administrator"
+		)
+		logs = frappe.get_all(
+			"Data Import Log",
+			filters={"data_import": data_import},
+			fields=["log_index", "success", "docname", "row_indexes", "exception"],
+			order_by="log_index",
+		)
+		self.assertEqual([(log.log_index, log.success) for log in logs], [(5, 1), (6, 0)])
+		self.assertEqual(logs[0].docname, "TODO-1")
+		self.assertEqual(frappe.parse_json(logs[1].row_indexes), [3, 4])
+		self.assertEqual(logs[1].exception, "Value missing")
+
+
+class TestBulkImportRetry(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		apply_data_import_export_patches()
+
+	@patch("persian_calendar.jalali_support.bulk_import.get_bulk_import_doctypes", return_value={"ToDo"})
+	def test_retry_skips_rows_already_inserted(self, _doctypes):
+		prefix = frappe.generate_hash(length=8)
+		content = "\n".join(["Description", *(f"{prefix} {i}" for i in range(3))])
+		file_doc = frappe.get_doc(
+			{"doctype": "File", "file_name": f"{prefix}.csv", "content": content, "is_private": 1}
+		).insert()
+		data_import = frappe.get_doc(
+			{
+				"doctype": "Data Import",
+				"reference_doctype": "ToDo",
+				"import_type": "Insert New Records",
+				"import_file": file_doc.file_url,
+				"jalali_bulk_insert": 1,
+			}
+		).insert()
+		# first run: spreadsheet row 2 was inserted, row 3 failed, row 4 was never reached
+		first = frappe.get_doc({"doctype": "ToDo", "description": f"{prefix} 0"}).insert()
+		_insert_import_logs(
+			data_import.name,
+			0,
+			[([2], first.name, None), ([3], None, "Lock wait timeout")],
+			now(),
+			"Administrator",
+		)
+		data_import.db_set("status", "Partial Success")
+
+		data_import.start_import()  # runs inline in tests
+
+		self.assertEqual(frappe.db.get_value("Data Import", data_import.name, "status"), "Success")
+		self.assertEqual(
+			sorted(frappe.get_all("ToDo", {"description": ("like", f"{prefix}%")}, pluck="description")),
+			[f"{prefix} {i}" for i in range(3)],
+		)
+		logs = frappe.get_all(
+			"Data Import Log",
+			filters={"data_import": data_import.name},
+			fields=["log_index", "success", "row_indexes"],
+			order_by="log_index",
+		)
+		self.assertEqual(
+			[(log.log_index, log.success, frappe.parse_json(log.row_indexes)) for log in logs],
+			[(0, 1, [2]), (2, 1, [3]), (3, 1, [4])],
+		)
@@ -0,0 +1,41 @@
+# Copyright (c) 2025, Persian Calendar contributors
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support.utils.business_days import (
+	clear_business_day_cache,
+	get_business_day_index,
+)
+
+HOLIDAY_LIST_NAME = "_Test Jalali Business Days"
+
+
+class TestBusinessDayCache(FrappeTestCase):
+	def setUp(self):
+		if not frappe.db.exists("DocType", "Holiday List"):
+			raise unittest.SkipTest("Holiday List is not installed")
+		clear_business_day_cache()
+		self.addCleanup(clear_business_day_cache)
+		self.holiday_list = frappe.get_doc(
+			{
+				"doctype": "Holiday List",
+				"holiday_list_name": HOLIDAY_LIST_NAME,
+				"from_date": "2025-03-21",
+				"to_date": "2025-04-20",
+				"holidays": [{"holiday_date": "2025-03-21", "description": "Nowruz"}],
+			}
+		).insert()
+
+	def test_index_is_cached_until_the_holiday_list_is_saved(self):
+		self.assertTrue(get_business_day_index(HOLIDAY_LIST_NAME, (5,)).is_business_day(date(2025, 3, 25)))
+		with patch.object(frappe.db, "get_value", wraps=frappe.db.get_value) as get_value:
+			get_business_day_index(HOLIDAY_LIST_NAME, (5,))
+		get_value.assert_not_called()
+
+		self.holiday_list.append("holidays", {"holiday_date": "2025-03-25", "description": "Closed"})
+		self.holiday_list.save()
+		self.assertFalse(get_business_day_index(HOLIDAY_LIST_NAME, (5,)).is_business_day(date(2025, 3, 25)))
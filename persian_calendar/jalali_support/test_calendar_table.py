@@ -0,0 +1,48 @@
+# Copyright (c) 2025, Persian Calendar contributors
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support import calendar_table
+from persian_calendar.jalali_support.calendar_table import set_marked_holiday_list, sync_jalali_calendar_table
+from persian_calendar.jalali_support.holiday_list import generate_jalali_holiday_list
+
+HOLIDAY_LIST_NAME = "_Test Jalali 1403"
+
+
+class TestCalendarTableHolidays(FrappeTestCase):
+	def setUp(self):
+		if not frappe.db.exists("DocType", "Holiday List"):
+			raise unittest.SkipTest("Holiday List is not installed")
+		options = frappe._dict(
+			from_year=1403, to_year=1403, week_start=6, week_end=5, fiscal_year_start_month=1
+		)
+		for patcher in (
+			patch.object(calendar_table, "get_calendar_table_options", return_value=options),
+			# rolled back after the test instead of committing a one-year table
+			patch.object(frappe.db, "commit"),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		self.addCleanup(set_marked_holiday_list, 1403, None)
+
+	def _is_holiday(self, gregorian_date):
+		return frappe.db.get_value("Jalali Calendar", gregorian_date, "is_holiday")
+
+	def test_rebuild_keeps_holidays_marked_from_holiday_list(self):
+		sync_jalali_calendar_table(force=True)
+		nowruz = "2024-03-20"  # 1 Farvardin 1403, a Wednesday
+		self.assertEqual(self._is_holiday(nowruz), 0)
+
+		generate_jalali_holiday_list(1403, HOLIDAY_LIST_NAME, weekly_offs="5", update_calendar_table=1)
+		self.assertEqual(self._is_holiday(nowruz), 1)
+
+		sync_jalali_calendar_table(force=True)
+		self.assertEqual(self._is_holiday(nowruz), 1)
+		self.assertEqual(self._is_holiday("2024-03-22"), 1)  # Friday
+
+		frappe.delete_doc("Holiday List", HOLIDAY_LIST_NAME)
+		sync_jalali_calendar_table(force=True)
+		self.assertEqual(self._is_holiday(nowruz), 0)
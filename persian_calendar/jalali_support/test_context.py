@@ -0,0 +1,61 @@
+# Copyright (c) 2025, Persian Calendar Contributors
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support.context import (
+	clear_jalali_context,
+	get_effective_calendars,
+	get_jalali_context,
+	is_jalali_enabled,
+)
+from persian_calendar.jalali_support.doctype.jalali_settings.jalali_settings import (
+	JalaliSettings,
+)
+
+_SETTINGS = frappe._dict(enabled=True, default_calendar="Jalali", week_start=6, week_end=5)
+
+
+class TestJalaliContext(FrappeTestCase):
+	def setUp(self):
+		clear_jalali_context()
+
+	def tearDown(self):
+		clear_jalali_context()
+
+	def test_settings_resolved_once_per_request(self):
+		with patch.object(JalaliSettings, "get_settings", return_value=_SETTINGS) as get_settings:
+			self.assertTrue(is_jalali_enabled())
+			get_jalali_context()
+			get_jalali_context()
+			self.assertEqual(get_settings.call_count, 1)
+
+	def test_context_matches_effective_calendar(self):
+		user = frappe.session.user
+		ctx = get_jalali_context(user)
+		effective = JalaliSettings.get_effective_calendar(user)
+		self.assertEqual(ctx.display_calendar, effective["display_calendar"])
+		self.assertEqual(ctx.week_start, effective["week_start"])
+		self.assertEqual(ctx.week_end, effective["week_end"])
+
+	def test_clear_rebuilds_context(self):
+		with patch.object(JalaliSettings, "get_settings", return_value=_SETTINGS):
+			first = get_jalali_context()
+		clear_jalali_context()
+		disabled = frappe._dict(_SETTINGS, enabled=False)
+		with patch.object(JalaliSettings, "get_settings", return_value=disabled):
+			second = get_jalali_context()
+		self.assertTrue(first.enabled)
+		self.assertFalse(second.enabled)
+
+	def test_effective_calendars_bulk(self):
+		user = frappe.session.user
+		with patch.object(frappe.db, "get_value", side_effect=AssertionError("per-user query")):
+			result = get_effective_calendars([user, "Guest"])
+		self.assertEqual(set(result), {user, "Guest"})
+		self.assertEqual(
+			result[user]["display_calendar"],
+			JalaliSettings.get_effective_calendar(user)["display_calendar"],
+		)
+		self.assertEqual(get_jalali_context(user).display_calendar, result[user]["display_calendar"])
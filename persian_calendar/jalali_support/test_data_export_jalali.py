@@ -92,6 +92,28 @@ class TestDataExportJalali(FrappeTestCase):
 
 		self.assertEqual(rows[0][2], "1405-01-21")
 
+	def test_add_data_row_reuses_column_plan(self):
+		from unittest.mock import patch
+
+		from frappe.core.doctype.data_export.exporter import DataExporter
+
+		exporter = DataExporter.__new__(DataExporter)
+		exporter.export_dates_as_jalali = 1
+		exporter.all_doctypes = False
+		exporter.columns = ["name", "posting_date"]
+		exporter.column_start_end = {
+			("Journal Entry", None): frappe._dict(start=0, end=2),
+		}
+
+		rows = []
+		with patch("frappe.get_meta", wraps=frappe.get_meta) as get_meta:
+			for idx, posting_date in enumerate(("2026-04-10", "2026-05-13")):
+				doc = frappe._dict(name=f"JE-{idx}", posting_date=posting_date)
+				DataExporter.add_data_row(exporter, rows, "Journal Entry", None, doc, idx)
+		self.assertEqual(get_meta.call_count, 1)
+		self.assertEqual([r[2] for r in rows], ["1405-01-21", "1405-02-23"])
+		self.assertEqual(rows[1][1], "JE-1")
+
 	def test_real_export_data_csv_contains_jalali(self):
 		from frappe.core.doctype.data_export.exporter import export_data
 
@@ -145,3 +167,42 @@ class TestDataExportJalali(FrappeTestCase):
 		result = cstr(frappe.local.response.get("result") or "")
 		self.assertNotIn("1405-01-21", result)
 		self.assertTrue("2026" in result or "04" in result or "10" in result)
+
+	def test_background_export_job_applies_the_exporter_patches(self):
+		"""The RQ job may run in a worker where no request hook has patched the exporter."""
+		from unittest.mock import patch
+
+		from persian_calendar.jalali_support import data_import_export
+		from persian_calendar.jalali_support.streaming_export import run_background_export
+
+		self.assertIn(
+			"persian_calendar.jalali_support.data_import_export.apply_data_import_export_patches",
+			frappe.get_hooks("before_job"),
+		)
+		doctype, docname, date_field = self._doc_for_export()
+		export_kwargs = {
+			"doctype": doctype,
+			"select_columns": {doctype: ["name", date_field]},
+			"filters": [[doctype, "name", "=", docname]],
+			"with_data": 1,
+			"file_type": "CSV",
+			"template": True,
+			"all_doctypes": False,
+			"export_dates_as_jalali": 1,
+		}
+		with (
+			patch.object(
+				data_import_export,
+				"apply_data_import_export_patches",
+				wraps=data_import_export.apply_data_import_export_patches,
+			) as apply_patches,
+			patch("frappe.publish_realtime") as realtime,
+		):
+			run_background_export("data_export", export_kwargs, total=1, export_id="test")
+
+		apply_patches.assert_called_once_with()
+		done = [c for c in realtime.call_args_list if c.args[0] == "jalali_export_complete"]
+		self.assertEqual(len(done), 1)
+		file_url = done[0].args[1]["file_url"]
+		content = cstr(frappe.get_doc("File", {"file_url": file_url}).get_content())
+		self.assertIn("1405-01-21", content)
@@ -0,0 +1,45 @@
+# Copyright (c) 2025, Persian Calendar contributors
+import json
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support.data_import_export import apply_data_import_export_patches
+from persian_calendar.utils.import_formats import SAMPLE_SIZE
+
+
+class TestJalaliDataImport(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		apply_data_import_export_patches()
+
+	def _data_import(self, rows):
+		content = "\n".join(",".join(row) for row in [["Description", "Due Date"], *rows])
+		file_doc = frappe.get_doc(
+			{"doctype": "File", "file_name": "jalali-todo.csv", "content": content, "is_private": 1}
+		).insert()
+		return frappe.get_doc(
+			{
+				"doctype": "Data Import",
+				"reference_doctype": "ToDo",
+				"import_type": "Insert New Records",
+				"import_file": file_doc.file_url,
+				"import_dates_from_jalali": 1,
+			}
+		).insert()
+
+	def test_mixed_formats_past_the_sample_are_shown_after_import(self):
+		rows = [[f"_Test jalali import {i}", "1403-07-10"] for i in range(SAMPLE_SIZE)]
+		rows.append(["_Test jalali import gregorian", "2024-10-01"])
+		data_import = self._data_import(rows)
+		data_import.start_import()  # runs inline in tests
+
+		data_import.reload()
+		self.assertEqual(data_import.status, "Success")
+		self.assertEqual(
+			set(frappe.get_all("ToDo", {"description": ("like", "_Test jalali import%")}, pluck="date")),
+			{frappe.utils.getdate("2024-10-01")},
+		)
+		warnings = json.loads(data_import.template_warnings or "[]")
+		self.assertTrue(any("mixes date formats" in warning["message"] for warning in warnings))
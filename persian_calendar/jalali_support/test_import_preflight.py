@@ -0,0 +1,53 @@
+# Copyright (c) 2025, Persian Calendar contributors
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support.import_preflight import validate_before_start, validate_import_rows
+
+PREFLIGHT = "persian_calendar.jalali_support.import_preflight"
+
+
+class TestImportPreflight(FrappeTestCase):
+	def test_reports_invalid_jalali_cells_with_positions(self):
+		rows = [
+			["Description", "Due Date"],
+			["ok", "1403-07-10"],
+			["persian digits", "۱۴۰۳-۰۷-۱۱"],  # noqa: RUF001
+			["bad month", "1403-13-01"],
+			["blank", ""],
+		]
+		report = validate_import_rows(rows, "ToDo")
+		self.assertEqual(report["total_rows"], 4)
+		self.assertEqual(report["checked_columns"], ["Due Date"])
+		self.assertEqual(report["error_count"], 1)
+		error = report["errors"][0]
+		self.assertEqual((error["row"], error["column"], error["value"]), (4, 2, "1403-13-01"))
+
+	def test_numbers_are_warnings_and_dates_are_errors(self):
+		with patch(f"{PREFLIGHT}._build_header_map", return_value={"Due Date": "Date", "Qty": "Float"}):
+			report = validate_import_rows(
+				[["Due Date", "Qty"], ["1403-07-10", "abc"], ["1403-13-01", "12"], ["1403-07-11", "۱۲"]],
+				"ToDo",
+			)
+		self.assertEqual((report["error_count"], report["warning_count"]), (1, 1))
+		self.assertEqual(report["errors"][0]["value"], "1403-13-01")
+		warning = report["cell_warnings"][0]
+		self.assertEqual((warning["row"], warning["header"], warning["value"]), (2, "Qty", "abc"))
+
+	def test_start_blocks_only_on_errors(self):
+		data_import = frappe._dict(import_dates_from_jalali=1, reference_doctype="ToDo")
+		report = {"error_count": 0, "errors": [], "warning_count": 3, "cell_warnings": []}
+		with (
+			patch(f"{PREFLIGHT}._get_import_file_path", return_value="/tmp/import.csv"),
+			patch(f"{PREFLIGHT}.iter_import_file_rows"),
+			patch(f"{PREFLIGHT}.validate_import_rows", return_value=report),
+		):
+			validate_before_start(data_import)
+			report.update(
+				error_count=1,
+				errors=[{"row": 2, "column": 1, "header": "Due Date", "value": "x", "message": "bad"}],
+			)
+			with self.assertRaises(frappe.ValidationError):
+				validate_before_start(data_import)
@@ -0,0 +1,27 @@
+# Copyright (c) 2025, Persian Calendar contributors
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support.print_context import jalali_context
+
+
+class TestJalaliPrintContext(FrappeTestCase):
+	def test_parent_dates_are_converted(self):
+		doc = frappe.get_doc({"doctype": "ToDo", "description": "x", "date": "2026-05-13"})
+		j = jalali_context(doc)
+		self.assertEqual(j.date, "1405-02-23")
+
+	def test_child_rows_follow_document_order(self):
+		doc = frappe.get_doc(
+			{
+				"doctype": "User",
+				"email": "jalali-print@example.com",
+				"first_name": "Jalali",
+				"birth_date": "1990-01-02",
+				"roles": [{"role": "System Manager"}, {"role": "Blogger"}],
+			}
+		)
+		j = jalali_context(doc)
+		self.assertEqual(j.birth_date, "1368-10-12")
+		self.assertEqual(len(j.roles), 2)
+		self.assertEqual(jalali_context(None), {})
@@ -0,0 +1,89 @@
+# Copyright (c) 2025, Persian Calendar contributors
+from datetime import datetime
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support import scheduler
+from persian_calendar.jalali_support.scheduler import (
+	AUTO_REPEAT_HANDLER,
+	_last_run_key,
+	run_jalali_schedule,
+	run_scheduled_handler,
+	run_shamsi_auto_repeats,
+)
+
+PERIOD_HANDLER = "app.module.close_period"
+
+
+class TestJalaliSchedulerCatchUp(FrappeTestCase):
+	def setUp(self):
+		frappe.cache().delete_value(scheduler._NEXT_RUN_CACHE_KEY)
+		entries = [("month_end", AUTO_REPEAT_HANDLER, False), ("month_end", PERIOD_HANDLER, True)]
+		for spec, method, _pass_period_end in entries:
+			# last run at the end of Khordad 1403; three month ends missed since
+			frappe.db.set_global(_last_run_key(spec, method), "2024-06-20T00:00:00")
+		patcher = patch.object(scheduler, "get_schedule_entries", return_value=entries)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def _tick(self, **enqueue_kwargs):
+		with (
+			patch.object(scheduler, "now_datetime", return_value=datetime(2024, 9, 25, 12, 0)),
+			patch("frappe.enqueue", **enqueue_kwargs) as enqueue,
+		):
+			run_jalali_schedule()
+		return enqueue
+
+	def _calls(self, enqueue, method):
+		return [call for call in enqueue.call_args_list if call.kwargs["handler"] == method]
+
+	def _last_run(self, method):
+		return frappe.db.get_global(_last_run_key("month_end", method))
+
+	def test_period_handlers_catch_up_every_missed_period(self):
+		calls = self._calls(self._tick(), PERIOD_HANDLER)
+		self.assertEqual(
+			[str(call.kwargs["period_end"]) for call in calls], ["2024-07-21", "2024-08-21", "2024-09-21"]
+		)
+
+	def test_handlers_without_period_run_once(self):
+		calls = self._calls(self._tick(), AUTO_REPEAT_HANDLER)
+		self.assertEqual(len(calls), 1)
+		self.assertNotIn("period_end", calls[0].kwargs)
+		self.assertTrue(calls[0].kwargs["job_id"].endswith("2024-09-21T00:00:00"))
+		# recorded by the job, not when it is enqueued
+		self.assertEqual(self._last_run(AUTO_REPEAT_HANDLER), "2024-06-20T00:00:00")
+		self.assertFalse(self._calls(self._tick(), AUTO_REPEAT_HANDLER))
+
+	def test_last_run_is_recorded_after_the_handler_succeeds(self):
+		with patch("frappe.get_attr") as get_attr:
+			get_attr.return_value.side_effect = RuntimeError
+			with self.assertRaises(RuntimeError):
+				run_scheduled_handler(
+					PERIOD_HANDLER, "month_end", "2024-07-21T00:00:00", period_end="2024-07-21"
+				)
+			self.assertEqual(self._last_run(PERIOD_HANDLER), "2024-06-20T00:00:00")
+
+			get_attr.return_value.side_effect = None
+			run_scheduled_handler(PERIOD_HANDLER, "month_end", "2024-08-21T00:00:00", period_end="2024-08-21")
+			get_attr.return_value.assert_called_with(period_end="2024-08-21")
+			self.assertEqual(self._last_run(PERIOD_HANDLER), "2024-08-21T00:00:00")
+
+			# a late older run does not move the record back
+			run_scheduled_handler(PERIOD_HANDLER, "month_end", "2024-07-21T00:00:00", period_end="2024-07-21")
+			self.assertEqual(self._last_run(PERIOD_HANDLER), "2024-08-21T00:00:00")
+
+	def test_failed_enqueue_is_retried_on_the_next_tick(self):
+		self._tick(side_effect=ConnectionError)
+		self.assertEqual(self._last_run(PERIOD_HANDLER), "2024-06-20T00:00:00")
+		self.assertEqual(len(self._calls(self._tick(), PERIOD_HANDLER)), 3)
+
+
+class TestShamsiAutoRepeats(FrappeTestCase):
+	@patch("frappe.get_all", return_value=["AR-0001", "AR-0002"])
+	def test_one_job_per_auto_repeat(self, _get_all):
+		with patch("frappe.enqueue") as enqueue:
+			run_shamsi_auto_repeats()
+		self.assertEqual([call.kwargs["name"] for call in enqueue.call_args_list], ["AR-0001", "AR-0002"])
@@ -0,0 +1,63 @@
+# Copyright (c) 2025, Persian Calendar contributors
+from datetime import timedelta
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import now_datetime
+
+from persian_calendar.jalali_support.streaming_export import (
+	EXPORT_FILE_MARKER,
+	delete_expired_export_files,
+	get_keyset_order,
+	iter_keyset_pages,
+	open_export_sink,
+	save_export_file,
+)
+
+
+class TestKeysetPages(FrappeTestCase):
+	def setUp(self):
+		# same creation time for several rows exercises the name tiebreaker
+		created = now_datetime() - timedelta(days=3)
+		self.names = []
+		for i in range(7):
+			todo = frappe.get_doc({"doctype": "ToDo", "description": f"_Test keyset {i}"}).insert()
+			if i % 2:
+				frappe.db.set_value("ToDo", todo.name, "creation", created, update_modified=False)
+			self.names.append(todo.name)
+
+	def test_pages_follow_the_doctype_sort(self):
+		filters = {"description": ("like", "_Test keyset %")}
+		field, order = get_keyset_order("ToDo")
+		expected = frappe.get_list(
+			"ToDo", filters=filters, order_by=f"{field} {order}, name {order}", pluck="name"
+		)
+		pages = list(iter_keyset_pages("ToDo", ["name"], filters, page_size=2))
+		self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+		self.assertEqual([row.name for page in pages for row in page], expected)
+		self.assertEqual(sorted(expected), sorted(self.names))
+
+	def test_optional_sort_field_falls_back_to_creation(self):
+		meta = frappe.get_meta("ToDo")
+		meta.sort_field, sort_field = "description", meta.sort_field
+		self.addCleanup(setattr, meta, "sort_field", sort_field)
+		self.assertEqual(get_keyset_order("ToDo")[0], "creation")
+
+
+class TestExportFiles(FrappeTestCase):
+	def _export_file(self):
+		sink = open_export_sink("CSV", "ToDo", "Data Export")
+		sink.writerow(["name"])
+		sink.close()
+		return save_export_file(sink)
+
+	def test_export_files_are_attached_and_expire(self):
+		fresh, old = self._export_file(), self._export_file()
+		self.assertEqual(
+			(fresh.attached_to_doctype, fresh.attached_to_field), ("Data Export", EXPORT_FILE_MARKER)
+		)
+		frappe.db.set_value("File", old.name, "creation", now_datetime() - timedelta(days=2))
+
+		delete_expired_export_files()
+		self.assertTrue(frappe.db.exists("File", fresh.name))
+		self.assertFalse(frappe.db.exists("File", old.name))
@@ -0,0 +1,48 @@
+# Copyright (c) 2025, Persian Calendar contributors
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from persian_calendar.jalali_support import template_cache
+from persian_calendar.jalali_support.template_cache import (
+	clear_template_cache,
+	flush_template_plans,
+	load_template_plans,
+	store_template_plan,
+	warm_template_cache,
+)
+from persian_calendar.utils.template_format import _compile_brace_template
+
+
+class TestTemplateCache(FrappeTestCase):
+	def tearDown(self):
+		clear_template_cache()
+		template_cache._pending_plans.clear()
+
+	def test_plans_round_trip_through_site_cache(self):
+		tpl = "{party} {toshamshi(posting_date, include_time=True)}"
+		plan = _compile_brace_template(tpl)
+		store_template_plan(tpl, plan)
+		self.assertNotIn(tpl, load_template_plans())  # written after the request
+		flush_template_plans()
+		self.assertEqual(load_template_plans()[tpl], plan)
+
+		clear_template_cache()
+		self.assertNotIn(tpl, load_template_plans())
+
+	@patch.object(template_cache, "MAX_PRELOADED_PLANS", 2)
+	def test_writes_stop_at_the_cap(self):
+		for i in range(3):
+			tpl = f"{{party}} {i}"
+			store_template_plan(tpl, _compile_brace_template(tpl))
+		flush_template_plans()
+		self.assertEqual(len(load_template_plans()), 2)
+
+	def test_redis_outage_does_not_disable_warming(self):
+		template_cache._warmed_sites.discard(frappe.local.site)
+		with patch.object(template_cache, "load_template_plans", side_effect=ConnectionError):
+			warm_template_cache()
+		self.assertNotIn(frappe.local.site, template_cache._warmed_sites)
+		warm_template_cache()
+		self.assertIn(frappe.local.site, template_cache._warmed_sites)
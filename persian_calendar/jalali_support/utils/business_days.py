@@ -0,0 +1,101 @@
+# Copyright (c) 2025, Persian Calendar contributors
+# License: MIT
+"""Working-day arithmetic over a Holiday List with Jalali weekly offs.
+
+Each ``(holiday list, weekly offs)`` pair is turned once into a sorted array of the
+ordinals of its business days (days in the list's range that are neither holidays nor
+weekly offs). "N working days after" and "working days between" are then two
+``bisect`` calls instead of a day-by-day loop (see ``persian_calendar.utils.business_days``).
+Indexes are kept in the site Redis cache and dropped whenever a Holiday List is saved or
+deleted.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import frappe
+from frappe import _
+from frappe.utils import getdate
+
+from persian_calendar.jalali_support.calendar_table import get_calendar_table_options
+from persian_calendar.utils.business_days import BusinessDayIndex, build_business_day_index
+
+BUSINESS_DAYS_CACHE_KEY = "persian_calendar:business_day_index"
+
+
+def _weekly_offs(weekly_offs) -> tuple[int, ...]:
+	if weekly_offs is None:
+		return (get_calendar_table_options().week_end,)
+	return tuple(sorted(set(weekly_offs)))
+
+
+def get_business_day_index(holiday_list: str, weekly_offs=None) -> BusinessDayIndex:
+	"""Cached index for *holiday_list*; *weekly_offs* (0=Sun … 6=Sat) default to Jalali Settings ``week_end``."""
+	if not holiday_list:
+		frappe.throw(_("A Holiday List is required for working-day calculations"))
+	offs = _weekly_offs(weekly_offs)
+	cache_key = f"{holiday_list}|{','.join(map(str, offs))}"
+	cache = frappe.cache()
+	cached = cache.hget(BUSINESS_DAYS_CACHE_KEY, cache_key)
+	if cached is not None:
+		return BusinessDayIndex(*cached)
+
+	bounds = frappe.db.get_value("Holiday List", holiday_list, ["from_date", "to_date"])
+	if not bounds:
+		frappe.throw(_("Holiday List {0} not found").format(holiday_list), frappe.DoesNotExistError)
+	holidays = frappe.get_all(
+		"Holiday",
+		filters={"parent": holiday_list, "parenttype": "Holiday List"},
+		pluck="holiday_date",
+	)
+	index = build_business_day_index(
+		getdate(bounds[0]), getdate(bounds[1]), [getdate(day) for day in holidays], offs
+	)
+	cache.hset(BUSINESS_DAYS_CACHE_KEY, cache_key, tuple(index))
+	return index
+
+
+def _check_covered(index: BusinessDayIndex, holiday_list: str, *values: date) -> None:
+	for value in values:
+		if not index.covers(value):
+			frappe.throw(
+				_("{0} is outside the range of Holiday List {1}").format(
+					frappe.format(value, "Date"), holiday_list
+				)
+			)
+
+
+def add_business_days(start, days: int, holiday_list: str, weekly_offs=None) -> date:
+	"""*start* moved by *days* working days (negative moves back)."""
+	start = getdate(start)
+	index = get_business_day_index(holiday_list, weekly_offs)
+	_check_covered(index, holiday_list, start)
+	result = index.add(start, int(days))
+	if result is None:
+		frappe.throw(
+			_("Holiday List {0} does not cover {1} working days from {2}").format(
+				holiday_list, days, frappe.format(start, "Date")
+			)
+		)
+	return result
+
+
+def count_business_days(from_date, to_date, holiday_list: str, weekly_offs=None) -> int:
+	"""Working days from *from_date* to *to_date*, both inclusive."""
+	from_date, to_date = getdate(from_date), getdate(to_date)
+	index = get_business_day_index(holiday_list, weekly_offs)
+	_check_covered(index, holiday_list, from_date, to_date)
+	return index.count(from_date, to_date)
+
+
+def is_business_day(value, holiday_list: str, weekly_offs=None) -> bool:
+	value = getdate(value)
+	index = get_business_day_index(holiday_list, weekly_offs)
+	_check_covered(index, holiday_list, value)
+	return index.is_business_day(value)
+
+
+def clear_business_day_cache(doc=None, method=None) -> None:
+	"""Holiday List on_update / on_trash."""
+	frappe.cache().delete_value(BUSINESS_DAYS_CACHE_KEY)
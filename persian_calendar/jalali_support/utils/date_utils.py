@@ -16,7 +16,7 @@ def j_end_of_month(jdate: jdatetime.date) -> jdatetime.date:
     elif 7 <= m <= 11:
         last = 30
     else:
-        last = 30 if jdatetime.j_isleap(y) else 29
+        last = 30 if jdatetime.date(y, 1, 1).isleap() else 29
     return jdatetime.date(y, m, last)
 
 def is_j_month_end(gdate: dt.date) -> bool:
@@ -32,7 +32,7 @@ def next_j_month_same_day(jdate: jdatetime.date) -> jdatetime.date:
     elif 7 <= m2 <= 11:
         last = 30
     else:
-        last = 30 if jdatetime.j_isleap(y2) else 29
+        last = 30 if jdatetime.date(y2, 1, 1).isleap() else 29
     d2 = min(d, last)
     return jdatetime.date(y2, m2, d2)
 
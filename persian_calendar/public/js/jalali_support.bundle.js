@@ -7,3 +7,4 @@ import "./jalali_support/formatters.js";
 import "./jalali_support/auto_refresh.js";
 import "./jalali_support/data_import_export.js";
 
+import "./jalali_support/holiday_list.js";
@@ -132,16 +132,89 @@ function inject_data_export_jalali_checkbox(frm) {
 	frm._export_dates_as_jalali = frm._export_dates_as_jalali || 0;
 }
 
+/** Parquet / Arrow: native date columns plus derived Jalali int columns (needs pyarrow on the server). */
+function add_columnar_file_types(frm) {
+	const df = frm.fields_dict?.file_type?.df;
+	if (!df) {
+		return;
+	}
+	const options = (df.options || "").split("\n").filter(Boolean);
+	const missing = ["Parquet", "Arrow"].filter((opt) => !options.includes(opt));
+	if (missing.length) {
+		frm.set_df_property("file_type", "options", options.concat(missing).join("\n"));
+	}
+}
+
 function setup_data_export_form() {
 	frappe.ui.form.on("Data Export", {
 		refresh(frm) {
 			inject_data_export_jalali_checkbox(frm);
+			add_columnar_file_types(frm);
 		},
 	});
 }
 
+const PREFLIGHT_API_METHOD = "persian_calendar.jalali_support.import_preflight.preflight_jalali_import";
+
+function preflight_cells_table(cells, message_label) {
+	if (!cells.length) {
+		return "";
+	}
+	const rows = cells
+		.map(
+			(e) =>
+				`<tr><td>${e.row}</td><td>${e.column}</td><td>${frappe.utils.escape_html(e.header)}</td>` +
+				`<td>${frappe.utils.escape_html(e.value)}</td><td>${frappe.utils.escape_html(e.message)}</td></tr>`
+		)
+		.join("");
+	return (
+		`<table class="table table-bordered table-sm"><tr><th>${__("Row")}</th><th>${__("Column")}</th>` +
+		`<th>${__("Header")}</th><th>${__("Value")}</th><th>${message_label}</th></tr>${rows}</table>`
+	);
+}
+
+function show_preflight_report(report) {
+	const warnings = (report.warnings || [])
+		.map((w) => `<p class="text-warning">${frappe.utils.escape_html(w)}</p>`)
+		.join("");
+	let summary = report.error_count
+		? __("{0} invalid cells in {1} rows.", [report.error_count, report.total_rows])
+		: __("All {0} rows passed validation.", [report.total_rows]);
+	if (report.warning_count) {
+		summary += " " + __("{0} cells will be imported as 0.", [report.warning_count]);
+	}
+	frappe.msgprint({
+		title: __("Jalali Import Validation"),
+		indicator: report.error_count ? "red" : report.warning_count ? "orange" : "green",
+		message:
+			`<p>${summary}</p>${warnings}` +
+			preflight_cells_table(report.errors || [], __("Error")) +
+			preflight_cells_table(report.cell_warnings || [], __("Warning")),
+		wide: true,
+	});
+}
+
 function setup_data_import_form() {
-	/* Custom Field import_dates_from_jalali is on the form; no extra JS required. */
+	/* Custom Field import_dates_from_jalali is on the form; add a pre-flight check button. */
+	frappe.ui.form.on("Data Import", {
+		refresh(frm) {
+			if (frm.is_new() || !frm.doc.import_file || !frm.doc.import_dates_from_jalali) {
+				return;
+			}
+			if (frm.doc.status === "Success") {
+				return;
+			}
+			frm.add_custom_button(__("Validate Jalali Dates"), () => {
+				frappe.call({
+					method: PREFLIGHT_API_METHOD,
+					args: { data_import: frm.doc.name },
+					freeze: true,
+					freeze_message: __("Validating import file..."),
+					callback: (r) => r.message && show_preflight_report(r.message),
+				});
+			});
+		},
+	});
 }
 
 function patch_data_exporter_dialog() {
@@ -196,8 +269,56 @@ function patch_data_exporter_dialog() {
 	};
 }
 
+/** Progress / download link for Jalali exports queued in the background. */
+function setup_background_export_listeners() {
+	if (!frappe.realtime || persian_calendar.data_io._export_listeners_ready) {
+		return;
+	}
+	persian_calendar.data_io._export_listeners_ready = true;
+
+	frappe.realtime.on("jalali_export_progress", (data) => {
+		if (!data || !data.total) {
+			return;
+		}
+		frappe.show_progress(
+			__("Exporting {0}", [__(data.doctype)]),
+			data.rows,
+			data.total,
+			__("{0} of {1} records", [data.rows, data.total]),
+			true
+		);
+	});
+
+	frappe.realtime.on("jalali_export_complete", (data) => {
+		frappe.hide_progress();
+		if (!data || !data.file_url) {
+			return;
+		}
+		frappe.msgprint({
+			title: __("Export Ready"),
+			indicator: "green",
+			message: __("Your {0} export is ready: {1}", [
+				__(data.doctype),
+				`<a href="${encodeURI(data.file_url)}" target="_blank">${frappe.utils.escape_html(
+					data.file_name || data.file_url
+				)}</a>`,
+			]),
+		});
+	});
+
+	frappe.realtime.on("jalali_export_failed", (data) => {
+		frappe.hide_progress();
+		frappe.msgprint({
+			title: __("Export Failed"),
+			indicator: "red",
+			message: __("The {0} export failed. See Error Log for details.", [__(data?.doctype || "")]),
+		});
+	});
+}
+
 $(() => {
 	patch_open_url_post_for_data_export();
+	setup_background_export_listeners();
 	setup_data_export_form();
 	setup_data_import_form();
 	patch_data_exporter_dialog();
@@ -0,0 +1,69 @@
+// "Generate Jalali Holidays" on Holiday List (ERPNext / HRMS)
+(function () {
+	const GENERATE_API_METHOD = "persian_calendar.jalali_support.holiday_list.generate_jalali_holiday_list";
+
+	function current_jalali_year() {
+		return window.toJalaliPartsFromGregorianDate(frappe.datetime.str_to_obj(frappe.datetime.get_today())).jy;
+	}
+
+	function show_generate_dialog(frm) {
+		const dialog = new frappe.ui.Dialog({
+			title: __("Generate Jalali Holidays"),
+			fields: [
+				{
+					fieldtype: "Int",
+					fieldname: "jalali_year",
+					label: __("Jalali Year"),
+					reqd: 1,
+					default: current_jalali_year(),
+				},
+				{
+					fieldtype: "Data",
+					fieldname: "weekly_offs",
+					label: __("Weekly Off Days (0=Sun...6=Sat)"),
+					description: __("Comma separated, e.g. 4,5 for Thursday and Friday. Empty uses Jalali Settings Week End."),
+				},
+				{
+					fieldtype: "Check",
+					fieldname: "update_calendar_table",
+					label: __("Mark holidays in Jalali Calendar table"),
+				},
+			],
+			primary_action_label: __("Generate"),
+			primary_action(values) {
+				frappe.call({
+					method: GENERATE_API_METHOD,
+					args: { ...values, holiday_list_name: frm.is_new() ? null : frm.doc.name },
+					freeze: true,
+					callback: (r) => {
+						dialog.hide();
+						if (r.message) {
+							frappe.set_route("Form", "Holiday List", r.message);
+							if (!frm.is_new()) {
+								frm.reload_doc();
+							}
+						}
+					},
+				});
+			},
+		});
+		dialog.show();
+	}
+
+	function init() {
+		if (typeof frappe === "undefined" || !frappe.ui || !frappe.ui.form) {
+			setTimeout(init, 100);
+			return;
+		}
+		frappe.ui.form.on("Holiday List", {
+			refresh(frm) {
+				if (typeof window.toJalaliPartsFromGregorianDate !== "function") {
+					return;
+				}
+				frm.add_custom_button(__("Generate Jalali Holidays"), () => show_generate_dialog(frm));
+			},
+		});
+	}
+
+	init();
+})();
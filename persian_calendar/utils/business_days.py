@@ -0,0 +1,63 @@
+"""Business-day index: the working days of a date range as a sorted array of ordinals.
+
+"N working days after" and "working days between" are ``bisect`` calls on the array
+instead of a day-by-day loop. ``jalali_support.utils.business_days`` builds one per
+Holiday List and caches it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from persian_calendar.utils.jalali_calendar import js_weekday
+
+
+class BusinessDayIndex(NamedTuple):
+	first: int  # ordinal of the first covered day
+	last: int  # ordinal of the last covered day
+	ordinals: tuple[int, ...]  # business days, ascending
+
+	def covers(self, value: date) -> bool:
+		return self.first <= value.toordinal() <= self.last
+
+	def is_business_day(self, value: date) -> bool:
+		ordinal = value.toordinal()
+		i = bisect_left(self.ordinals, ordinal)
+		return i < len(self.ordinals) and self.ordinals[i] == ordinal
+
+	def add(self, start: date, days: int) -> date | None:
+		"""The *days*-th business day after *start* (before it when negative); None past the range."""
+		if not days:
+			return start
+		ordinal = start.toordinal()
+		if days > 0:
+			i = bisect_right(self.ordinals, ordinal) + days - 1
+		else:
+			i = bisect_left(self.ordinals, ordinal) + days
+		if i < 0 or i >= len(self.ordinals):
+			return None
+		return date.fromordinal(self.ordinals[i])
+
+	def count(self, from_date: date, to_date: date) -> int:
+		"""Business days in ``[from_date, to_date]`` (0 when *from_date* is after *to_date*)."""
+		if from_date > to_date:
+			return 0
+		return bisect_right(self.ordinals, to_date.toordinal()) - bisect_left(
+			self.ordinals, from_date.toordinal()
+		)
+
+
+def build_business_day_index(first: date, last: date, holidays, weekly_offs) -> BusinessDayIndex:
+	"""Index of the days in ``[first, last]`` that are not in *holidays* (dates) or *weekly_offs*."""
+	holiday_ordinals = {day.toordinal() for day in holidays}
+	weekly_offs = set(weekly_offs)
+	ordinals = []
+	day = first
+	while day <= last:
+		ordinal = day.toordinal()
+		if ordinal not in holiday_ordinals and js_weekday(day) not in weekly_offs:
+			ordinals.append(ordinal)
+		day += timedelta(days=1)
+	return BusinessDayIndex(first.toordinal(), last.toordinal(), tuple(ordinals))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import partial
 from typing import Any
 
 from persian_calendar.utils.jalali import gregorian_to_jalali_for_export, jalali_import_to_python
@@ -55,3 +56,54 @@ def convert_import_value(value: Any, fieldtype: str | None, enabled: bool) -> An
 		return parsed if parsed is not None else value
 	except Exception:
 		return value
+
+
+def convert_export_values(values: list, fieldtype: str | None) -> list:
+	"""Convert a list of export cells one by one (picklable worker for ``shard_map``)."""
+	return [convert_export_value(value, fieldtype, True) for value in values]
+
+
+def convert_export_column(values: list, fieldtype: str | None, mapper=None) -> list:
+	"""Convert one column of export cells (same *fieldtype*) to Jalali.
+
+	Each distinct value is converted once; repeated dates (posting dates, creation days)
+	are served from a memo. *mapper* (e.g. a configured ``shard_map``) may convert the
+	distinct values across worker processes; it must preserve order.
+	"""
+	distinct = []
+	seen = set()
+	for value in values:
+		if value is None or value == "":
+			continue
+		try:
+			if value in seen:
+				continue
+			seen.add(value)
+		except TypeError:  # unhashable cell, converted inline below
+			continue
+		distinct.append(value)
+
+	worker = partial(convert_export_values, fieldtype=fieldtype)
+	converted = mapper(worker, distinct) if mapper is not None else worker(distinct)
+	memo = dict(zip(distinct, converted, strict=True))
+
+	out = []
+	for value in values:
+		if value is None or value == "":
+			out.append(value)
+			continue
+		try:
+			out.append(memo[value])
+		except (KeyError, TypeError):
+			out.append(convert_export_value(value, fieldtype, True))
+	return out
+
+
+def convert_export_columns(rows: list[list], columns, mapper=None) -> None:
+	"""Convert the ``(index, fieldtype)`` *columns* of *rows* in place, one column at a time."""
+	if not rows:
+		return
+	for index, fieldtype in columns:
+		converted = convert_export_column([row[index] for row in rows], fieldtype, mapper)
+		for row, value in zip(rows, converted, strict=True):
+			row[index] = value
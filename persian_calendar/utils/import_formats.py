@@ -0,0 +1,237 @@
+"""Per-column date format detection and memoized parsing for Jalali Data Import."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from datetime import date, datetime
+from functools import partial
+from typing import Any
+
+from persian_calendar.utils.jalali import normalize_input_text
+
+try:
+	import jdatetime
+except ImportError:  # pragma: no cover
+	jdatetime = None  # type: ignore
+
+JALALI_ISO = "jalali_iso"  # 1403-07-10
+JALALI_SLASH = "jalali_slash"  # 1403/07/10
+GREGORIAN_ISO = "gregorian_iso"  # 2024-10-01
+US = "us"  # 10/01/2024 (month first)
+EU = "eu"  # 01/10/2024 or 01.10.2024 (day first)
+DAY_MONTH_AMBIGUOUS = "ambiguous"  # 01/02/2024 — both readings valid
+
+FORMAT_LABELS = {
+	JALALI_ISO: "Jalali YYYY-MM-DD",
+	JALALI_SLASH: "Jalali YYYY/MM/DD",
+	GREGORIAN_ISO: "Gregorian YYYY-MM-DD",
+	US: "Gregorian MM/DD/YYYY",
+	EU: "Gregorian DD/MM/YYYY",
+}
+
+SAMPLE_SIZE = 200
+
+# Plausible 4-digit years; a cell outside its format's range belongs to another calendar
+JALALI_YEARS = (1200, 1600)
+MIN_GREGORIAN_YEAR = 1700
+
+_TIME = r"(?:[ T]+(\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?"
+_YMD_DASH_RE = re.compile(rf"^(\d{{4}})-(\d{{1,2}})-(\d{{1,2}}){_TIME}$")
+_YMD_SLASH_RE = re.compile(rf"^(\d{{4}})/(\d{{1,2}})/(\d{{1,2}}){_TIME}$")
+_XY_YEAR_RE = re.compile(rf"^(\d{{1,2}})[-/.](\d{{1,2}})[-/.](\d{{4}}){_TIME}$")
+
+
+def normalize_cell(value: Any) -> tuple[str, bool]:
+	"""``(ascii_text, had_persian_input)`` for an import cell (see ``normalize_input_text``)."""
+	text = str(value).strip()
+	ascii_text = normalize_input_text(text)
+	return ascii_text, ascii_text != text
+
+
+def is_plausible_year(year: int, is_jalali: bool) -> bool:
+	if is_jalali:
+		return JALALI_YEARS[0] <= year <= JALALI_YEARS[1]
+	return year >= MIN_GREGORIAN_YEAR
+
+
+def detect_cell_format(text: str) -> str | None:
+	"""Format key for one normalized cell, or ``None`` when no known layout matches."""
+	if m := _YMD_DASH_RE.match(text):
+		year = int(m.group(1))
+		if is_plausible_year(year, True):
+			return JALALI_ISO
+		return GREGORIAN_ISO if is_plausible_year(year, False) else None
+	if m := _YMD_SLASH_RE.match(text):
+		return JALALI_SLASH if is_plausible_year(int(m.group(1)), True) else None
+	if (m := _XY_YEAR_RE.match(text)) and is_plausible_year(int(m.group(3)), False):
+		first, second = int(m.group(1)), int(m.group(2))
+		if first > 12 and second <= 12:
+			return EU
+		if second > 12 and first <= 12:
+			return US
+		if first <= 12 and second <= 12:
+			return EU if "." in text else DAY_MONTH_AMBIGUOUS
+	return None
+
+
+def detect_column_format(values, sample_size: int = SAMPLE_SIZE) -> tuple[str | None, set[str], bool]:
+	"""Sample the first *sample_size* non-empty cells of a column.
+
+	Returns ``(format, formats_seen, persian_digits)``. *format* is ``None`` when the
+	column is empty, mixed, or only holds day/month-ambiguous Gregorian cells.
+	"""
+	seen: set[str] = set()
+	persian = False
+	sampled = 0
+	for value in values:
+		if value is None or value == "" or isinstance(value, date | datetime):
+			continue
+		text, had_persian = normalize_cell(value)
+		persian = persian or had_persian
+		seen.add(detect_cell_format(text) or "unknown")
+		sampled += 1
+		if sampled >= sample_size:
+			break
+
+	formats = seen - {DAY_MONTH_AMBIGUOUS}
+	if DAY_MONTH_AMBIGUOUS in seen and formats <= {US, EU}:
+		# 01/02/2024 cells follow whichever day/month order the rest of the column uses
+		seen.discard(DAY_MONTH_AMBIGUOUS)
+	if len(formats) == 1 and "unknown" not in formats:
+		return next(iter(formats)), seen, persian
+	return None, seen, persian
+
+
+def is_mixed_format(formats_seen: set[str]) -> bool:
+	return len(formats_seen - {DAY_MONTH_AMBIGUOUS}) > 1
+
+
+def _compile(fmt: str) -> tuple[re.Pattern, Callable[[re.Match], tuple[int, int, int]], bool]:
+	"""``(regex, match -> (y, m, d), is_jalali)`` for a detected format."""
+	if fmt in (JALALI_ISO, GREGORIAN_ISO):
+		return _YMD_DASH_RE, lambda m: (int(m.group(1)), int(m.group(2)), int(m.group(3))), fmt == JALALI_ISO
+	if fmt == JALALI_SLASH:
+		return _YMD_SLASH_RE, lambda m: (int(m.group(1)), int(m.group(2)), int(m.group(3))), True
+	if fmt == US:
+		return _XY_YEAR_RE, lambda m: (int(m.group(3)), int(m.group(1)), int(m.group(2))), False
+	if fmt == EU:
+		return _XY_YEAR_RE, lambda m: (int(m.group(3)), int(m.group(2)), int(m.group(1))), False
+	raise ValueError(f"No compiled parser for format {fmt!r}")
+
+
+class ColumnDateParser:
+	"""Parse one Date/Datetime import column with the format detected from a sample.
+
+	Results are memoized per distinct cell string. Cells the compiled parser rejects (other
+	layout, or a year outside the format's calendar) are detected on their own, and their
+	format is added to ``formats_seen``; cells no known layout parses go through *fallback*
+	(the generic per-cell conversion), also memoized. ``parse`` returns ``None`` when no
+	path yields a date.
+	"""
+
+	def __init__(self, fieldtype: str, fmt: str | None, fallback: Callable[[Any], Any] | None = None):
+		self.fieldtype = fieldtype
+		self.format = fmt
+		self.fallback = fallback
+		self.formats_seen: set[str] = {fmt} if fmt else set()
+		self.persian_digits = False
+		self._memo: dict[Any, Any] = {}
+		self._pattern = None
+		if fmt is not None:
+			self._pattern, self._parts, self._is_jalali = _compile(fmt)
+
+	@classmethod
+	def from_values(cls, values, fieldtype: str, fallback: Callable[[Any], Any] | None = None):
+		fmt, seen, persian = detect_column_format(values)
+		parser = cls(fieldtype, fmt, fallback)
+		parser.formats_seen = seen
+		parser.persian_digits = persian
+		return parser
+
+	def prime(self, values, mapper=None) -> None:
+		"""Pre-parse the distinct cells of *values* with the column format (optionally sharded).
+
+		Only cells the compiled parser accepts are memoized; the rest still go through
+		per-cell detection and the fallback lazily in ``parse``.
+		"""
+		if self.format is None:
+			return
+		distinct = [
+			v for v in dict.fromkeys(v for v in values if isinstance(v, str) and v) if v not in self._memo
+		]
+		worker = partial(parse_date_values, fieldtype=self.fieldtype, fmt=self.format)
+		parsed = mapper(worker, distinct) if mapper is not None else worker(distinct)
+		for value, result in zip(distinct, parsed, strict=True):
+			if result is not None:
+				self._memo[value] = result
+
+	@property
+	def is_mixed(self) -> bool:
+		return is_mixed_format(self.formats_seen)
+
+	def parse(self, value: Any) -> date | datetime | None:
+		if value is None or value == "":
+			return None
+		try:
+			return self._memo[value]
+		except KeyError:
+			parsed = self._memo[value] = self._parse(value)
+			return parsed
+		except TypeError:  # unhashable cell
+			return self._parse(value)
+
+	def _parse(self, value: Any) -> date | datetime | None:
+		if isinstance(value, datetime):
+			return value if self.fieldtype == "Datetime" else value.date()
+		if isinstance(value, date):
+			return value
+		text = normalize_cell(value)[0]
+		parsed = self._parse_compiled(text) if self._pattern is not None else None
+		if parsed is None:
+			parsed = self._parse_detected(text)
+		if parsed is None and self.fallback is not None:
+			parsed = self.fallback(value)
+			if not isinstance(parsed, date):
+				parsed = None
+		return parsed
+
+	def _parse_detected(self, text: str) -> date | datetime | None:
+		"""Parse a cell outside the column format by its own layout, recording that layout."""
+		fmt = detect_cell_format(text)
+		self.formats_seen.add(fmt or "unknown")
+		if fmt is None or fmt == DAY_MONTH_AMBIGUOUS or fmt == self.format:
+			return None
+		pattern, parts, is_jalali = _compile(fmt)
+		return self._build(pattern.match(text), parts, is_jalali)
+
+	def _parse_compiled(self, text: str) -> date | datetime | None:
+		m = self._pattern.match(text)
+		if not m or not is_plausible_year(self._parts(m)[0], self._is_jalali):
+			return None
+		return self._build(m, self._parts, self._is_jalali)
+
+	def _build(self, m: re.Match, parts, is_jalali: bool) -> date | datetime | None:
+		y, mo, d = parts(m)
+		try:
+			if is_jalali:
+				if jdatetime is None:
+					return None
+				gdate = jdatetime.date(y, mo, d).togregorian()
+			else:
+				gdate = date(y, mo, d)
+			if self.fieldtype != "Datetime":
+				return gdate
+			h, mi, s = (int(m.group(i)) if m.group(i) else 0 for i in (4, 5, 6))
+			return datetime(gdate.year, gdate.month, gdate.day, h, mi, s)
+		except ValueError:
+			return None
+
+
+def parse_date_values(values: list, fieldtype: str, fmt: str) -> list:
+	"""Parse string *values* with the compiled *fmt* parser only (picklable worker for ``shard_map``).
+
+	Cells outside *fmt* return ``None`` so the column parser detects and records them itself.
+	"""
+	parser = ColumnDateParser(fieldtype, fmt)
+	return [parser._parse_compiled(normalize_cell(value)[0]) for value in values]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from datetime import date, datetime
 from typing import Any
@@ -13,9 +14,29 @@ except ImportError:  # pragma: no cover
 
 _PERSIAN_DIGIT_MAP = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
 
+# Applied once at the front of every parse path: Persian and Arabic-Indic digits to
+# ASCII, Arabic date separator / Persian decimal & thousands marks / dash
+# variants to ASCII, and ZWNJ, ZWJ, bidi marks and isolates removed.
+_INPUT_NORMALIZE_MAP = str.maketrans(
+	{
+		**{ord(ch): str(i) for i, ch in enumerate("۰۱۲۳۴۵۶۷۸۹")},
+		**{ord(ch): str(i) for i, ch in enumerate("٠١٢٣٤٥٦٧٨٩")},
+		"\u060d": "/",  # ARABIC DATE SEPARATOR
+		"\u066b": ".",  # ARABIC DECIMAL SEPARATOR
+		"\u066c": ",",  # ARABIC THOUSANDS SEPARATOR
+		"\u060c": ",",  # ARABIC COMMA
+		"\u2010": "-",
+		"\u2011": "-",
+		"\u2012": "-",
+		"\u2013": "-",
+		"\u2212": "-",
+		**dict.fromkeys(map(ord, "\u200c\u200d\u200e\u200f\u061c\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069\ufeff")),
+	}
+)
+
 _MICROSECOND_RE = re.compile(r"(\d{1,2}:\d{2}:\d{2})\.\d+")
 _DATETIME_RE = re.compile(
-	r"^(\d{4})-(\d{1,2})-(\d{1,2})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$"
+	r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$"
 )
 
 
@@ -26,8 +47,13 @@ def to_persian_digits(value: Any) -> str:
 	return str(value).translate(_PERSIAN_DIGIT_MAP)
 
 
+def normalize_input_text(value: Any) -> str:
+	"""ASCII digits/separators, no ZWNJ or bidi marks — one ``str.translate`` per value."""
+	return str(value).translate(_INPUT_NORMALIZE_MAP).strip()
+
+
 def _strip_microseconds(text: str) -> str:
-	s = text.strip().replace("T", " ")
+	s = normalize_input_text(text).replace("T", " ")
 	return _MICROSECOND_RE.sub(r"\1", s)
 
 
@@ -39,6 +65,33 @@ def _is_likely_gregorian_year(year: int) -> bool:
 	return year >= 1700
 
 
+_DATE_TOKEN_RE = re.compile(r"YYYY|MM|DD")
+_DATETIME_TOKEN_RE = re.compile(r"YYYY|MM|DD|HH|mm|ss")
+_TOKEN_FIELDS = {
+	"YYYY": "{0:04d}",
+	"MM": "{1:02d}",
+	"DD": "{2:02d}",
+	"HH": "{3:02d}",
+	"mm": "{4:02d}",
+	"ss": "{5:02d}",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_jalali_format(fmt: str, include_time: bool = False) -> str:
+	"""``str.format`` pattern for a ``YYYY-MM-DD [HH:mm:ss]`` template, parsed once per *fmt*.
+
+	Positional fields are ``jy, jm, jd, h, mi, s``. With *include_time* and no time tokens
+	in *fmt*, `` HH:mm:ss`` is appended.
+	"""
+	escaped = fmt.replace("{", "{{").replace("}", "}}")
+	token_re = _DATETIME_TOKEN_RE if include_time else _DATE_TOKEN_RE
+	pattern = token_re.sub(lambda m: _TOKEN_FIELDS[m.group(0)], escaped)
+	if include_time and not any(token in fmt for token in ("HH", "mm", "ss")):
+		pattern += " {3:02d}:{4:02d}:{5:02d}"
+	return pattern
+
+
 def _format_jalali_parts(
 	jy: int,
 	jm: int,
@@ -50,21 +103,7 @@ def _format_jalali_parts(
 	include_time: bool = False,
 	fmt: str = "YYYY-MM-DD",
 ) -> str:
-	out = (
-		fmt.replace("YYYY", f"{jy:04d}")
-		.replace("MM", f"{jm:02d}")
-		.replace("DD", f"{jd:02d}")
-	)
-	if include_time:
-		if "HH" in out or "mm" in out or "ss" in out:
-			out = (
-				out.replace("HH", f"{h:02d}")
-				.replace("mm", f"{mi:02d}")
-				.replace("ss", f"{s:02d}")
-			)
-		else:
-			out = f"{out} {h:02d}:{mi:02d}:{s:02d}"
-	return out
+	return _compile_jalali_format(fmt, include_time).format(jy, jm, jd, h, mi, s)
 
 
 def _parse_to_parts(value: Any) -> tuple[int, int, int, int, int, int, bool] | None:
@@ -85,7 +124,11 @@ def _parse_to_parts(value: Any) -> tuple[int, int, int, int, int, int, bool] | N
 	if isinstance(value, date):
 		return (value.year, value.month, value.day, 0, 0, 0, False)
 
-	text = _strip_microseconds(str(value))
+	return _parse_text_parts(_strip_microseconds(str(value)))
+
+
+def _parse_text_parts(text: str) -> tuple[int, int, int, int, int, int, bool] | None:
+	"""``_parse_to_parts`` for text already passed through ``_strip_microseconds``."""
 	m = _DATETIME_RE.match(text)
 	if not m:
 		return None
@@ -180,14 +223,20 @@ def coerce_gregorian_datetime(value: Any) -> str | None:
 	if value is None or value == "":
 		return None
 
-	g = jalali_to_gregorian_datetime(value)
+	if isinstance(value, str):
+		value = _strip_microseconds(value)
+		if not value:
+			return None
+		g = _parts_to_gregorian(_parse_text_parts(value), " " in value)
+	else:
+		g = jalali_to_gregorian_datetime(value)
 	if g:
 		return g
 
 	try:
 		from frappe.utils import get_datetime, getdate
 
-		if isinstance(value, str) and " " not in _strip_microseconds(value):
+		if isinstance(value, str) and " " not in value:
 			d = getdate(value)
 			return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
 		dt = get_datetime(value)
@@ -205,14 +254,18 @@ def jalali_to_gregorian_datetime(value: Any) -> str | None:
 	if value is None or value == "":
 		return None
 
-	parts = _parse_to_parts(value)
-	if not parts:
+	if isinstance(value, date):
+		return _parts_to_gregorian(_parse_to_parts(value), False)
+	text = _strip_microseconds(str(value))
+	return _parts_to_gregorian(_parse_text_parts(text), isinstance(value, str) and " " in text)
+
+
+def _parts_to_gregorian(parts, text_has_time: bool) -> str | None:
+	if not parts or jdatetime is None:
 		return None
 
 	y, mo, d, h, mi, s, is_jalali = parts
-	has_time = h or mi or s or (
-		isinstance(value, str) and " " in _strip_microseconds(str(value))
-	)
+	has_time = h or mi or s or text_has_time
 
 	if is_jalali:
 		gdate = jdatetime.date(y, mo, d).togregorian()
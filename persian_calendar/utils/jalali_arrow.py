@@ -0,0 +1,76 @@
+"""Vectorized Gregorian -> Jalali parts for Arrow arrays (optional pyarrow dependency)."""
+
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+
+from persian_calendar.utils.jalali_calendar import jalali_month_table, to_jalali_ym
+
+try:
+	import pyarrow as pa
+	import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+	pa = pc = None  # type: ignore
+
+LOOKUP_FIRST = date(1900, 1, 1)
+LOOKUP_LAST = date(2100, 12, 31)
+_EPOCH = date(1970, 1, 1)
+
+# Derived column suffix -> (lookup key, Arrow type name)
+JALALI_PART_COLUMNS = (
+	("jy", "int16"),
+	("jm", "int8"),
+	("jd", "int8"),
+	("jalali_period", "int32"),  # jy * 100 + jm, same as Jalali Calendar.jalali_year_month
+)
+
+
+def require_pyarrow() -> None:
+	if pa is None:
+		raise ImportError(
+			"pyarrow is required for Parquet/Arrow exports; install it with `bench pip install pyarrow`."
+		)
+
+
+@lru_cache(maxsize=1)
+def _jalali_lookup() -> tuple[int, int, dict]:
+	"""``(first_day, last_day, arrays)``: day numbers (since 1970-01-01) and per-day part arrays."""
+	require_pyarrow()
+	jy_list, jm_list, jd_list, period_list = [], [], [], []
+	first_jy, _ = to_jalali_ym(LOOKUP_FIRST)
+	last_jy, _ = to_jalali_ym(LOOKUP_LAST)
+	for jy in range(first_jy, last_jy + 1):
+		for jm, first, last in jalali_month_table(jy):
+			if last < LOOKUP_FIRST or first > LOOKUP_LAST:
+				continue
+			days = (last - first).days + 1
+			skip = max((LOOKUP_FIRST - first).days, 0)
+			keep = days - skip - max((last - LOOKUP_LAST).days, 0)
+			jy_list.extend([jy] * keep)
+			jm_list.extend([jm] * keep)
+			jd_list.extend(range(skip + 1, skip + keep + 1))
+			period_list.extend([jy * 100 + jm] * keep)
+	first_day = (LOOKUP_FIRST - _EPOCH).days
+	arrays = {
+		"jy": pa.array(jy_list, type=pa.int16()),
+		"jm": pa.array(jm_list, type=pa.int8()),
+		"jd": pa.array(jd_list, type=pa.int8()),
+		"jalali_period": pa.array(period_list, type=pa.int32()),
+	}
+	return first_day, first_day + len(jy_list) - 1, arrays
+
+
+def jalali_part_arrays(values) -> dict:
+	"""Jalali ``jy`` / ``jm`` / ``jd`` / ``jalali_period`` arrays for a date32 or timestamp array.
+
+	One ``pc.take`` per part over a precomputed day table (1900-2100); nulls and dates
+	outside the table come back as null.
+	"""
+	first_day, last_day, lookup = _jalali_lookup()
+	if pa.types.is_timestamp(values.type):
+		values = pc.cast(values, pa.date32())
+	days = pc.cast(values, pa.int32())
+	in_range = pc.and_(pc.greater_equal(days, first_day), pc.less_equal(days, last_day))
+	indices = pc.if_else(in_range, pc.subtract(days, first_day), pa.scalar(None, pa.int32()))
+	return {suffix: pc.take(lookup[suffix], indices) for suffix, _ in JALALI_PART_COLUMNS}
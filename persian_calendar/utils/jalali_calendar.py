@@ -0,0 +1,244 @@
+"""Precomputed Jalali month tables and period builders (no Frappe dependency)."""
+
+from __future__ import annotations
+
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+
+from persian_calendar.utils.jalali import normalize_input_text
+
+try:
+	import jdatetime
+except ImportError:  # pragma: no cover
+	jdatetime = None  # type: ignore
+
+# fmt: off
+JALALI_MONTH_NAMES = (
+	"فروردین", "اردیبهشت", "خرداد",
+	"تیر", "مرداد", "شهریور",
+	"مهر", "آبان", "آذر",
+	"دی", "بهمن", "اسفند",
+)
+
+# ASCII month names for report column keys / fieldnames
+JALALI_MONTH_KEYS = (
+	"farvardin", "ordibehesht", "khordad",
+	"tir", "mordad", "shahrivar",
+	"mehr", "aban", "azar",
+	"dey", "bahman", "esfand",
+)
+# fmt: on
+
+PERIODICITY_MONTHS = {"Yearly": 12, "Half-Yearly": 6, "Quarterly": 3, "Monthly": 1}
+
+
+def _require_jdatetime() -> None:
+	if jdatetime is None:
+		raise ImportError(
+			"jdatetime is required for Jalali calendar tables; install persian_calendar dependencies."
+		)
+
+
+@lru_cache(maxsize=512)
+def jalali_month_table(jy: int) -> tuple[tuple[int, date, date], ...]:
+	"""``(jm, first_gregorian_day, last_gregorian_day)`` for the 12 months of Jalali year *jy*."""
+	_require_jdatetime()
+	starts = [jdatetime.date(jy, jm, 1).togregorian() for jm in range(1, 13)]
+	starts.append(jdatetime.date(jy + 1, 1, 1).togregorian())
+	return tuple((jm, starts[jm - 1], starts[jm] - timedelta(days=1)) for jm in range(1, 13))
+
+
+def jalali_month_bounds(jy: int, jm: int) -> tuple[date, date]:
+	"""Gregorian first/last day of Jalali month *jm* of year *jy*."""
+	_, first, last = jalali_month_table(jy)[jm - 1]
+	return first, last
+
+
+def to_jalali_ym(value: date) -> tuple[int, int]:
+	_require_jdatetime()
+	j = jdatetime.date.fromgregorian(date=value)
+	return j.year, j.month
+
+
+def iter_jalali_months(start: date, end: date):
+	"""Yield ``(jy, jm, from_date, to_date)`` for Jalali months overlapping *start*..*end* (clipped)."""
+	if end < start:
+		return
+	jy, jm = to_jalali_ym(start)
+	while True:
+		first, last = jalali_month_bounds(jy, jm)
+		if first > end:
+			return
+		yield jy, jm, max(first, start), min(last, end)
+		jm += 1
+		if jm > 12:
+			jy, jm = jy + 1, 1
+
+
+def build_jalali_periods(start: date, end: date, periodicity: str) -> list[dict]:
+	"""Split *start*..*end* into Jalali month / quarter / half-year / year periods.
+
+	Each period is a dict with ``from_date``, ``to_date`` (Gregorian) and the Jalali
+	``from_ym`` / ``to_ym`` tuples. Groups are counted from the Jalali month of *start*,
+	so a fiscal year starting 1 Farvardin yields Farvardin-Khordad, Tir-Shahrivar, …
+	"""
+	months_per_period = PERIODICITY_MONTHS[periodicity]
+	periods: list[dict] = []
+	for i, (jy, jm, first, last) in enumerate(iter_jalali_months(start, end)):
+		if i % months_per_period == 0:
+			periods.append({"from_date": first, "to_date": last, "from_ym": (jy, jm), "to_ym": (jy, jm)})
+		else:
+			periods[-1]["to_date"] = last
+			periods[-1]["to_ym"] = (jy, jm)
+	return periods
+
+
+def jalali_period_key(ym: tuple[int, int]) -> str:
+	"""ASCII key for the Jalali month *ym*, e.g. ``mehr_1403``."""
+	jy, jm = ym
+	return f"{JALALI_MONTH_KEYS[jm - 1]}_{jy}"
+
+
+def js_weekday(value: date) -> int:
+	"""Weekday in the Jalali Settings convention (0=Sun … 6=Sat)."""
+	return (value.weekday() + 1) % 7
+
+
+def iter_calendar_days(
+	from_jy: int,
+	to_jy: int,
+	*,
+	week_start: int = 6,
+	week_end: int = 5,
+	fiscal_year_start_month: int = 1,
+):
+	"""Yield one dimension row per day of Jalali years *from_jy*..*to_jy* (inclusive).
+
+	Row keys: ``gregorian_date``, ``jalali_date``, ``jalali_year``, ``jalali_month``,
+	``jalali_day``, ``jalali_year_month`` (e.g. 140307), ``day_of_year``, ``weekday``,
+	``iso_year``, ``iso_week``, ``jalali_week`` (weeks start on *week_start*, week 1 holds
+	1 Farvardin), ``quarter``, ``fiscal_year``, ``fiscal_period`` and ``is_holiday``
+	(weekly off on *week_end*).
+	"""
+	for jy in range(from_jy, to_jy + 1):
+		table = jalali_month_table(jy)
+		year_first = table[0][1]
+		week_offset = (js_weekday(year_first) - week_start) % 7
+		for jm, first, last in table:
+			if jm >= fiscal_year_start_month:
+				fiscal_year, fiscal_period = jy, jm - fiscal_year_start_month + 1
+			else:
+				fiscal_year, fiscal_period = jy - 1, jm + 13 - fiscal_year_start_month
+			for jd in range(1, (last - first).days + 2):
+				gdate = first + timedelta(days=jd - 1)
+				day_of_year = (gdate - year_first).days + 1
+				iso_year, iso_week, _ = gdate.isocalendar()
+				weekday = js_weekday(gdate)
+				yield {
+					"gregorian_date": gdate,
+					"jalali_date": f"{jy:04d}-{jm:02d}-{jd:02d}",
+					"jalali_year": jy,
+					"jalali_month": jm,
+					"jalali_day": jd,
+					"jalali_year_month": jy * 100 + jm,
+					"day_of_year": day_of_year,
+					"weekday": weekday,
+					"iso_year": iso_year,
+					"iso_week": iso_week,
+					"jalali_week": (day_of_year - 1 + week_offset) // 7 + 1,
+					"quarter": (jm - 1) // 3 + 1,
+					"fiscal_year": fiscal_year,
+					"fiscal_period": fiscal_period,
+					"is_holiday": 1 if weekday == week_end else 0,
+				}
+
+
+def jalali_year_bounds(jy: int) -> tuple[date, date]:
+	table = jalali_month_table(jy)
+	return table[0][1], table[-1][2]
+
+
+def jalali_week_bounds(jy: int, week: int, week_start: int = 6) -> tuple[date, date]:
+	"""Week *week* of Jalali year *jy* (week 1 holds 1 Farvardin), clipped to the year."""
+	year_first, year_last = jalali_year_bounds(jy)
+	week_one = year_first - timedelta(days=(js_weekday(year_first) - week_start) % 7)
+	start = week_one + timedelta(days=7 * (week - 1))
+	end = start + timedelta(days=6)
+	if week < 1 or start > year_last:
+		raise ValueError(f"Week {week} is outside Jalali year {jy}")
+	return max(start, year_first), min(end, year_last)
+
+
+def _shift_months(jy: int, jm: int, months: int) -> tuple[int, int]:
+	index = jy * 12 + (jm - 1) + months
+	return index // 12, index % 12 + 1
+
+
+_MONTH_NAME_LOOKUP = {
+	**{name: i + 1 for i, name in enumerate(JALALI_MONTH_NAMES)},
+	**{key: i + 1 for i, key in enumerate(JALALI_MONTH_KEYS)},
+	"dei": 10,
+}
+
+_YEAR_RE = re.compile(r"^(\d{4})$")
+_MONTH_RE = re.compile(r"^(\d{4})[-/](\d{1,2})$")
+_QUARTER_RE = re.compile(r"^(?:(\d{4})\s*[-/ ]?\s*Q([1-4])|Q([1-4])\s*[-/ ]?\s*(\d{4}))$", re.I)
+_HALF_RE = re.compile(r"^(\d{4})\s*[-/ ]?\s*H([12])$", re.I)
+_WEEK_RE = re.compile(r"^(\d{4})\s*[-/ ]?\s*W(\d{1,2})$", re.I)
+_NAMED_MONTH_RE = re.compile(r"^(\S+)\s*[-/ ]\s*(\d{4})$")
+_RELATIVE_RE = re.compile(
+	r"^(this|current|last|previous|next)\s+(?:jalali\s+)?(week|month|quarter|half[- ]?year|year)$", re.I
+)
+
+
+def jalali_period_range(spec: str, *, today: date | None = None, week_start: int = 6) -> tuple[date, date]:
+	"""Gregorian ``(from_date, to_date)`` for a Jalali period spec (both inclusive).
+
+	Accepted specs: ``1403``, ``1403-07`` / ``1403/7``, ``Mehr 1403`` / ``مهر 1403``,
+	``1403-Q3`` / ``Q3 1403``, ``1403-H1``, ``1403-W12`` (weeks start on *week_start*) and
+	relative ``this|last|next [jalali] week|month|quarter|half-year|year``.
+	Raises ``ValueError`` for anything else.
+	"""
+	text = " ".join(normalize_input_text(spec or "").split())
+	if not text:
+		raise ValueError("Empty Jalali period")
+
+	if m := _YEAR_RE.match(text):
+		return jalali_year_bounds(int(m.group(1)))
+	if m := _MONTH_RE.match(text):
+		jm = int(m.group(2))
+		if not 1 <= jm <= 12:
+			raise ValueError(f"Invalid Jalali month: {text}")
+		return jalali_month_bounds(int(m.group(1)), jm)
+	if m := _QUARTER_RE.match(text):
+		jy, q = (m.group(1), m.group(2)) if m.group(1) else (m.group(4), m.group(3))
+		return _month_span(int(jy), (int(q) - 1) * 3 + 1, 3)
+	if m := _HALF_RE.match(text):
+		return _month_span(int(m.group(1)), (int(m.group(2)) - 1) * 6 + 1, 6)
+	if m := _WEEK_RE.match(text):
+		return jalali_week_bounds(int(m.group(1)), int(m.group(2)), week_start)
+	if m := _NAMED_MONTH_RE.match(text):
+		jm = _MONTH_NAME_LOOKUP.get(m.group(1).lower())
+		if jm:
+			return jalali_month_bounds(int(m.group(2)), jm)
+	if m := _RELATIVE_RE.match(text):
+		return _relative_range(m.group(1).lower(), m.group(2).lower(), today or date.today(), week_start)
+	raise ValueError(f"Unrecognised Jalali period: {text}")
+
+
+def _month_span(jy: int, first_month: int, months: int) -> tuple[date, date]:
+	last_y, last_m = _shift_months(jy, first_month, months - 1)
+	return jalali_month_bounds(jy, first_month)[0], jalali_month_bounds(last_y, last_m)[1]
+
+
+def _relative_range(which: str, unit: str, today: date, week_start: int) -> tuple[date, date]:
+	step = {"last": -1, "previous": -1, "next": 1}.get(which, 0)
+	if unit == "week":
+		start = today - timedelta(days=(js_weekday(today) - week_start) % 7) + timedelta(days=7 * step)
+		return start, start + timedelta(days=6)
+
+	jy, jm = to_jalali_ym(today)
+	months = {"month": 1, "quarter": 3, "year": 12}.get(unit, 6)
+	first_y, first_m = _shift_months(jy, ((jm - 1) // months) * months + 1, months * step)
+	return _month_span(first_y, first_m, months)
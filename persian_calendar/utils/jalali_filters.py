@@ -0,0 +1,22 @@
+"""Jinja filters for Jalali/Shamsi display (``{{ doc.posting_date | shamsi }}``)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from persian_calendar.utils.jalali import to_persian_digits, toshamshi
+
+
+def shamsi(value: Any, format: str = "YYYY-MM-DD", persian_digits: bool = False) -> str:
+	"""``toshamshi(value)`` as a filter: Jalali date only."""
+	return toshamshi(value, include_time=False, format=format, persian_digits=persian_digits)
+
+
+def shamsi_datetime(value: Any, format: str = "YYYY-MM-DD", persian_digits: bool = False) -> str:
+	"""``toshamshi(value, include_time=True)`` as a filter."""
+	return toshamshi(value, include_time=True, format=format, persian_digits=persian_digits)
+
+
+def persian_digits(value: Any) -> str:
+	"""ASCII digits to Persian digits (``{{ doc.name | persian_digits }}``)."""
+	return to_persian_digits(value)
@@ -0,0 +1,194 @@
+"""Official Iranian holidays per Jalali year: fixed solar dates plus a bundled lunar table.
+
+Lunar (Hijri) holidays move ~11 days a year, so their Gregorian dates are precomputed into
+``lunar_holidays.json`` instead of being converted at runtime. The table starts from Umm
+al-Qura (via ``hijridate``) and moves the Hijri months whose start in Iran's official
+calendar is known to differ (``IRAN_MONTH_START_SHIFTS``); regenerate the file with::
+
+	python -m persian_calendar.utils.jalali_holidays
+
+Iran fixes each month by moon sighting, so other years can still be a day off. Callers can
+pass per-year *overrides* (``{description: iso_date or [iso_date, ...]}``) for those.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, timedelta
+from functools import lru_cache
+
+from persian_calendar.utils.jalali_calendar import jalali_month_table, jalali_year_bounds, js_weekday
+
+LUNAR_TABLE_PATH = os.path.join(os.path.dirname(__file__), "lunar_holidays.json")
+LUNAR_TABLE_YEARS = (1380, 1430)  # Jalali years covered by the bundled table
+
+# (jalali month, day, description)
+SOLAR_HOLIDAYS = (
+	(1, 1, "Nowruz"),
+	(1, 2, "Nowruz"),
+	(1, 3, "Nowruz"),
+	(1, 4, "Nowruz"),
+	(1, 12, "Islamic Republic Day"),
+	(1, 13, "Nature Day (Sizdah Bedar)"),
+	(3, 14, "Demise of Imam Khomeini"),
+	(3, 15, "15 Khordad Uprising"),
+	(11, 22, "Victory of the Islamic Revolution"),
+	(12, 29, "Oil Industry Nationalization Day"),
+)
+
+# (hijri month, day, description); day 0 = last day of the month
+LUNAR_HOLIDAYS = (
+	(1, 9, "Tasua"),
+	(1, 10, "Ashura"),
+	(2, 20, "Arbaeen"),
+	(2, 28, "Demise of the Prophet and Martyrdom of Imam Hassan"),
+	(2, 0, "Martyrdom of Imam Reza"),
+	(3, 8, "Martyrdom of Imam Hassan Askari"),
+	(3, 17, "Birth of the Prophet and Imam Sadiq"),
+	(6, 3, "Martyrdom of Fatimah"),
+	(7, 13, "Birth of Imam Ali"),
+	(7, 27, "Mab'ath"),
+	(8, 15, "Birth of Imam Mahdi"),
+	(9, 21, "Martyrdom of Imam Ali"),
+	(10, 1, "Eid al-Fitr"),
+	(10, 2, "Eid al-Fitr holiday"),
+	(10, 25, "Martyrdom of Imam Sadiq"),
+	(12, 10, "Eid al-Adha"),
+	(12, 18, "Eid al-Ghadir"),
+)
+
+
+# (hijri year, hijri month): days the month starts after Umm al-Qura in Iran's official calendar
+IRAN_MONTH_START_SHIFTS = {
+	(1446, 9): 1,  # Ramadan: 21 Ramadan on 2 Farvardin 1404
+	(1446, 10): 1,  # Shawwal: Eid al-Fitr on 11 Farvardin 1404
+	(1447, 1): 1,  # Muharram: Tasua / Ashura on 14-15 Tir 1404
+}
+
+
+def solar_holidays(jy: int) -> list[tuple[date, str]]:
+	table = jalali_month_table(jy)
+	out = []
+	for jm, jd, description in SOLAR_HOLIDAYS:
+		first, last = table[jm - 1][1], table[jm - 1][2]
+		gdate = first + timedelta(days=jd - 1)
+		if gdate <= last:  # 29/30 Esfand only in the years that have it
+			out.append((gdate, description))
+	return out
+
+
+@lru_cache(maxsize=1)
+def _lunar_table() -> dict[str, list]:
+	with open(LUNAR_TABLE_PATH, encoding="utf-8") as f:
+		return json.load(f)["holidays"]
+
+
+def has_lunar_holidays(jy: int) -> bool:
+	return str(jy) in _lunar_table()
+
+
+def lunar_holidays(jy: int, overrides=()) -> list[tuple[date, str]]:
+	"""Lunar holidays falling in Jalali year *jy* (empty outside the bundled table).
+
+	*overrides* (a mapping or ``(description, dates)`` pairs) replaces every bundled date of
+	a description with the given ISO date or list of ISO dates.
+	"""
+	overrides = dict(overrides)
+	out = [
+		(date.fromisoformat(gdate), description)
+		for gdate, description in _lunar_table().get(str(jy), [])
+		if description not in overrides
+	]
+	for description, gdates in overrides.items():
+		for gdate in [gdates] if isinstance(gdates, str) else gdates:
+			out.append((date.fromisoformat(gdate), description))
+	return sorted(out)
+
+
+def weekly_off_dates(jy: int, weekly_offs) -> list[date]:
+	"""Days of Jalali year *jy* whose weekday (0=Sun … 6=Sat) is in *weekly_offs*."""
+	weekly_offs = set(weekly_offs)
+	first, last = jalali_year_bounds(jy)
+	return [
+		first + timedelta(days=offset)
+		for offset in range((last - first).days + 1)
+		if js_weekday(first + timedelta(days=offset)) in weekly_offs
+	]
+
+
+@lru_cache(maxsize=64)
+def jalali_year_holidays(
+	jy: int, weekly_offs: tuple[int, ...] = (5,), lunar_overrides: tuple = ()
+) -> tuple[tuple[date, str, bool], ...]:
+	"""``(date, description, weekly_off)`` for Jalali year *jy*, one row per date, sorted.
+
+	Official holidays that fall on a weekly off keep their description and are not flagged
+	``weekly_off``; two holidays on one date share a row (``"Nowruz / Ashura"``).
+	*lunar_overrides* are ``(description, dates)`` pairs for :func:`lunar_holidays`.
+	"""
+	official: dict[date, list[str]] = {}
+	for gdate, description in solar_holidays(jy) + lunar_holidays(jy, lunar_overrides):
+		descriptions = official.setdefault(gdate, [])
+		if description not in descriptions:
+			descriptions.append(description)
+
+	rows = {gdate: (gdate, " / ".join(descriptions), False) for gdate, descriptions in official.items()}
+	for gdate in weekly_off_dates(jy, weekly_offs):
+		rows.setdefault(gdate, (gdate, "Weekly Off", True))
+	return tuple(rows[gdate] for gdate in sorted(rows))
+
+
+def _hijri_month_start(hy: int, hm: int) -> date:
+	"""First day of Hijri month *hm* of *hy* in Iran: Umm al-Qura plus the known shift."""
+	from hijridate import Hijri
+
+	if hm > 12:
+		hy, hm = hy + 1, 1
+	start = date(*Hijri(hy, hm, 1).to_gregorian().datetuple())
+	return start + timedelta(days=IRAN_MONTH_START_SHIFTS.get((hy, hm), 0))
+
+
+def build_lunar_holiday_table(from_jy: int, to_jy: int) -> dict[str, list]:
+	"""``{jalali_year: [[gregorian_iso, description], ...]}`` computed with ``hijridate``."""
+	from hijridate import Gregorian
+
+	first = jalali_year_bounds(from_jy)[0]
+	last = jalali_year_bounds(to_jy)[1]
+	first_hy = Gregorian.fromdate(first).to_hijri().year
+	last_hy = Gregorian.fromdate(last).to_hijri().year
+
+	by_year: dict[str, list] = {}
+	year_starts = [(jy, jalali_year_bounds(jy)[0]) for jy in range(from_jy, to_jy + 2)]
+	for hy in range(first_hy, last_hy + 1):
+		for hm, hd, description in LUNAR_HOLIDAYS:
+			if hd:
+				gdate = _hijri_month_start(hy, hm) + timedelta(days=hd - 1)
+			else:
+				gdate = _hijri_month_start(hy, hm + 1) - timedelta(days=1)
+			if not first <= gdate <= last:
+				continue
+			jy = max(year for year, start in year_starts if start <= gdate)
+			by_year.setdefault(str(jy), []).append([gdate.isoformat(), description])
+	for rows in by_year.values():
+		rows.sort()
+	return by_year
+
+
+def write_lunar_holiday_table(
+	path: str = LUNAR_TABLE_PATH, years: tuple[int, int] = LUNAR_TABLE_YEARS
+) -> None:
+	from importlib.metadata import version
+
+	holidays = build_lunar_holiday_table(*years)
+	# one line per Jalali year keeps the bundled file small and diffable
+	lines = [f'\t\t"{jy}": {json.dumps(rows, ensure_ascii=False)}' for jy, rows in sorted(holidays.items())]
+	with open(path, "w", encoding="utf-8") as f:
+		f.write("{\n")
+		f.write(f'\t"source": "hijridate {version("hijridate")} (Umm al-Qura, Iran month start shifts)",\n')
+		f.write(f'\t"jalali_years": {json.dumps(list(years))},\n')
+		f.write('\t"holidays": {\n' + ",\n".join(lines) + "\n\t}\n}\n")
+
+
+if __name__ == "__main__":
+	write_lunar_holiday_table()
@@ -0,0 +1,75 @@
+"""Jalali period-end schedule specs and their run times (no Frappe dependency).
+
+A spec is ``<period>[@HH:MM]`` where period is ``month_end``, ``quarter_end`` (end of
+Khordad, Shahrivar, Azar, Esfand) or ``year_end`` (last day of Esfand); the time defaults
+to ``00:00``. ``"month_end@23:00"`` runs on the last day of each Jalali month at 23:00.
+Run times are naive datetimes in whatever timezone the caller uses (the site timezone).
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import NamedTuple
+
+from persian_calendar.utils.jalali_calendar import jalali_month_table, to_jalali_ym
+
+PERIOD_MONTHS = {"month_end": 1, "quarter_end": 3, "year_end": 12}
+
+_SPEC_RE = re.compile(r"^(month_end|quarter_end|year_end)(?:@(\d{1,2}):(\d{2}))?$")
+
+
+class JalaliSpec(NamedTuple):
+	period: str
+	hour: int = 0
+	minute: int = 0
+
+
+@lru_cache(maxsize=128)
+def parse_jalali_spec(spec: str) -> JalaliSpec:
+	m = _SPEC_RE.match((spec or "").strip().lower())
+	if not m:
+		raise ValueError(f"Invalid Jalali schedule spec: {spec!r} (expected e.g. 'month_end@23:00')")
+	hour, minute = int(m.group(2) or 0), int(m.group(3) or 0)
+	if hour > 23 or minute > 59:
+		raise ValueError(f"Invalid time in Jalali schedule spec: {spec!r}")
+	return JalaliSpec(m.group(1), hour, minute)
+
+
+@lru_cache(maxsize=512)
+def period_end_days(period: str, jy: int) -> tuple[date, ...]:
+	"""Gregorian last days of the *period* ends in Jalali year *jy*."""
+	step = PERIOD_MONTHS[period]
+	return tuple(last for jm, _first, last in jalali_month_table(jy) if jm % step == 0)
+
+
+def _year_runs(spec: JalaliSpec, jy: int) -> list[datetime]:
+	at = time(spec.hour, spec.minute)
+	return [datetime.combine(day, at) for day in period_end_days(spec.period, jy)]
+
+
+def runs_between(spec: str, after: datetime, until: datetime) -> list[datetime]:
+	"""Run times of *spec* in ``(after, until]``, oldest first (missed periods to catch up)."""
+	parsed = parse_jalali_spec(spec)
+	if until <= after:
+		return []
+	first_jy = to_jalali_ym(after.date())[0]
+	last_jy = to_jalali_ym(until.date())[0]
+	return [
+		run_at
+		for jy in range(first_jy, last_jy + 1)
+		for run_at in _year_runs(parsed, jy)
+		if after < run_at <= until
+	]
+
+
+def next_run(spec: str, after: datetime) -> datetime:
+	"""First run time of *spec* strictly after *after*."""
+	parsed = parse_jalali_spec(spec)
+	jy = to_jalali_ym(after.date())[0]
+	while True:
+		for run_at in _year_runs(parsed, jy):
+			if run_at > after:
+				return run_at
+		jy += 1
@@ -0,0 +1,38 @@
+"""Shard large column conversions across worker processes (no Frappe dependency)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+SHARDS_PER_WORKER = 4
+
+
+def shard_map(
+	func: Callable[[list], list], values: Sequence, *, workers: int = 0, threshold: int = 0
+) -> list:
+	"""Return ``func(values)``, splitting *values* across *workers* processes when large.
+
+	*func* takes a list and returns a list of the same length; it must be a picklable
+	module-level callable (or ``functools.partial`` of one). Below *threshold* values, or
+	with fewer than two workers, everything runs in-process. Shards are contiguous and
+	results are concatenated in submission order, so the output is identical either way.
+	If the pool cannot start or a worker dies, the column is converted in-process.
+	"""
+	values = list(values)
+	if workers < 2 or threshold <= 0 or len(values) < threshold:
+		return func(values)
+
+	shard_count = workers * SHARDS_PER_WORKER
+	size = -(-len(values) // shard_count)
+	shards = [values[i : i + size] for i in range(0, len(values), size)]
+	try:
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			out = []
+			for result in executor.map(func, shards):
+				out.extend(result)
+			return out
+	except (BrokenProcessPool, PicklingError, OSError):
+		return func(values)
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+import string
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from persian_calendar.utils.jalali import toshamshi
 
@@ -47,6 +50,153 @@ def expand_toshamshi_placeholders(template: str, context: dict[str, Any]) -> str
 	return _TOSHAMSHI_PLACEHOLDER_RE.sub(_replace, template)
 
 
+_PLAIN_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_FIELD_KEY_RE = re.compile(r"[.\[]")
+_FORMATTER = string.Formatter()
+_MISSING = object()
+
+# Render plan segment kinds
+_LITERAL = 0  # (kind, text)
+_FIELD = 1  # (kind, key) — plain {key}
+_FORMATTED = 2  # (kind, key, "{key.attr!r:spec}") — rendered with str.format_map
+_TOSHAMSHI = 3  # (kind, key, include_time, persian_digits)
+
+
+class BraceTemplatePlan(NamedTuple):
+	"""Immutable render plan for one brace template."""
+
+	segments: tuple[tuple, ...]
+	fields: frozenset[str]  # context keys the template reads
+	error: str | None = None  # set when the template cannot be formatted
+
+
+class _ContextView(Mapping):
+	"""``format_map`` view of a context: None -> "", missing keys stay as ``{key}``."""
+
+	__slots__ = ("_context",)
+
+	def __init__(self, context):
+		self._context = context
+
+	def __getitem__(self, key):
+		value = self._context.get(key, _MISSING)
+		if value is _MISSING:
+			return "{" + key + "}"
+		return _stringify_context_value(value)
+
+	def __iter__(self):
+		return iter(self._context)
+
+	def __len__(self):
+		return len(self._context)
+
+
+def _compile_format_chunk(chunk: str, segments: list, fields: set) -> None:
+	for literal, field_name, format_spec, conversion in _FORMATTER.parse(chunk):
+		if literal:
+			segments.append((_LITERAL, literal))
+		if field_name is None:
+			continue
+		if _PLAIN_FIELD_RE.match(field_name) and not format_spec and not conversion:
+			segments.append((_FIELD, field_name))
+			fields.add(field_name)
+			continue
+		body = (
+			field_name + (f"!{conversion}" if conversion else "") + (f":{format_spec}" if format_spec else "")
+		)
+		key = _FIELD_KEY_RE.split(field_name, 1)[0]
+		segments.append((_FORMATTED, key, "{" + body + "}"))
+		fields.add(key)
+
+
+# Plans compiled by other workers (seeded from a shared store) and callbacks told about
+# plans compiled here; both are wired by ``jalali_support.template_cache``.
+_preloaded_plans: dict[str, BraceTemplatePlan] = {}
+_compile_listeners: list = []
+
+
+def preload_brace_plans(plans: Mapping[str, BraceTemplatePlan]) -> None:
+	"""Seed :func:`compile_brace_template` with ``{template: plan}`` compiled elsewhere."""
+	_preloaded_plans.update(plans)
+
+
+def add_compile_listener(listener) -> None:
+	"""Call ``listener(template, plan)`` whenever a template is compiled in this process."""
+	if listener not in _compile_listeners:
+		_compile_listeners.append(listener)
+
+
+@lru_cache(maxsize=512)
+def compile_brace_template(template: str) -> BraceTemplatePlan:
+	"""Parse *template* once into literal / field / toshamshi segments (LRU-cached)."""
+	plan = _preloaded_plans.pop(template, None)
+	if plan is not None:
+		return plan
+	plan = _compile_brace_template(template)
+	for listener in _compile_listeners:
+		try:
+			listener(template, plan)
+		except Exception:
+			pass
+	return plan
+
+
+def _compile_brace_template(template: str) -> BraceTemplatePlan:
+	segments: list[tuple] = []
+	fields: set[str] = set()
+	try:
+		pos = 0
+		for match in _TOSHAMSHI_PLACEHOLDER_RE.finditer(template):
+			_compile_format_chunk(template[pos : match.start()], segments, fields)
+			include_time, persian_digits = _parse_toshamshi_kwargs(match.group(2))
+			segments.append((_TOSHAMSHI, match.group(1), include_time, persian_digits))
+			fields.add(match.group(1))
+			pos = match.end()
+		_compile_format_chunk(template[pos:], segments, fields)
+	except ValueError as e:
+		return BraceTemplatePlan((), frozenset(), str(e))
+	return BraceTemplatePlan(tuple(segments), frozenset(fields))
+
+
+def _toshamshi_key(value: Any, include_time: bool, persian_digits: bool) -> tuple | None:
+	key = (type(value), value, include_time, persian_digits)
+	try:
+		hash(key)
+	except TypeError:
+		return None
+	return key
+
+
+def render_plan(plan: BraceTemplatePlan, context, converted: dict | None = None) -> str:
+	"""Render a compiled plan; *context* is any mapping with ``get`` (only referenced keys are read).
+
+	*converted* optionally maps ``_toshamshi_key(...)`` to pre-computed ``{toshamshi(...)}`` output.
+	"""
+	if plan.error:
+		raise ValueError(plan.error)
+	out = []
+	for segment in plan.segments:
+		kind = segment[0]
+		if kind == _LITERAL:
+			out.append(segment[1])
+		elif kind == _FIELD:
+			value = context.get(segment[1], _MISSING)
+			if value is _MISSING:
+				out.append("{" + segment[1] + "}")
+			else:
+				out.append(format(_stringify_context_value(value), ""))
+		elif kind == _TOSHAMSHI:
+			value = context.get(segment[1])
+			key = _toshamshi_key(value, segment[2], segment[3]) if converted else None
+			if key is not None and key in converted:
+				out.append(converted[key])
+			else:
+				out.append(toshamshi(value, include_time=segment[2], persian_digits=segment[3]))
+		else:
+			out.append(segment[2].format_map(_ContextView(context)))
+	return "".join(out)
+
+
 def render_brace_template(
 	template: str | None,
 	context: dict[str, Any] | None,
@@ -55,25 +205,118 @@ def render_brace_template(
 ) -> str:
 	"""Render `{field}` and `{toshamshi(field)}` templates (not full Jinja).
 
-	1. Expand `{toshamshi(...)}` using :func:`toshamshi`.
-	2. Apply Python ``str.format_map`` for remaining ``{placeholders}``.
+	The template is compiled once (see :func:`compile_brace_template`); ``{toshamshi(...)}``
+	uses :func:`toshamshi` and the remaining ``{placeholders}`` follow ``str.format_map``
+	semantics, with missing keys left as ``{key}``.
 	"""
 	tpl = (template or "").strip()
 	if not tpl:
 		return ""
 
-	ctx = context or {}
-	safe_ctx = _SafeFormatDict({k: _stringify_context_value(v) for k, v in ctx.items()})
-
 	try:
-		expanded = expand_toshamshi_placeholders(tpl, ctx)
-		return expanded.format_map(safe_ctx)
+		return render_plan(compile_brace_template(tpl), context or {})
 	except Exception:
 		if fallback_on_error:
 			return tpl
 		raise
 
 
+def render_brace_template_many(
+	template: str | None,
+	contexts,
+	*,
+	fallback_on_error: bool = True,
+) -> list[str]:
+	""":func:`render_brace_template` for many contexts (e.g. one per journal entry line).
+
+	The template is compiled once and every distinct ``{toshamshi(...)}`` value across all
+	*contexts* is converted once; returns one string per context, in order.
+	"""
+	contexts = [context or {} for context in contexts]
+	tpl = (template or "").strip()
+	if not tpl:
+		return [""] * len(contexts)
+
+	plan = compile_brace_template(tpl)
+	if plan.error:
+		if fallback_on_error:
+			return [tpl] * len(contexts)
+		raise ValueError(plan.error)
+
+	converted: dict[tuple, str] = {}
+	toshamshi_segments = [segment for segment in plan.segments if segment[0] == _TOSHAMSHI]
+	for context in contexts:
+		for _kind, fieldname, include_time, persian_digits in toshamshi_segments:
+			value = context.get(fieldname)
+			key = _toshamshi_key(value, include_time, persian_digits)
+			if key is None or key in converted:
+				continue
+			try:
+				converted[key] = toshamshi(value, include_time=include_time, persian_digits=persian_digits)
+			except Exception:
+				if not fallback_on_error:
+					raise
+
+	out = []
+	for context in contexts:
+		try:
+			out.append(render_plan(plan, context, converted))
+		except Exception:
+			if not fallback_on_error:
+				raise
+			out.append(tpl)
+	return out
+
+
+class DocumentFormatContext(Mapping):
+	"""Read-only brace-template view of a Document (or dict): None -> "", nothing copied.
+
+	Keys are the ones ``doc.as_dict()`` would produce; values are read from the document
+	only when a template looks them up, so the cost follows the placeholders, not the
+	document size (child rows are never serialised).
+	"""
+
+	__slots__ = ("_doc",)
+
+	def __init__(self, doc: Any):
+		self._doc = doc
+
+	def _keys(self) -> frozenset[str] | Any:
+		doc = self._doc
+		meta = getattr(doc, "meta", None)
+		if meta is None:
+			return doc
+		keys = getattr(meta, "_jalali_format_keys", None)
+		if keys is None:
+			# valid columns already include the standard (and child-table) fields
+			keys = frozenset(
+				("doctype", *meta.get_valid_columns(), *(df.fieldname for df in meta.get_table_fields()))
+			)
+			meta._jalali_format_keys = keys
+		return keys
+
+	def __getitem__(self, key: str) -> Any:
+		if key not in self._keys():
+			raise KeyError(key)
+		return _stringify_context_value(self._doc.get(key))
+
+	def __contains__(self, key: object) -> bool:
+		return key in self._keys()
+
+	def __iter__(self):
+		return iter(self._keys())
+
+	def __len__(self) -> int:
+		return len(self._keys())
+
+
+def doc_format_context(doc: Any) -> Mapping[str, Any]:
+	"""Lazy brace-template context for a Document or dict (see :class:`DocumentFormatContext`)."""
+	if doc is None:
+		return {}
+	return DocumentFormatContext(doc)
+
+
 def doc_as_format_context(doc: Any) -> dict[str, Any]:
 	"""Build a flat dict from a Document for brace templates."""
 	if doc is None:
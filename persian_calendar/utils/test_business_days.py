@@ -0,0 +1,33 @@
+import unittest
+from datetime import date
+
+from persian_calendar.utils.business_days import build_business_day_index
+
+# 1404-01-01 .. 1404-01-31 (2025-03-21 .. 2025-04-20); Nowruz 1-4 Farvardin, weekly off Friday
+_INDEX = build_business_day_index(
+	date(2025, 3, 21),
+	date(2025, 4, 20),
+	[date(2025, 3, 21), date(2025, 3, 22), date(2025, 3, 23), date(2025, 3, 24)],
+	(5,),
+)
+
+
+class TestBusinessDayIndex(unittest.TestCase):
+	def test_add_skips_holidays_and_weekly_offs(self):
+		# Thu 2025-03-20 is outside; start on Nowruz (Fri 21st) -> first working day is Tue 25th
+		self.assertEqual(_INDEX.add(date(2025, 3, 21), 1), date(2025, 3, 25))
+		# Thu 27th + 1 skips Fri 28th
+		self.assertEqual(_INDEX.add(date(2025, 3, 27), 1), date(2025, 3, 29))
+		self.assertEqual(_INDEX.add(date(2025, 3, 29), -1), date(2025, 3, 27))
+		self.assertIsNone(_INDEX.add(date(2025, 4, 19), 5))
+
+	def test_count_is_inclusive(self):
+		self.assertEqual(_INDEX.count(date(2025, 3, 21), date(2025, 3, 24)), 0)
+		self.assertEqual(_INDEX.count(date(2025, 3, 25), date(2025, 3, 29)), 4)
+		self.assertEqual(_INDEX.count(date(2025, 3, 29), date(2025, 3, 25)), 0)
+		self.assertFalse(_INDEX.is_business_day(date(2025, 3, 28)))
+		self.assertTrue(_INDEX.is_business_day(date(2025, 3, 29)))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 from datetime import date, datetime
 
-from persian_calendar.utils.data_io import convert_export_value, convert_import_value
+from persian_calendar.utils.data_io import (
+	convert_export_column,
+	convert_export_value,
+	convert_import_value,
+)
 from persian_calendar.utils.jalali import (
 	gregorian_to_jalali_for_export,
 	is_likely_gregorian_date,
@@ -13,6 +17,13 @@ from persian_calendar.utils.jalali import (
 
 
 class TestDataExportConversion(unittest.TestCase):
+	def test_column_batch_converts_repeated_values_once(self):
+		column = ["2026-04-10", "", "2026-04-10", None, date(2026, 5, 13)]
+		self.assertEqual(
+			convert_export_column(column, "Date"),
+			["1405-01-21", "", "1405-01-21", None, "1405-02-23"],
+		)
+
 	def test_date_gregorian_to_jalali(self):
 		self.assertEqual(
 			convert_export_value("2026-05-13", "Date", True),
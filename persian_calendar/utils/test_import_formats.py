@@ -0,0 +1,82 @@
+import unittest
+from datetime import date, datetime
+
+from persian_calendar.utils.import_formats import (
+	EU,
+	GREGORIAN_ISO,
+	JALALI_ISO,
+	JALALI_SLASH,
+	US,
+	ColumnDateParser,
+	detect_column_format,
+)
+
+
+class TestDetectColumnFormat(unittest.TestCase):
+	def test_jalali_layouts(self):
+		self.assertEqual(detect_column_format(["1403-07-10", "", "1403-7-1"])[0], JALALI_ISO)
+		fmt, _, persian = detect_column_format(["۱۴۰۳/۰۷/۱۰", "1403/12/30"])  # noqa: RUF001
+		self.assertEqual((fmt, persian), (JALALI_SLASH, True))
+
+	def test_day_month_order_from_unambiguous_cells(self):
+		self.assertEqual(detect_column_format(["01/02/2024", "13/02/2024"])[0], EU)
+		self.assertEqual(detect_column_format(["01/02/2024", "02/13/2024"])[0], US)
+		self.assertIsNone(detect_column_format(["01/02/2024", "03/04/2024"])[0])
+
+	def test_mixed_column(self):
+		parser = ColumnDateParser.from_values(["1403-07-10", "2024-10-01"], "Date")
+		self.assertIsNone(parser.format)
+		self.assertTrue(parser.is_mixed)
+
+
+class TestColumnDateParser(unittest.TestCase):
+	def test_jalali_date_and_datetime(self):
+		self.assertEqual(ColumnDateParser("Date", JALALI_ISO).parse("1403-07-10"), date(2024, 10, 1))
+		self.assertEqual(
+			ColumnDateParser("Datetime", JALALI_SLASH).parse("۱۴۰۳/۰۷/۱۰ ۰۸:۳۰"),  # noqa: RUF001
+			datetime(2024, 10, 1, 8, 30),
+		)
+
+	def test_memoized_and_fallback(self):
+		calls = []
+
+		def fallback(value):
+			calls.append(value)
+			return date(2024, 1, 1)
+
+		parser = ColumnDateParser("Date", JALALI_ISO, fallback)
+		self.assertIs(parser.parse("1403-07-10"), parser.parse("1403-07-10"))
+		self.assertEqual(parser.parse("junk"), date(2024, 1, 1))
+		parser.parse("junk")
+		self.assertEqual(calls, ["junk"])
+		self.assertIsNone(ColumnDateParser("Date", JALALI_ISO).parse("1403-13-01"))
+
+	def test_prime_memoizes_only_compiled_matches(self):
+		parser = ColumnDateParser("Date", JALALI_ISO, lambda value: None)
+		parser.prime(["1403-07-10", "1403-07-10", "junk"])
+		self.assertEqual(parser._memo, {"1403-07-10": date(2024, 10, 1)})
+
+	def test_year_outside_column_calendar_is_detected_per_cell(self):
+		values = ["1403-07-10"] * 300 + ["2024-10-01"]
+		parser = ColumnDateParser.from_values(values, "Date")
+		self.assertEqual(parser.format, JALALI_ISO)
+		self.assertFalse(parser.is_mixed)
+		self.assertEqual([parser.parse(v) for v in values[-2:]], [date(2024, 10, 1), date(2024, 10, 1)])
+		self.assertTrue(parser.is_mixed)
+		self.assertEqual(parser.formats_seen, {JALALI_ISO, GREGORIAN_ISO})
+
+		gregorian = ColumnDateParser("Date", GREGORIAN_ISO)
+		self.assertEqual(gregorian.parse("1403-07-10"), date(2024, 10, 1))
+		self.assertIn(JALALI_ISO, gregorian.formats_seen)
+		self.assertIsNone(ColumnDateParser("Date", US).parse("10/07/1403"))
+
+	def test_prime_leaves_other_calendar_cells_to_parse(self):
+		parser = ColumnDateParser("Date", GREGORIAN_ISO)
+		parser.prime(["2024-10-01", "1403-07-10"])
+		self.assertEqual(list(parser._memo), ["2024-10-01"])
+		self.assertEqual(parser.parse("1403-07-10"), date(2024, 10, 1))
+		self.assertTrue(parser.is_mixed)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,7 +1,13 @@
 import unittest
 from datetime import date, datetime
 
-from persian_calendar.utils.jalali import to_persian_digits, toshamshi
+from persian_calendar.utils.jalali import (
+	jalali_to_gregorian_datetime,
+	normalize_input_text,
+	to_persian_digits,
+	toshamshi,
+)
+from persian_calendar.utils.jalali_filters import persian_digits, shamsi, shamsi_datetime
 
 
 class TestToshamshi(unittest.TestCase):
@@ -48,6 +54,21 @@ class TestToshamshi(unittest.TestCase):
 			"1404-12-27 13:36:04",
 		)
 
+	def test_custom_format(self):
+		self.assertEqual(toshamshi("2026-05-13", format="DD/MM/YYYY"), "23/02/1405")
+		self.assertEqual(toshamshi("2026-05-13", format="{YYYY}"), "{1405}")
+		self.assertEqual(
+			toshamshi("2026-03-18 13:36:04", include_time=True, format="YYYY/MM/DD HH:mm"),
+			"1404/12/27 13:36",
+		)
+
+
+class TestJalaliFilters(unittest.TestCase):
+	def test_filters(self):
+		self.assertEqual(shamsi("2026-05-13"), "1405-02-23")
+		self.assertEqual(shamsi_datetime("2026-03-18 13:36:04"), "1404-12-27 13:36:04")
+		self.assertEqual(persian_digits("1405"), "۱۴۰۵")
+
 
 class TestToPersianDigits(unittest.TestCase):
 	def test_digits(self):
@@ -57,5 +78,20 @@ class TestToPersianDigits(unittest.TestCase):
 		self.assertEqual(to_persian_digits(None), "")
 
 
+class TestNormalizeInputText(unittest.TestCase):
+	def test_persian_and_arabic_indic_digits(self):
+		self.assertEqual(normalize_input_text("۱۴۰۳/۰۷/۱۵"), "1403/07/15")  # noqa: RUF001
+		self.assertEqual(normalize_input_text("١٤٠٣-٠٧-١٥"), "1403-07-15")  # noqa: RUF001
+
+	def test_marks_and_separators(self):
+		self.assertEqual(normalize_input_text("\u200f۱۴۰۳\u060d۰۷\u060d۱۵\u200c"), "1403/07/15")  # noqa: RUF001
+		self.assertEqual(normalize_input_text("۱۲٬۵۰۰٫۷۵"), "12,500.75")  # noqa: RUF001
+
+	def test_parse_paths_accept_persian_input(self):
+		self.assertEqual(jalali_to_gregorian_datetime("۱۴۰۳/۰۷/۱۰"), "2024-10-01")  # noqa: RUF001
+		self.assertEqual(jalali_to_gregorian_datetime("١٤٠٣-٠٧-١٠ ٠٨:٣٠"), "2024-10-01 08:30:00")  # noqa: RUF001
+		self.assertEqual(toshamshi("2024/10/01"), "1403-07-10")
+
+
 if __name__ == "__main__":
 	unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from datetime import date, datetime
+
+try:
+	import pyarrow as pa
+except ImportError:  # pragma: no cover
+	pa = None
+
+from persian_calendar.utils.jalali_arrow import jalali_part_arrays
+
+
+@unittest.skipUnless(pa, "pyarrow not installed")
+class TestJalaliPartArrays(unittest.TestCase):
+	def test_date32(self):
+		parts = jalali_part_arrays(pa.array([date(2024, 10, 1), None, date(2025, 3, 20)], type=pa.date32()))
+		self.assertEqual(parts["jy"].to_pylist(), [1403, None, 1403])
+		self.assertEqual(parts["jm"].to_pylist(), [7, None, 12])
+		self.assertEqual(parts["jd"].to_pylist(), [10, None, 30])
+		self.assertEqual(parts["jalali_period"].to_pylist(), [140307, None, 140312])
+
+	def test_timestamp_and_out_of_range(self):
+		parts = jalali_part_arrays(
+			pa.array([datetime(2024, 3, 20, 23, 59), datetime(1850, 1, 1)], type=pa.timestamp("us"))
+		)
+		self.assertEqual(parts["jy"].to_pylist(), [1403, None])
+		self.assertEqual(parts["jd"].type, pa.int8())
+
+
+if __name__ == "__main__":
+	unittest.main()
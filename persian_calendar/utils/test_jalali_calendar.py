@@ -0,0 +1,103 @@
+import unittest
+from datetime import date
+
+from persian_calendar.utils.jalali_calendar import (
+	build_jalali_periods,
+	iter_calendar_days,
+	jalali_month_bounds,
+	jalali_period_key,
+	jalali_period_range,
+)
+
+
+class TestJalaliMonthTable(unittest.TestCase):
+	def test_farvardin_1403(self):
+		self.assertEqual(jalali_month_bounds(1403, 1), (date(2024, 3, 20), date(2024, 4, 19)))
+
+	def test_esfand_leap_year(self):
+		self.assertEqual(jalali_month_bounds(1403, 12), (date(2025, 2, 19), date(2025, 3, 20)))
+
+
+class TestBuildJalaliPeriods(unittest.TestCase):
+	FY_START = date(2024, 3, 20)  # 1403-01-01
+	FY_END = date(2025, 3, 20)  # 1403-12-30
+
+	def test_monthly(self):
+		periods = build_jalali_periods(self.FY_START, self.FY_END, "Monthly")
+		self.assertEqual(len(periods), 12)
+		self.assertEqual(periods[6]["from_ym"], (1403, 7))
+		self.assertEqual(periods[6]["from_date"], date(2024, 9, 22))
+		self.assertEqual(periods[-1]["to_date"], self.FY_END)
+
+	def test_quarterly(self):
+		periods = build_jalali_periods(self.FY_START, self.FY_END, "Quarterly")
+		self.assertEqual([p["to_ym"] for p in periods], [(1403, 3), (1403, 6), (1403, 9), (1403, 12)])
+		self.assertEqual(periods[1]["from_date"], date(2024, 6, 21))
+
+	def test_yearly_and_half_yearly(self):
+		self.assertEqual(len(build_jalali_periods(self.FY_START, self.FY_END, "Yearly")), 1)
+		halves = build_jalali_periods(self.FY_START, self.FY_END, "Half-Yearly")
+		self.assertEqual(halves[0]["to_date"], date(2024, 9, 21))
+
+	def test_partial_range_is_clipped(self):
+		periods = build_jalali_periods(date(2024, 10, 1), date(2024, 11, 30), "Monthly")
+		self.assertEqual(periods[0]["from_date"], date(2024, 10, 1))
+		self.assertEqual(periods[-1]["to_date"], date(2024, 11, 30))
+		self.assertEqual(len(periods), 3)
+
+	def test_period_key(self):
+		self.assertEqual(jalali_period_key((1403, 7)), "mehr_1403")
+
+
+class TestIterCalendarDays(unittest.TestCase):
+	def test_leap_year_row_count(self):
+		rows = list(iter_calendar_days(1403, 1403))
+		self.assertEqual(len(rows), 366)
+		self.assertEqual(rows[0]["gregorian_date"], date(2024, 3, 20))
+		self.assertEqual(rows[-1]["jalali_date"], "1403-12-30")
+
+	def test_week_and_fiscal_columns(self):
+		rows = list(iter_calendar_days(1403, 1403, week_start=6, week_end=5, fiscal_year_start_month=4))
+		first = rows[0]  # Wednesday 1403-01-01
+		self.assertEqual((first["weekday"], first["jalali_week"], first["quarter"]), (3, 1, 1))
+		self.assertEqual((first["fiscal_year"], first["fiscal_period"]), (1402, 10))
+		saturday = rows[3]
+		self.assertEqual(saturday["jalali_week"], 2)
+		self.assertEqual(rows[2]["is_holiday"], 1)  # Friday
+
+
+class TestJalaliPeriodRange(unittest.TestCase):
+	TODAY = date(2024, 10, 1)  # 1403-07-10, Tuesday
+
+	def test_year_month_quarter(self):
+		self.assertEqual(jalali_period_range("1403"), (date(2024, 3, 20), date(2025, 3, 20)))
+		self.assertEqual(jalali_period_range("Mehr 1403"), (date(2024, 9, 22), date(2024, 10, 21)))
+		self.assertEqual(jalali_period_range("مهر 1403"), jalali_period_range("1403/07"))
+		self.assertEqual(jalali_period_range("Q3 1403"), (date(2024, 9, 22), date(2024, 12, 20)))
+
+	def test_week_honours_week_start(self):
+		self.assertEqual(jalali_period_range("1403-W2", week_start=6), (date(2024, 3, 23), date(2024, 3, 29)))
+		self.assertEqual(jalali_period_range("1403-W2", week_start=1), (date(2024, 3, 25), date(2024, 3, 31)))
+
+	def test_relative(self):
+		self.assertEqual(
+			jalali_period_range("this jalali month", today=self.TODAY),
+			(date(2024, 9, 22), date(2024, 10, 21)),
+		)
+		self.assertEqual(
+			jalali_period_range("last jalali quarter", today=self.TODAY),
+			(date(2024, 6, 21), date(2024, 9, 21)),
+		)
+		self.assertEqual(
+			jalali_period_range("this jalali week", today=self.TODAY), (date(2024, 9, 28), date(2024, 10, 4))
+		)
+
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			jalali_period_range("1403-13")
+		with self.assertRaises(ValueError):
+			jalali_period_range("someday")
+
+
+if __name__ == "__main__":
+	unittest.main()
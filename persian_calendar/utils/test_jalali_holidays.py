@@ -0,0 +1,56 @@
+import unittest
+from datetime import date
+
+from persian_calendar.utils.jalali_calendar import js_weekday
+from persian_calendar.utils.jalali_holidays import (
+	build_lunar_holiday_table,
+	jalali_year_holidays,
+	lunar_holidays,
+	solar_holidays,
+)
+
+try:
+	import hijridate
+except ImportError:  # pragma: no cover
+	hijridate = None
+
+
+class TestJalaliHolidays(unittest.TestCase):
+	def test_solar_holidays(self):
+		holidays = dict(solar_holidays(1404))
+		self.assertEqual(holidays[date(2025, 3, 21)], "Nowruz")
+		self.assertEqual(holidays[date(2026, 2, 11)], "Victory of the Islamic Revolution")
+
+	def test_lunar_holidays_from_bundled_table(self):
+		# Iran's official 1404 calendar, a day after Umm al-Qura for these months
+		holidays = dict(lunar_holidays(1404))
+		self.assertEqual(holidays[date(2025, 3, 31)], "Eid al-Fitr")
+		self.assertEqual(holidays[date(2025, 7, 5)], "Tasua")
+		self.assertEqual(holidays[date(2025, 7, 6)], "Ashura")
+		self.assertEqual(lunar_holidays(1200), [])
+
+	def test_lunar_overrides_replace_bundled_dates(self):
+		holidays = lunar_holidays(1404, {"Ashura": "2025-07-07", "Tasua": ["2025-07-06"]})
+		self.assertIn((date(2025, 7, 7), "Ashura"), holidays)
+		self.assertIn((date(2025, 7, 6), "Tasua"), holidays)
+		self.assertNotIn((date(2025, 7, 5), "Tasua"), holidays)
+		self.assertEqual(holidays, sorted(holidays))
+
+	def test_one_row_per_date_with_weekly_offs(self):
+		rows = jalali_year_holidays(1404, (5,))
+		dates = [row[0] for row in rows]
+		self.assertEqual(dates, sorted(set(dates)))
+		by_date = {row[0]: row for row in rows}
+		self.assertEqual(by_date[date(2025, 3, 22)][1], "Nowruz / Martyrdom of Imam Ali")
+		fridays = [row for row in rows if row[2]]
+		self.assertTrue(fridays)
+		self.assertTrue(all(js_weekday(row[0]) == 5 for row in fridays))
+
+	@unittest.skipUnless(hijridate, "hijridate not installed")
+	def test_bundled_table_matches_generator(self):
+		generated = build_lunar_holiday_table(1404, 1404)["1404"]
+		self.assertEqual(lunar_holidays(1404), [(date.fromisoformat(d), desc) for d, desc in generated])
+
+
+if __name__ == "__main__":
+	unittest.main()
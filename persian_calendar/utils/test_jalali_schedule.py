@@ -0,0 +1,36 @@
+import unittest
+from datetime import datetime
+
+from persian_calendar.utils.jalali_schedule import next_run, parse_jalali_spec, runs_between
+
+
+class TestJalaliSchedule(unittest.TestCase):
+	def test_parse_spec(self):
+		self.assertEqual(parse_jalali_spec("month_end@23:00"), ("month_end", 23, 0))
+		self.assertEqual(parse_jalali_spec("year_end"), ("year_end", 0, 0))
+		with self.assertRaises(ValueError):
+			parse_jalali_spec("month_end@25:00")
+		with self.assertRaises(ValueError):
+			parse_jalali_spec("every friday")
+
+	def test_next_run(self):
+		# 1403 is a leap year: 30 Esfand 1403 = 2025-03-20
+		self.assertEqual(next_run("month_end@23:00", datetime(2025, 3, 1)), datetime(2025, 3, 20, 23, 0))
+		self.assertEqual(
+			next_run("month_end@23:00", datetime(2025, 3, 20, 23, 0)), datetime(2025, 4, 20, 23, 0)
+		)
+		# end of Khordad 1404
+		self.assertEqual(next_run("quarter_end", datetime(2025, 3, 21)), datetime(2025, 6, 21))
+		self.assertEqual(next_run("year_end", datetime(2025, 3, 21)), datetime(2026, 3, 20))
+
+	def test_runs_between_catches_up_missed_periods(self):
+		runs = runs_between("month_end@23:00", datetime(2025, 3, 20, 23, 0), datetime(2025, 6, 22))
+		self.assertEqual(
+			runs,
+			[datetime(2025, 4, 20, 23, 0), datetime(2025, 5, 21, 23, 0), datetime(2025, 6, 21, 23, 0)],
+		)
+		self.assertEqual(runs_between("year_end", datetime(2025, 6, 1), datetime(2025, 5, 1)), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from functools import partial
+
+from persian_calendar.utils.data_io import convert_export_column
+from persian_calendar.utils.parallel import shard_map
+
+
+def _double(values, offset=0):
+	return [v * 2 + offset for v in values]
+
+
+class TestShardMap(unittest.TestCase):
+	def test_in_process_below_threshold(self):
+		self.assertEqual(shard_map(_double, [1, 2, 3], workers=4, threshold=10), [2, 4, 6])
+
+	def test_sharded_results_keep_order(self):
+		values = list(range(1000))
+		self.assertEqual(
+			shard_map(partial(_double, offset=1), values, workers=2, threshold=10),
+			_double(values, offset=1),
+		)
+
+	def test_sharded_export_column_matches_in_process(self):
+		column = [f"2024-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)] * 2
+		mapper = partial(shard_map, workers=2, threshold=10)
+		self.assertEqual(
+			convert_export_column(column, "Date", mapper=mapper), convert_export_column(column, "Date")
+		)
+
+
+if __name__ == "__main__":
+	unittest.main()
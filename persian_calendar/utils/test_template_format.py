@@ -1,9 +1,17 @@
 import unittest
 from datetime import date
+from unittest.mock import patch
 
+from persian_calendar.utils.jalali import toshamshi
 from persian_calendar.utils.template_format import (
+	BraceTemplatePlan,
+	DocumentFormatContext,
+	add_compile_listener,
+	compile_brace_template,
 	expand_toshamshi_placeholders,
+	preload_brace_plans,
 	render_brace_template,
+	render_brace_template_many,
 )
 
 
@@ -41,5 +49,79 @@ class TestRenderBraceTemplate(unittest.TestCase):
 		)
 
 
+class TestCompileBraceTemplate(unittest.TestCase):
+	def test_plan_is_cached_and_lists_fields(self):
+		tpl = "{party} {toshamshi(posting_date, persian_digits=True)} {{literal}} {grand_total:,.2f}"
+		plan = compile_brace_template(tpl)
+		self.assertIs(plan, compile_brace_template(tpl))
+		self.assertEqual(plan.fields, {"party", "posting_date", "grand_total"})
+
+	def test_format_spec_and_escapes_match_format_map(self):
+		ctx = {"party": None, "grand_total": 1234.5, "posting_date": "2026-05-13"}
+		self.assertEqual(
+			render_brace_template("{party}|{grand_total:,.2f}|{{x}}|{toshamshi(posting_date)}", ctx),
+			"|1,234.50|{x}|1405-02-23",
+		)
+
+	def test_preloaded_plan_and_compile_listener(self):
+		seeded = BraceTemplatePlan(((0, "seeded"),), frozenset())
+		preload_brace_plans({"{preloaded_only}": seeded})
+		self.assertEqual(render_brace_template("{preloaded_only}", {}), "seeded")
+
+		compiled = []
+		with patch("persian_calendar.utils.template_format._compile_listeners", []):
+			add_compile_listener(lambda template, plan: compiled.append(template))
+			render_brace_template("{listener_probe}", {})
+		self.assertEqual(compiled, ["{listener_probe}"])
+
+	def test_invalid_template_falls_back(self):
+		self.assertEqual(render_brace_template("broken {", {}), "broken {")
+		with self.assertRaises(ValueError):
+			render_brace_template("broken {", {}, fallback_on_error=False)
+
+
+class TestRenderBraceTemplateMany(unittest.TestCase):
+	def test_matches_single_render_and_converts_each_date_once(self):
+		tpl = "{party} {toshamshi(cheque_due_date)}"
+		contexts = [
+			{"party": "A", "cheque_due_date": "2026-05-13"},
+			{"party": "B", "cheque_due_date": "2026-05-13"},
+			{"party": "C", "cheque_due_date": None},
+		]
+		with patch("persian_calendar.utils.template_format.toshamshi", wraps=toshamshi) as convert:
+			out = render_brace_template_many(tpl, contexts)
+		self.assertEqual(out, [render_brace_template(tpl, ctx) for ctx in contexts])
+		self.assertEqual(convert.call_count, 2)
+
+	def test_invalid_and_empty_templates(self):
+		self.assertEqual(render_brace_template_many("broken {", [{}, {}]), ["broken {", "broken {"])
+		self.assertEqual(render_brace_template_many("", [{}]), [""])
+
+
+class _FakeMeta:
+	def get_valid_columns(self):
+		return ["name", "customer", "posting_date"]
+
+	def get_table_fields(self):
+		return []
+
+
+class _FakeDoc(dict):
+	meta = _FakeMeta()
+
+	def get(self, key, default=None):
+		self.reads.append(key)
+		return super().get(key, default)
+
+
+class TestDocumentFormatContext(unittest.TestCase):
+	def test_reads_only_referenced_fields(self):
+		doc = _FakeDoc(name="SINV-1", customer=None, posting_date="2026-05-13", items=["x"] * 500)
+		doc.reads = []
+		out = render_brace_template("{name} {customer}|{toshamshi(posting_date)} {unknown}", DocumentFormatContext(doc))
+		self.assertEqual(out, "SINV-1 |1405-02-23 {unknown}")
+		self.assertEqual(sorted(doc.reads), ["customer", "name", "posting_date"])
+
+
 if __name__ == "__main__":
 	unittest.main()